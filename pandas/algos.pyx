@@ -56,7 +56,7 @@ cdef inline int int_max(int a, int b): return a if a >= b else b
 cdef inline int int_min(int a, int b): return a if a <= b else b
 
 
-cdef extern from "src/headers/math.h":
+cdef extern from "src/headers/math.h" nogil:
     double sqrt(double x)
     double fabs(double)
     int signbit(double)
@@ -994,25 +994,44 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na):
     -------
     y : ndarray
     '''
+    return ewma_online(input, com, adjust, ignore_na,
+                       np.array([NaN, 1.]))
 
-    cdef double cur, prev, neww, oldw, adj
+
+def ewma_online(ndarray[double_t] input, double_t com, int adjust,
+                int ignore_na, ndarray[double_t] state):
+    '''
+    Continue an exponentially-weighted moving average over input.
+
+    Parameters
+    ----------
+    input : ndarray (float64 type)
+    com : float64
+    adjust: int
+    ignore_na: int
+    state : ndarray (float64 type)
+        The weighted average and the weight of the observations seen so far,
+        [NaN, 1.] before any, updated in place
+
+    Returns
+    -------
+    y : ndarray
+    '''
+
+    cdef double cur, weighted_avg, old_wt, old_wt_factor, new_wt, alpha
     cdef Py_ssize_t i
     cdef Py_ssize_t N = len(input)
 
     cdef ndarray[double_t] output = np.empty(N, dtype=float)
 
-    if N == 0:
-        return output
-
     alpha = 1. / (1. + com)
     old_wt_factor = 1. - alpha
     new_wt = 1.0 if adjust else alpha
 
-    output[0] = input[0]
-    weighted_avg = output[0]
-    old_wt = 1.
+    weighted_avg = state[0]
+    old_wt = state[1]
 
-    for i from 1 <= i < N:
+    for i from 0 <= i < N:
         cur = input[i]
         if weighted_avg == weighted_avg:
             if cur == cur:
@@ -1029,6 +1048,9 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na):
 
         output[i] = weighted_avg
 
+    state[0] = weighted_avg
+    state[1] = old_wt
+
     return output
 
 #----------------------------------------------------------------------
@@ -1242,6 +1264,227 @@ def roll_var(ndarray[double_t] input, int win, int minp, int ddof=1):
     return output
 
 
+#----------------------------------------------------------------------
+# Online rolling moments
+#
+# These continue a rolling moment over input[start:], input[:start] holding
+# (up to) the last win observations already seen. state holds the running
+# quantities of the 1-d kernels above at the end of those observations and
+# is updated in place, so that the results are the same as those of a single
+# pass over the whole history.
+
+def _check_minp_online(win, minp):
+    if minp > win:
+        raise ValueError('min_periods (%d) must be <= window (%d)'
+                        % (minp, win))
+    elif minp < 0:
+        raise ValueError('min_periods must be >= 0')
+    return max(minp, 1)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_sum_online(ndarray[double_t] input, ndarray[double_t] ring,
+                    Py_ssize_t pos, int minp, ndarray[double_t] state):
+    """
+    ring : the last len(ring) observations, the i-th observation in slot
+    i % len(ring), updated in place
+    pos : the number of observations before input
+    state : the sum and the number of observations of the window
+    """
+    cdef:
+        double val, prev, sum_x, nobs
+        Py_ssize_t i, slot
+        Py_ssize_t N = len(input), win = len(ring)
+        ndarray[double_t] output = np.empty(N, dtype=float)
+
+    minp = _check_minp_online(win, minp)
+    slot = pos % win
+
+    sum_x = state[0]
+    nobs = state[1]
+
+    with nogil:
+        for i from 0 <= i < N:
+            val = input[i]
+
+            # Not NaN
+            if val == val:
+                nobs += 1
+                sum_x += val
+
+            if pos + i >= win:
+                prev = ring[slot]
+                if prev == prev:
+                    sum_x -= prev
+                    nobs -= 1
+
+            ring[slot] = input[i]
+            slot += 1
+            if slot == win:
+                slot = 0
+
+            if nobs >= minp:
+                output[i] = sum_x
+            else:
+                output[i] = NaN
+
+    state[0] = sum_x
+    state[1] = nobs
+
+    return output
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_mean_online(ndarray[double_t] input, ndarray[double_t] ring,
+                     Py_ssize_t pos, int minp, ndarray[double_t] state):
+    """
+    ring : the last len(ring) observations, the i-th observation in slot
+    i % len(ring), updated in place
+    pos : the number of observations before input
+    state : the sum, the number of observations and the number of negative
+    observations of the window
+    """
+    cdef:
+        double val, prev, result, sum_x, nobs, neg_ct
+        Py_ssize_t i, slot
+        Py_ssize_t N = len(input), win = len(ring)
+        ndarray[double_t] output = np.empty(N, dtype=float)
+
+    minp = _check_minp_online(win, minp)
+    slot = pos % win
+
+    sum_x = state[0]
+    nobs = state[1]
+    neg_ct = state[2]
+
+    with nogil:
+        for i from 0 <= i < N:
+            val = input[i]
+
+            # Not NaN
+            if val == val:
+                nobs += 1
+                sum_x += val
+                if signbit(val):
+                    neg_ct += 1
+
+            if pos + i >= win:
+                prev = ring[slot]
+                if prev == prev:
+                    sum_x -= prev
+                    nobs -= 1
+                    if signbit(prev):
+                        neg_ct -= 1
+
+            ring[slot] = input[i]
+            slot += 1
+            if slot == win:
+                slot = 0
+
+            if nobs >= minp:
+                result = sum_x / nobs
+                if neg_ct == 0 and result < 0:
+                    # all positive
+                    output[i] = 0
+                elif neg_ct == nobs and result > 0:
+                    # all negative
+                    output[i] = 0
+                else:
+                    output[i] = result
+            else:
+                output[i] = NaN
+
+    state[0] = sum_x
+    state[1] = nobs
+    state[2] = neg_ct
+
+    return output
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_var_online(ndarray[double_t] input, ndarray[double_t] ring,
+                    Py_ssize_t pos, int minp, ndarray[double_t] state,
+                    int ddof=1):
+    """
+    ring : the last len(ring) observations, the i-th observation in slot
+    i % len(ring), updated in place
+    pos : the number of observations before input
+    state : the mean, the sum of squared differences from the mean and the
+    number of observations of the window (Welford's method)
+    """
+    cdef:
+        double val, prev, mean_x, ssqdm_x, nobs, delta
+        Py_ssize_t i, slot
+        Py_ssize_t N = len(input), win = len(ring)
+        ndarray[double_t] output = np.empty(N, dtype=float)
+
+    minp = _check_minp_online(win, minp)
+    slot = pos % win
+
+    mean_x = state[0]
+    ssqdm_x = state[1]
+    nobs = state[2]
+
+    with nogil:
+        for i from 0 <= i < N:
+            val = input[i]
+            if pos + i >= win:
+                prev = ring[slot]
+            else:
+                prev = NaN
+
+            if val == val:
+                if prev == prev:
+                    # Adding one observation and removing another one
+                    delta = val - prev
+                    prev -= mean_x
+                    mean_x += delta / nobs
+                    val -= mean_x
+                    ssqdm_x += (val + prev) * delta
+                else:
+                    # Adding one observation and not removing any
+                    nobs += 1
+                    delta = (val - mean_x)
+                    mean_x += delta / nobs
+                    ssqdm_x += delta * (val - mean_x)
+            elif prev == prev:
+                # Adding no new observation, but removing one
+                nobs -= 1
+                if nobs:
+                    delta = (prev - mean_x)
+                    mean_x -= delta  / nobs
+                    ssqdm_x -= delta * (prev - mean_x)
+                else:
+                    mean_x = 0
+                    ssqdm_x = 0
+
+            ring[slot] = input[i]
+            slot += 1
+            if slot == win:
+                slot = 0
+
+            if nobs >= minp:
+                #pathological case
+                if nobs == 1:
+                    val = 0
+                else:
+                    val = ssqdm_x / (nobs - ddof)
+                    if val < 0:
+                        val = 0
+            else:
+                val = NaN
+
+            output[i] = val
+
+    state[0] = mean_x
+    state[1] = ssqdm_x
+    state[2] = nobs
+
+    return output
+
 #-------------------------------------------------------------------------------
 # Rolling skewness
 
@@ -1703,6 +1946,563 @@ cdef double_t _get_min(object skiplist, int nobs, int minp):
     else:
         return NaN
 
+#----------------------------------------------------------------------
+# Rolling moments of 2-d blocks
+#
+# These compute the moment of every column of an (N x K) float64 array,
+# along axis 0, in a single call, with the same arithmetic as their 1-d
+# counterparts above. The loops release the GIL, so slices of columns of a
+# block can be computed concurrently.
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_sum_2d(ndarray[double_t, ndim=2] input, int win, int minp):
+    cdef:
+        double val, prev, sum_x
+        Py_ssize_t nobs, i, j, N, K
+        ndarray[double_t, ndim=2] output
+
+    N, K = (<object> input).shape
+    output = np.empty((N, K), dtype=float, order='F')
+
+    minp = _check_minp(win, minp, N)
+
+    with nogil:
+        for j from 0 <= j < K:
+            sum_x = 0
+            nobs = 0
+            for i from 0 <= i < N:
+                val = input[i, j]
+
+                # Not NaN
+                if val == val:
+                    nobs += 1
+                    sum_x += val
+
+                if i > win - 1:
+                    prev = input[i - win, j]
+                    if prev == prev:
+                        sum_x -= prev
+                        nobs -= 1
+
+                if i >= minp - 1 and nobs >= minp:
+                    output[i, j] = sum_x
+                else:
+                    output[i, j] = NaN
+
+    return output
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_mean_2d(ndarray[double_t, ndim=2] input, int win, int minp):
+    cdef:
+        double val, prev, result, sum_x
+        Py_ssize_t nobs, neg_ct, i, j, N, K
+        ndarray[double_t, ndim=2] output
+
+    N, K = (<object> input).shape
+    output = np.empty((N, K), dtype=float, order='F')
+
+    minp = _check_minp(win, minp, N)
+
+    with nogil:
+        for j from 0 <= j < K:
+            sum_x = 0
+            nobs = 0
+            neg_ct = 0
+            for i from 0 <= i < N:
+                val = input[i, j]
+
+                # Not NaN
+                if val == val:
+                    nobs += 1
+                    sum_x += val
+                    if signbit(val):
+                        neg_ct += 1
+
+                if i > win - 1:
+                    prev = input[i - win, j]
+                    if prev == prev:
+                        sum_x -= prev
+                        nobs -= 1
+                        if signbit(prev):
+                            neg_ct -= 1
+
+                if i >= minp - 1 and nobs >= minp:
+                    result = sum_x / nobs
+                    if neg_ct == 0 and result < 0:
+                        # all positive
+                        output[i, j] = 0
+                    elif neg_ct == nobs and result > 0:
+                        # all negative
+                        output[i, j] = 0
+                    else:
+                        output[i, j] = result
+                else:
+                    output[i, j] = NaN
+
+    return output
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_var_2d(ndarray[double_t, ndim=2] input, int win, int minp,
+                int ddof=1):
+    """
+    Numerically stable implementation using Welford's method.
+    """
+    cdef:
+        double val, prev, mean_x, ssqdm_x, nobs, delta
+        Py_ssize_t i, j, N, K
+        ndarray[double_t, ndim=2] output
+
+    N, K = (<object> input).shape
+    output = np.empty((N, K), dtype=float, order='F')
+
+    minp = _check_minp(win, minp, N)
+
+    # Check for windows larger than array, addresses #7297
+    win = min(win, N)
+
+    with nogil:
+        for j from 0 <= j < K:
+            mean_x = 0
+            ssqdm_x = 0
+            nobs = 0
+            for i from 0 <= i < N:
+                val = input[i, j]
+
+                if i < win:
+                    # Over the first window, observations can only be added
+                    if val == val:
+                        nobs += 1
+                        delta = (val - mean_x)
+                        mean_x += delta / nobs
+                        ssqdm_x += delta * (val - mean_x)
+                else:
+                    prev = input[i - win, j]
+                    if val == val:
+                        if prev == prev:
+                            # Adding one observation and removing another one
+                            delta = val - prev
+                            prev -= mean_x
+                            mean_x += delta / nobs
+                            val -= mean_x
+                            ssqdm_x += (val + prev) * delta
+                        else:
+                            # Adding one observation and not removing any
+                            nobs += 1
+                            delta = (val - mean_x)
+                            mean_x += delta / nobs
+                            ssqdm_x += delta * (val - mean_x)
+                    elif prev == prev:
+                        # Adding no new observation, but removing one
+                        nobs -= 1
+                        if nobs:
+                            delta = (prev - mean_x)
+                            mean_x -= delta  / nobs
+                            ssqdm_x -= delta * (prev - mean_x)
+                        else:
+                            mean_x = 0
+                            ssqdm_x = 0
+
+                if nobs >= minp:
+                    #pathological case
+                    if nobs == 1:
+                        val = 0
+                    else:
+                        val = ssqdm_x / (nobs - ddof)
+                        if val < 0:
+                            val = 0
+                else:
+                    val = NaN
+
+                output[i, j] = val
+
+    return output
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_max_2d(ndarray[float64_t, ndim=2] a, int window, int minp):
+    "Moving max of 2d array of dtype=float64 along axis=0 ignoring NaNs."
+    cdef:
+        np.float64_t ai, aold
+        Py_ssize_t count, i0, j, n0, K
+        pairs* ring
+        pairs* minpair
+        pairs* end
+        pairs* last
+        ndarray[float64_t, ndim=2] y
+
+    n0, K = (<object> a).shape
+    y = np.empty((n0, K), dtype=np.float64, order='F')
+
+    if window < 1:
+        raise ValueError('Invalid window size %d'
+                         % (window))
+
+    if minp > window:
+        raise ValueError('Invalid min_periods size %d greater than window %d'
+                        % (minp, window))
+
+    minp = _check_minp(window, minp, n0)
+
+    if n0 == 0:
+        return y
+
+    ring = <pairs*>stdlib.malloc(window * sizeof(pairs))
+    end = ring + window
+
+    with nogil:
+        for j from 0 <= j < K:
+            last = ring
+            minpair = ring
+            ai = a[0, j]
+            if ai == ai:
+                minpair.value = ai
+            else:
+                minpair.value = MINfloat64
+            minpair.death = window
+
+            count = 0
+            for i0 from 0 <= i0 < n0:
+                ai = a[i0, j]
+                if ai == ai:
+                    count += 1
+                else:
+                    ai = MINfloat64
+                if i0 >= window:
+                    aold = a[i0 - window, j]
+                    if aold == aold:
+                        count -= 1
+                if minpair.death == i0:
+                    minpair += 1
+                    if minpair >= end:
+                        minpair = ring
+                if ai >= minpair.value:
+                    minpair.value = ai
+                    minpair.death = i0 + window
+                    last = minpair
+                else:
+                    while last.value <= ai:
+                        if last == ring:
+                            last = end
+                        last -= 1
+                    last += 1
+                    if last == end:
+                        last = ring
+                    last.value = ai
+                    last.death = i0 + window
+                if i0 >= minp - 1 and count >= minp:
+                    y[i0, j] = minpair.value
+                else:
+                    y[i0, j] = NaN
+
+    stdlib.free(ring)
+    return y
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_min_2d(ndarray[float64_t, ndim=2] a, int window, int minp):
+    "Moving min of 2d array of dtype=float64 along axis=0 ignoring NaNs."
+    cdef:
+        np.float64_t ai, aold
+        Py_ssize_t count, i0, j, n0, K
+        pairs* ring
+        pairs* minpair
+        pairs* end
+        pairs* last
+        ndarray[float64_t, ndim=2] y
+
+    n0, K = (<object> a).shape
+    y = np.empty((n0, K), dtype=np.float64, order='F')
+
+    if window < 1:
+        raise ValueError('Invalid window size %d'
+                         % (window))
+
+    if minp > window:
+        raise ValueError('Invalid min_periods size %d greater than window %d'
+                        % (minp, window))
+
+    minp = _check_minp(window, minp, n0)
+
+    if n0 == 0:
+        return y
+
+    ring = <pairs*>stdlib.malloc(window * sizeof(pairs))
+    end = ring + window
+
+    with nogil:
+        for j from 0 <= j < K:
+            last = ring
+            minpair = ring
+            ai = a[0, j]
+            if ai == ai:
+                minpair.value = ai
+            else:
+                minpair.value = MAXfloat64
+            minpair.death = window
+
+            count = 0
+            for i0 from 0 <= i0 < n0:
+                ai = a[i0, j]
+                if ai == ai:
+                    count += 1
+                else:
+                    ai = MAXfloat64
+                if i0 >= window:
+                    aold = a[i0 - window, j]
+                    if aold == aold:
+                        count -= 1
+                if minpair.death == i0:
+                    minpair += 1
+                    if minpair >= end:
+                        minpair = ring
+                if ai <= minpair.value:
+                    minpair.value = ai
+                    minpair.death = i0 + window
+                    last = minpair
+                else:
+                    while last.value >= ai:
+                        if last == ring:
+                            last = end
+                        last -= 1
+                    last += 1
+                    if last == end:
+                        last = ring
+                    last.value = ai
+                    last.death = i0 + window
+                if i0 >= minp - 1 and count >= minp:
+                    y[i0, j] = minpair.value
+                else:
+                    y[i0, j] = NaN
+
+    stdlib.free(ring)
+    return y
+
+#----------------------------------------------------------------------
+# Rolling moments over variable width windows
+#
+# The window of observation i spans the observations whose timestamp (in
+# the int64 index, which must be monotonic increasing) lies in
+# (index[i] - win, index[i]], so its width varies with the density of the
+# data. A second pointer trails i and drops the observations leaving the
+# window, which keeps the kernels O(n).
+
+def _check_minp_variable(win, minp):
+    if win <= 0:
+        raise ValueError('window must be > 0')
+    if minp < 0:
+        raise ValueError('min_periods must be >= 0')
+    return max(minp, 1)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_sum_variable(ndarray[double_t] input, ndarray[int64_t] index,
+                      int64_t win, int minp):
+    cdef:
+        double val, prev, sum_x = 0
+        Py_ssize_t nobs = 0, i, s = 0
+        Py_ssize_t N = len(input)
+        ndarray[double_t] output = np.empty(N, dtype=float)
+
+    minp = _check_minp_variable(win, minp)
+
+    with nogil:
+        for i from 0 <= i < N:
+            # drop the observations leaving the window
+            while index[s] <= index[i] - win:
+                prev = input[s]
+                if prev == prev:
+                    sum_x -= prev
+                    nobs -= 1
+                s += 1
+
+            val = input[i]
+
+            # Not NaN
+            if val == val:
+                nobs += 1
+                sum_x += val
+
+            if nobs >= minp:
+                output[i] = sum_x
+            else:
+                output[i] = NaN
+
+    return output
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_mean_variable(ndarray[double_t] input, ndarray[int64_t] index,
+                       int64_t win, int minp):
+    cdef:
+        double val, prev, result, sum_x = 0
+        Py_ssize_t nobs = 0, neg_ct = 0, i, s = 0
+        Py_ssize_t N = len(input)
+        ndarray[double_t] output = np.empty(N, dtype=float)
+
+    minp = _check_minp_variable(win, minp)
+
+    with nogil:
+        for i from 0 <= i < N:
+            # drop the observations leaving the window
+            while index[s] <= index[i] - win:
+                prev = input[s]
+                if prev == prev:
+                    sum_x -= prev
+                    nobs -= 1
+                    if signbit(prev):
+                        neg_ct -= 1
+                s += 1
+
+            val = input[i]
+
+            # Not NaN
+            if val == val:
+                nobs += 1
+                sum_x += val
+                if signbit(val):
+                    neg_ct += 1
+
+            if nobs >= minp:
+                result = sum_x / nobs
+                if neg_ct == 0 and result < 0:
+                    # all positive
+                    output[i] = 0
+                elif neg_ct == nobs and result > 0:
+                    # all negative
+                    output[i] = 0
+                else:
+                    output[i] = result
+            else:
+                output[i] = NaN
+
+    return output
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_var_variable(ndarray[double_t] input, ndarray[int64_t] index,
+                      int64_t win, int minp, int ddof=1):
+    """
+    Numerically stable implementation using Welford's method.
+    """
+    cdef:
+        double val, prev, delta, mean_x = 0, ssqdm_x = 0, nobs = 0
+        Py_ssize_t i, s = 0
+        Py_ssize_t N = len(input)
+        ndarray[double_t] output = np.empty(N, dtype=float)
+
+    minp = _check_minp_variable(win, minp)
+
+    with nogil:
+        for i from 0 <= i < N:
+            # drop the observations leaving the window
+            while index[s] <= index[i] - win:
+                prev = input[s]
+                if prev == prev:
+                    nobs -= 1
+                    if nobs:
+                        delta = (prev - mean_x)
+                        mean_x -= delta / nobs
+                        ssqdm_x -= delta * (prev - mean_x)
+                    else:
+                        mean_x = 0
+                        ssqdm_x = 0
+                s += 1
+
+            val = input[i]
+
+            # Not NaN
+            if val == val:
+                nobs += 1
+                delta = (val - mean_x)
+                mean_x += delta / nobs
+                ssqdm_x += delta * (val - mean_x)
+
+            if nobs >= minp:
+                #pathological case
+                if nobs == 1:
+                    val = 0
+                else:
+                    val = ssqdm_x / (nobs - ddof)
+                    if val < 0:
+                        val = 0
+            else:
+                val = NaN
+
+            output[i] = val
+
+    return output
+
+
+cdef _roll_max_min_variable(ndarray[double_t] input, ndarray[int64_t] index,
+                            int64_t win, int minp, bint is_max):
+    # monotonic deque of the positions of the candidates for the extremum of
+    # the window, from the oldest to the newest
+    cdef:
+        double val, prev
+        Py_ssize_t nobs = 0, i, s = 0, head = 0, tail = 0
+        Py_ssize_t N = len(input)
+        Py_ssize_t* deque
+        ndarray[double_t] output = np.empty(N, dtype=float)
+
+    minp = _check_minp_variable(win, minp)
+
+    deque = <Py_ssize_t*> stdlib.malloc((N + 1) * sizeof(Py_ssize_t))
+
+    with nogil:
+        for i from 0 <= i < N:
+            # drop the observations leaving the window
+            while index[s] <= index[i] - win:
+                prev = input[s]
+                if prev == prev:
+                    nobs -= 1
+                s += 1
+            while head < tail and deque[head] < s:
+                head += 1
+
+            val = input[i]
+
+            # Not NaN
+            if val == val:
+                nobs += 1
+                if is_max:
+                    while head < tail and input[deque[tail - 1]] <= val:
+                        tail -= 1
+                else:
+                    while head < tail and input[deque[tail - 1]] >= val:
+                        tail -= 1
+                deque[tail] = i
+                tail += 1
+
+            if nobs >= minp:
+                output[i] = input[deque[head]]
+            else:
+                output[i] = NaN
+
+    stdlib.free(deque)
+    return output
+
+
+def roll_max_variable(ndarray[double_t] input, ndarray[int64_t] index,
+                      int64_t win, int minp):
+    "Moving max over variable width windows ignoring NaNs."
+    return _roll_max_min_variable(input, index, win, minp, 1)
+
+
+def roll_min_variable(ndarray[double_t] input, ndarray[int64_t] index,
+                      int64_t win, int minp):
+    "Moving min over variable width windows ignoring NaNs."
+    return _roll_max_min_variable(input, index, win, minp, 0)
+
 def roll_quantile(ndarray[float64_t, cast=True] input, int win,
                   int minp, double quantile):
     '''
@@ -2004,6 +2804,90 @@ def groupsort_indexer(ndarray[int64_t] index, Py_ssize_t ngroups):
 
     return result, counts
 
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumcount(ndarray[int64_t] labels, Py_ssize_t ngroups,
+                   bint ascending=True):
+    '''
+    Number each row within its group, NA labels get 0
+    '''
+    cdef:
+        Py_ssize_t i, ii, lab, N = len(labels)
+        ndarray[int64_t] seen, out
+
+    seen = np.zeros(ngroups, dtype=np.int64)
+    out = np.zeros(N, dtype=np.int64)
+
+    for i in range(N):
+        if ascending:
+            ii = i
+        else:
+            ii = N - i - 1
+
+        lab = labels[ii]
+        if lab < 0:
+            continue
+
+        out[ii] = seen[lab]
+        seen[lab] += 1
+
+    return out
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_shift_indexer(ndarray[int64_t] out, ndarray[int64_t] labels,
+                        Py_ssize_t ngroups, int periods):
+    '''
+    Fill out with the position each row takes its shifted value from,
+    or -1 where the shift runs off the start (end) of the group
+    '''
+    cdef:
+        Py_ssize_t N, i, ii, lab, slot, offset, sign
+        ndarray[int64_t] seen
+        ndarray[int64_t, ndim=2] last
+
+    N = len(labels)
+
+    if periods == 0:
+        for i in range(N):
+            if labels[i] < 0:
+                out[i] = -1
+            else:
+                out[i] = i
+        return out
+
+    # walk backwards for negative periods
+    if periods > 0:
+        offset, sign = 0, 1
+    else:
+        offset, sign = N - 1, -1
+        periods = -periods
+
+    seen = np.zeros(ngroups, dtype=np.int64)
+
+    # ring buffer of the last `periods` positions seen in each group
+    last = np.zeros((ngroups, periods), dtype=np.int64)
+
+    for i in range(N):
+        ii = offset + sign * i
+        lab = labels[ii]
+        if lab < 0:
+            out[ii] = -1
+            continue
+
+        slot = seen[lab] % periods
+        if seen[lab] >= periods:
+            out[ii] = last[lab, slot]
+        else:
+            out[ii] = -1
+
+        last[lab, slot] = ii
+        seen[lab] += 1
+
+    return out
+
 # TODO: aggregate multiple columns in single pass
 #----------------------------------------------------------------------
 # first, nth, last
@@ -10,9 +10,12 @@ import datetime
 
 from functools import partial
 
+import numpy as np
+
 import pandas as pd
 from pandas import compat
-from pandas.compat import StringIO, lmap, zip, reduce, string_types
+from pandas.compat import (StringIO, lmap, zip, reduce, string_types,
+                           OrderedDict)
 from pandas.core.base import StringMixin
 from pandas.core import common as com
 from pandas.tools.util import compose
@@ -20,8 +23,8 @@ from pandas.computation.ops import (_cmp_ops_syms, _bool_ops_syms,
                                     _arith_ops_syms, _unary_ops_syms, is_term)
 from pandas.computation.ops import _reductions, _mathops, _LOCAL_TAG
 from pandas.computation.ops import Op, BinOp, UnaryOp, Term, Constant, Div
-from pandas.computation.ops import UndefinedVariableError
-from pandas.computation.scope import Scope, _ensure_scope
+from pandas.computation.ops import UndefinedVariableError, _cast_inplace
+from pandas.computation.scope import Scope, _ensure_scope, _DEFAULT_GLOBALS
 
 
 def tokenize_string(source):
@@ -195,6 +198,114 @@ _msg = 'cannot both support and not support {0}'.format(_unsupported_nodes &
 assert not _unsupported_nodes & _base_supported_nodes, _msg
 
 
+# the parsed syntax trees, and the terms of the expressions that only depend
+# on the types of the values they refer to, are kept in bounded (lru) caches
+_CACHE_SIZE = 512
+_ast_cache = OrderedDict()
+_terms_cache = OrderedDict()
+
+# the nodes that parse to terms without evaluating anything
+_cacheable_nodes = (_hacked_nodes | _expr_context_nodes | _boolop_nodes |
+                    _operator_nodes | _unary_op_nodes |
+                    (_cmp_op_nodes - frozenset(['In', 'NotIn'])) |
+                    frozenset(['Name', 'Num', 'NameConstant', 'BinOp',
+                               'BoolOp', 'UnaryOp', 'Compare']))
+
+
+def _cache_lookup(cache, key):
+    try:
+        value = cache.pop(key)
+    except KeyError:
+        return None
+    cache[key] = value
+    return value
+
+
+def _cache_store(cache, key, value):
+    cache[key] = value
+    while len(cache) > _CACHE_SIZE:
+        try:
+            cache.popitem(last=False)
+        except KeyError:
+            break
+
+
+def clear_cache():
+    """Clear the caches of parsed expressions"""
+    _ast_cache.clear()
+    _terms_cache.clear()
+
+
+def _parse_source(source, preparser):
+    """Return the (cached) syntax tree of source, preparsed by preparser"""
+    key = source, preparser
+    node = _cache_lookup(_ast_cache, key)
+    if node is None:
+        node = ast.fix_missing_locations(ast.parse(preparser(source)))
+        _cache_store(_ast_cache, key, node)
+    return node
+
+
+def _cacheable_names(node):
+    """Return the sorted names loaded in the syntax tree node if it only
+    holds nodes that parse without evaluating anything, otherwise None
+    """
+    names = set()
+    for n in ast.walk(node):
+        if type(n).__name__ not in _cacheable_nodes:
+            return None
+        if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load):
+            names.add(n.id)
+    return sorted(names)
+
+
+def _signature(value):
+    """The part of a value the parsed terms depend on"""
+    try:
+        return type(value), value.dtype, value.ndim
+    except AttributeError:
+        try:
+            return type(value), tuple(value.dtypes)
+        except AttributeError:
+            return type(value)
+
+
+def _shallow_copy(term):
+    """Copy a Term or Op without calling its constructor (Term.__new__
+    requires a name and an environment)
+    """
+    new = object.__new__(type(term))
+    new.__dict__.update(term.__dict__)
+    return new
+
+
+def _rebind(terms, env):
+    """Return a copy of terms with its variables resolved in env (or
+    cleared if env is None), replaying the conversions of the operators
+    """
+    new = _shallow_copy(terms)
+    if isinstance(terms, Term):
+        new.env = env
+        if not isinstance(terms, Constant):
+            if env is None:
+                new.value = None
+            else:
+                new._resolve_name()
+        return new
+
+    new.operands = tuple(_rebind(o, env) for o in terms.operands)
+    if isinstance(new, UnaryOp):
+        new.operand, = new.operands
+    elif isinstance(new, BinOp):
+        new.lhs, new.rhs = new.operands
+        if env is not None:
+            new.convert_values()
+            if isinstance(new, Div) and (env.scope['truediv'] or
+                                         compat.PY3):
+                _cast_inplace(com.flatten(new), np.float_)
+    return new
+
+
 def _node_not_implemented(node_name, cls):
     """Return a function that raises a NotImplementedError with a passed node
     name.
@@ -306,8 +417,7 @@ class BaseExprVisitor(ast.NodeVisitor):
 
     def visit(self, node, **kwargs):
         if isinstance(node, string_types):
-            clean = self.preparser(node)
-            node = ast.fix_missing_locations(ast.parse(clean))
+            node = _parse_source(node, self.preparser)
 
         method = 'visit_' + node.__class__.__name__
         visitor = getattr(self, method)
@@ -648,8 +758,40 @@ class Expr(StringMixin):
         return len(self.expr)
 
     def parse(self):
-        """Parse an expression"""
-        return self._visitor.visit(self.expr)
+        """Parse an expression
+
+        The terms of an expression that evaluates nothing while parsing are
+        cached by the types of the values it refers to, and only rebound to
+        the values of the scope when it is parsed again.
+        """
+        node = _parse_source(self.expr, self._visitor.preparser)
+        names = _cacheable_names(node)
+        if names is None:
+            return self._visitor.visit(node)
+
+        try:
+            signature = tuple(_signature(self._resolve(name))
+                              for name in names)
+        except UndefinedVariableError:
+            return self._visitor.visit(node)
+
+        key = (self.expr, self.parser, self.engine, self.env.scope['truediv'],
+               self.env.target is not None, signature)
+        cached = _cache_lookup(_terms_cache, key)
+        if cached is not None:
+            terms, self._visitor.assigner = cached
+            return _rebind(terms, self.env)
+
+        ntemps = self.env.ntemps
+        terms = self._visitor.visit(node)
+        if self.env.ntemps == ntemps:
+            _cache_store(_terms_cache, key, (_rebind(terms, None),
+                                             self._visitor.assigner))
+        return terms
+
+    def _resolve(self, name):
+        is_local = name.startswith(_LOCAL_TAG) or name in _DEFAULT_GLOBALS
+        return self.env.resolve(name.replace(_LOCAL_TAG, ''), is_local)
 
     @property
     def names(self):
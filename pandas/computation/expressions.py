@@ -7,6 +7,8 @@ Offer fast expression evaluation through numexpr
 """
 
 import warnings
+import operator
+import timeit
 import numpy as np
 from pandas.core.common import _values_from_object
 from distutils.version import LooseVersion
@@ -32,12 +34,28 @@ _where = None
 # the set of dtypes that we will allow pass to numexpr
 _ALLOWED_DTYPES = {
     'evaluate': set(['int64', 'int32', 'float64', 'float32', 'bool']),
-    'where': set(['int64', 'float64', 'bool'])
+    'where': set(['int64', 'int32', 'float64', 'float32', 'bool'])
 }
 
 # the minimum prod shape that we will use numexpr
 _MIN_ELEMENTS = 10000
 
+# when calibrating, the thresholds per (op_str, dtype) are measured lazily on
+# arrays of these sizes, the smallest being the minimum prod shape
+_CALIBRATE = False
+_CALIBRATION_SIZES = [1 << 10, 1 << 12, 1 << 14, 1 << 16, 1 << 18, 1 << 20]
+_thresholds = {}
+
+_numpy_ops = {
+    '+': operator.add, '-': operator.sub, '*': operator.mul,
+    '/': operator.truediv, '//': operator.floordiv, '**': operator.pow,
+    '%': operator.mod, '==': operator.eq, '!=': operator.ne,
+    '<': operator.lt, '<=': operator.le, '>': operator.gt,
+    '>=': operator.ge, '&': operator.and_, '|': operator.or_,
+    '^': operator.xor,
+    'where': np.where
+}
+
 
 def set_use_numexpr(v=True):
     # set/unset to use numexpr
@@ -63,6 +81,77 @@ def set_numexpr_threads(n=None):
             n = ne.detect_number_of_cores()
         ne.set_num_threads(n)
 
+        # the measured thresholds depend on the number of threads
+        _thresholds.clear()
+
+
+def set_numexpr_calibration(v=True):
+    """
+    set/unset measuring the size above which numexpr is faster than numpy,
+    per operation and dtype, instead of using the fixed _MIN_ELEMENTS
+    """
+    global _CALIBRATE
+    _CALIBRATE = v
+    _thresholds.clear()
+
+
+def get_numexpr_thresholds():
+    """ return a dict of (op_str, dtype name) -> the measured number of
+    elements above which numexpr is used """
+    return dict(_thresholds)
+
+
+def _best_time(f, repeat=3):
+    timer = timeit.default_timer
+    best = np.inf
+    for i in range(repeat):
+        start = timer()
+        f()
+        best = min(best, timer() - start)
+    return best
+
+
+def _calibrate(op_str, dtype):
+    """ time numpy and numexpr evaluating op_str on arrays of dtype of
+    increasing size, return the largest size where numpy was not slower """
+    op = _numpy_ops[op_str]
+    threshold = 0
+    for size in _CALIBRATION_SIZES:
+        a = (np.arange(size) % 7 + 1).astype(dtype)
+        b = a[::-1].copy()
+        if op_str == 'where':
+            c = (np.arange(size) % 2).astype(bool)
+            f_numpy = lambda: op(c, a, b)
+            f_numexpr = lambda: ne.evaluate('where(c, a, b)',
+                                            local_dict={'c': c, 'a': a,
+                                                        'b': b},
+                                            casting='safe')
+        else:
+            f_numpy = lambda: op(a, b)
+            f_numexpr = lambda: ne.evaluate('a %s b' % op_str,
+                                            local_dict={'a': a, 'b': b},
+                                            casting='safe', truediv=True)
+        try:
+            with np.errstate(all='ignore'):
+                faster = _best_time(f_numexpr) < _best_time(f_numpy)
+        except Exception:
+            return _MIN_ELEMENTS
+        if faster:
+            break
+        threshold = size
+    return threshold
+
+
+def _min_elements(op_str, dtypes):
+    """ return the number of elements above which we use numexpr """
+    if not _CALIBRATE or len(dtypes) != 1 or op_str not in _numpy_ops:
+        return _MIN_ELEMENTS
+    key = (op_str, list(dtypes)[0])
+    threshold = _thresholds.get(key)
+    if threshold is None:
+        threshold = _thresholds[key] = _calibrate(*key)
+    return threshold
+
 
 def _evaluate_standard(op, op_str, a, b, raise_on_error=True, **eval_kwargs):
     """ standard evaluation """
@@ -76,7 +165,8 @@ def _can_use_numexpr(op, op_str, a, b, dtype_check):
     if op_str is not None:
 
         # required min elements (otherwise we are adding overhead)
-        if np.prod(a.shape) > _MIN_ELEMENTS:
+        size = np.prod(a.shape)
+        if size > (_CALIBRATION_SIZES[0] if _CALIBRATE else _MIN_ELEMENTS):
 
             # check for dtype compatiblity
             dtypes = set()
@@ -91,7 +181,7 @@ def _can_use_numexpr(op, op_str, a, b, dtype_check):
 
             # allowed are a superset
             if not len(dtypes) or _ALLOWED_DTYPES[dtype_check] >= dtypes:
-                return True
+                return size > _min_elements(op_str, dtypes)
 
     return False
 
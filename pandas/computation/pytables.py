@@ -2,6 +2,7 @@
 
 import ast
 import time
+import tokenize
 import warnings
 from functools import partial
 from datetime import datetime, timedelta
@@ -12,10 +13,11 @@ from pandas.core.base import StringMixin
 import pandas.core.common as com
 from pandas.computation import expr, ops
 from pandas.computation.ops import is_term, UndefinedVariableError
-from pandas.computation.scope import _ensure_scope
+from pandas.computation.scope import _ensure_scope, _DEFAULT_GLOBALS
 from pandas.computation.expr import BaseExprVisitor
 from pandas.computation.common import _ensure_decoded
 from pandas.tseries.timedeltas import _coerce_scalar_to_timedelta_type
+from pandas.tools.util import compose
 
 
 class Scope(expr.Scope):
@@ -553,6 +555,11 @@ class Expr(expr.Expr):
 
         return w
 
+    def parse(self):
+        """ parse the where, the terms depend on the queryables and the
+        encoding so are never taken from the cache of expr.Expr """
+        return self._visitor.visit(self.expr)
+
     def __unicode__(self):
         if self.terms is not None:
             return com.pprint_thing(self.terms)
@@ -575,6 +582,154 @@ class Expr(expr.Expr):
         return self.condition, self.filter
 
 
+_pushdown_ops = (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+                 ast.In)
+_value_nodes = tuple(getattr(ast, name) for name in
+                     ['Name', 'Load', 'Attribute', 'Subscript', 'Index',
+                      'Num', 'Str', 'Bytes', 'NameConstant', 'Constant',
+                      'List', 'Tuple', 'Call', 'keyword', 'UnaryOp', 'USub']
+                     if hasattr(ast, name))
+_query_preparse = partial(expr._preparse,
+                          f=compose(expr._replace_locals,
+                                    expr._replace_booleans))
+
+
+def _conjuncts(source):
+    """ split the tokens of source at its top-level ``&`` and ``and``, a
+    source with a top-level ``|`` or ``or`` is a single conjunct """
+    tokens = [t for t in expr.tokenize_string(source)
+              if t[0] not in (tokenize.NEWLINE, tokenize.NL,
+                              tokenize.ENDMARKER)]
+    conjuncts, current, depth = [], [], 0
+    for toknum, tokval in tokens:
+        if toknum == tokenize.OP and tokval in ('(', '[', '{'):
+            depth += 1
+        elif toknum == tokenize.OP and tokval in (')', ']', '}'):
+            depth -= 1
+        elif depth == 0 and tokval in ('|', 'or'):
+            return [tokens]
+        elif depth == 0 and tokval in ('&', 'and'):
+            conjuncts.append(current)
+            current = []
+            continue
+        current.append((toknum, tokval))
+    conjuncts.append(current)
+    return conjuncts
+
+
+def _untokenize(tokens, strip_locals=False):
+    if strip_locals:
+        tokens = [t for t in tokens if t != (tokenize.OP, '@')]
+    return tokenize.untokenize(tokens).strip()
+
+
+class Query(StringMixin):
+
+    """ hold a ``DataFrame.query`` expression to select from a table
+
+    The top-level conjuncts of the expression that compare a queryable (the
+    index or a data column) with literals or local ``@`` variables become a
+    condition evaluated by PyTables while reading the table, the others are
+    evaluated in memory on the selected frame.
+
+    Parameters
+    ----------
+    expr : string, an expression using the (default) ``pandas`` parser syntax
+        of ``DataFrame.query``
+    scope_level : the frame level to resolve the local variables from
+
+    Returns
+    -------
+    a Query object
+
+    Examples
+    --------
+
+    'A > 0 and B < @b'
+    'index > @start & string in ["foo", "bar"]'
+    'A > 0 and A < C'  (``A < C`` compares two columns, it is not pushed down)
+    """
+
+    def __init__(self, expr, scope_level=0):
+        if not isinstance(expr, string_types):
+            raise TypeError("query must be passed as a string")
+        self.expr = expr
+        self.env = Scope(scope_level + 1)
+
+    def __unicode__(self):
+        return com.pprint_thing(self.expr)
+
+    def split(self, queryables):
+        """ return a tuple of the condition to push down to the table (an
+        Expr, or None) and the expression to evaluate in memory (a string, or
+        None) """
+        names = set(queryables) - set(['columns'])
+        pushed, residual = [], []
+        for tokens in _conjuncts(self.expr):
+            if self._can_push(tokens, names):
+                pushed.append(_untokenize(tokens, strip_locals=True))
+            else:
+                residual.append(_untokenize(tokens))
+
+        condition = None
+        if pushed:
+            condition = Expr(' & '.join(["(%s)" % w for w in pushed]))
+            condition.env = self.env
+        if residual:
+            residual = ' & '.join(["(%s)" % w for w in residual])
+        return condition, residual or None
+
+    def filter(self, obj, residual):
+        """ evaluate the residual expression on the selected obj """
+        if residual is None:
+            return obj
+        if not isinstance(obj, pd.DataFrame):
+            raise TypeError("cannot evaluate [{0}] on a {1}, only the index "
+                            "and data columns can be queried"
+                            .format(residual, type(obj).__name__))
+        return obj.query(residual, local_dict=self.env.scope)
+
+    def _can_push(self, tokens, names):
+        try:
+            node = ast.parse(_query_preparse(_untokenize(tokens))).body[0]
+        except (SyntaxError, IndexError):
+            return False
+        return isinstance(node, ast.Expr) and self._is_condition(node.value,
+                                                                 names)
+
+    def _is_condition(self, node, names):
+        if isinstance(node, ast.BoolOp):
+            return all(self._is_condition(v, names) for v in node.values)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not,
+                                                                  ast.Invert)):
+            return self._is_condition(node.operand, names)
+        if isinstance(node, ast.Compare):
+            return (len(node.ops) == 1 and
+                    isinstance(node.ops[0], _pushdown_ops) and
+                    isinstance(node.left, ast.Name) and
+                    node.left.id in names and
+                    self._is_value(node.comparators[0]))
+        return False
+
+    def _is_value(self, node):
+        """ is node built only from literals and resolvable locals """
+        for n in ast.walk(node):
+            if not isinstance(n, _value_nodes):
+                return False
+            if isinstance(n, ast.UnaryOp) and not isinstance(n.op, ast.USub):
+                return False
+            if isinstance(n, ast.Name):
+                if n.id.startswith(ops._LOCAL_TAG):
+                    try:
+                        self.env.resolve(n.id[len(ops._LOCAL_TAG):],
+                                         is_local=True)
+                    except UndefinedVariableError:
+                        return False
+                elif n.id not in _DEFAULT_GLOBALS:
+                    return False
+        return True
+
+
 class TermValue(object):
 
     """ hold a term value the we use to construct a condition/filter """
@@ -1625,6 +1625,44 @@ def test_inf():
         yield check_inf, engine, parser
 
 
+def check_expression_cache(engine, parser):
+    tm.skip_if_no_ne(engine)
+    expr.clear_cache()
+    ex = '(a + b) / c > 0.5'
+    for i in range(3):
+        a, b, c = Series(randn(10)), Series(randint(1, 5, 10)), Series(randn(10))
+        result = pd.eval(ex, engine=engine, parser=parser)
+        assert_series_equal(result, (a + b) / c > 0.5)
+    keys = [k for k in expr._terms_cache if k[0] == ex]
+    tm.assert_equal(len(keys), 1)
+
+    # other dtypes are parsed again
+    b = b.astype(float)
+    result = pd.eval(ex, engine=engine, parser=parser)
+    assert_series_equal(result, (a + b) / c > 0.5)
+    keys = [k for k in expr._terms_cache if k[0] == ex]
+    tm.assert_equal(len(keys), 2)
+
+    # expressions evaluating values while parsing are not cached
+    result = pd.eval('a + b[0]', engine=engine, parser=parser)
+    assert_series_equal(result, a + b[0])
+    tm.assert_equal([k for k in expr._terms_cache if k[0] == 'a + b[0]'], [])
+
+    if parser == 'pandas':
+        df = DataFrame(randn(10, 2), columns=list('ab'))
+        for x in [0, 0.5, 0]:
+            result = df.query('a > @x and b < 1', engine=engine, parser=parser)
+            assert_frame_equal(result, df[(df.a > x) & (df.b < 1)])
+
+    expr.clear_cache()
+    tm.assert_equal(len(expr._terms_cache), 0)
+
+
+def test_expression_cache():
+    for engine, parser in ENGINES_PARSERS:
+        yield check_expression_cache, engine, parser
+
+
 if __name__ == '__main__':
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
                    exit=False)
@@ -326,6 +326,25 @@ class IndexOpsMixin(object):
         """ return the number of bytes in the underlying data """
         return self.values.nbytes
 
+    def memory_usage(self, deep=False):
+        """
+        Memory usage of the values
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Also count the memory held by the elements of object dtype
+            values (using ``sys.getsizeof``), not only their pointers
+
+        Returns
+        -------
+        bytes used : int
+        """
+        v = self.nbytes
+        if deep and com.is_object_dtype(self.values):
+            v += lib.memory_usage_of_objects(self.values.ravel())
+        return v
+
     @property
     def strides(self):
         """ return the strides of the underlying data """
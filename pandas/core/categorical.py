@@ -476,6 +476,27 @@ class Categorical(PandasObject):
 
         return tuple([len(self._codes)])
 
+    @property
+    def nbytes(self):
+        """ The number of bytes in the codes and the levels """
+        return self._codes.nbytes + self.levels.nbytes
+
+    def memory_usage(self, deep=False):
+        """
+        Memory usage of the codes and the levels
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Also count the memory held by the elements of object dtype
+            levels (using ``sys.getsizeof``), not only their pointers
+
+        Returns
+        -------
+        bytes used : int
+        """
+        return self._codes.nbytes + self.levels.memory_usage(deep=deep)
+
     def __array__(self, dtype=None):
         """ The numpy array interface.
 
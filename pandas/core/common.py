@@ -1292,6 +1292,45 @@ def _possibly_downcast_to_dtype(result, dtype):
     return result
 
 
+_SMALLEST_INT_DTYPES = [np.dtype(np.int8), np.dtype(np.int16),
+                        np.dtype(np.int32), np.dtype(np.int64)]
+
+
+def _smallest_numeric_dtype(values):
+    """
+    return the smallest dtype that can hold the 1-d numeric values without
+    loss: signed integers are shrunk to the narrowest signed integer dtype
+    that spans their range, float64 to float32 if the values survive the
+    round trip; any other dtype is returned unchanged
+    """
+    dtype = values.dtype
+
+    if not len(values):
+        return dtype
+
+    if dtype.kind == 'i' and dtype.itemsize > 1:
+        mn, mx = values.min(), values.max()
+        for new_dtype in _SMALLEST_INT_DTYPES:
+            if new_dtype.itemsize >= dtype.itemsize:
+                break
+            info = np.iinfo(new_dtype)
+            if info.min <= mn and mx <= info.max:
+                return new_dtype
+
+    elif dtype == np.float64:
+        mask = notnull(values)
+        if not mask.any():
+            return np.dtype(np.float32)
+        valid = values[mask]
+
+        # out of range values overflow to inf and fail the comparison
+        with np.errstate(over='ignore'):
+            if (valid.astype(np.float32) == valid).all():
+                return np.dtype(np.float32)
+
+    return dtype
+
+
 def _lcd_dtypes(a_dtype, b_dtype):
     """ return the lcd dtype to hold these types """
 
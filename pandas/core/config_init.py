@@ -181,6 +181,12 @@ pc_max_info_rows_doc = """
     limit this null check only to frames with smaller dimensions then specified.
 """
 
+pc_memory_usage_doc = """
+: bool, string or None
+    This specifies if the memory usage of a DataFrame should be displayed when
+    df.info() is called. Valid values True, False, 'deep'
+"""
+
 pc_large_repr_doc = """
 : 'truncate'/'info'
     For DataFrames exceeding max_rows/max_cols, the repr (and HTML repr) can
@@ -237,6 +243,9 @@ with cf.config_prefix('display'):
                        validator=is_one_of_factory(['truncate', 'info']))
     cf.register_option('max_info_columns', 100, pc_max_info_cols_doc,
                        validator=is_int)
+    cf.register_option('memory_usage', True, pc_memory_usage_doc,
+                       validator=is_one_of_factory([None, True,
+                                                    False, 'deep']))
     cf.register_option('colheader_justify', 'right', colheader_justify_doc,
                        validator=is_text)
     cf.register_option('notebook_repr_html', True, pc_nb_repr_h_doc,
@@ -313,6 +322,74 @@ with cf.config_prefix('mode'):
     cf.register_option('chained_assignment', 'warn', chained_assignment,
                        validator=is_one_of_factory([None, 'warn', 'raise']))
 
+copy_on_write_doc = """
+: boolean
+    When True, deep copies of a DataFrame or Series share their data with
+    the original and only copy a block the first time it is modified in place
+    (setitem, putmask, inplace fillna/replace/interpolate). Writes made
+    directly into the ``.values`` ndarray are not tracked.
+"""
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool)
+
+
+bin_search_lookups_doc = """
+: int
+    The number of lookups (get_loc, ``in``) that a monotonic integer or
+    datetime index smaller than 1,000,000 elements answers by binary search
+    before building its hash table. 0 always uses the hash table.
+"""
+
+
+def bin_search_lookups_cb(key):
+    from pandas.index import set_bin_search_lookups
+    set_bin_search_lookups(cf.get_option(key))
+
+with cf.config_prefix('compute'):
+    cf.register_option('bin_search_lookups', 100, bin_search_lookups_doc,
+                       validator=is_int, cb=bin_search_lookups_cb)
+
+groupby_threads_doc = """
+: int
+    The number of threads used by the cython groupby aggregations of a
+    DataFrame, which are run per block (or per slice of columns within a
+    block). The default of 1 aggregates serially.
+"""
+
+with cf.config_prefix('compute'):
+    cf.register_option('groupby_threads', 1, groupby_threads_doc,
+                       validator=is_int)
+
+rolling_threads_doc = """
+: int
+    The number of threads used by the cython rolling and expanding moments
+    of a DataFrame, which are computed on slices of its columns. The default
+    of 1 computes all the columns in a single pass.
+"""
+
+with cf.config_prefix('compute'):
+    cf.register_option('rolling_threads', 1, rolling_threads_doc,
+                       validator=is_int)
+
+numexpr_calibrate_doc = """
+: boolean
+    Measure, per operation and dtype, the number of elements above which
+    numexpr evaluates faster than numpy (with the current number of numexpr
+    threads) and use it as the threshold instead of the fixed default.
+    The measures are taken lazily, the first time an operation is seen.
+"""
+
+
+def numexpr_calibrate_cb(key):
+    from pandas.computation.expressions import set_numexpr_calibration
+    set_numexpr_calibration(cf.get_option(key))
+
+with cf.config_prefix('compute'):
+    cf.register_option('numexpr_calibrate', False, numexpr_calibrate_doc,
+                       validator=is_bool, cb=numexpr_calibrate_cb)
+
 
 # Set up the io.excel specific configuration.
 writer_engine_doc = """
@@ -32,7 +32,7 @@ from pandas.core.index import Index, MultiIndex, _ensure_index
 from pandas.core.indexing import (_maybe_droplevels,
                                   _convert_to_index_sliceable,
                                   _check_bool_indexer)
-from pandas.core.internals import (BlockManager,
+from pandas.core.internals import (BlockManager, make_block,
                                    create_block_manager_from_arrays,
                                    create_block_manager_from_blocks)
 from pandas.core.series import Series
@@ -1389,7 +1389,7 @@ class DataFrame(NDFrame):
         if buf is None:
             return formatter.buf.getvalue()
 
-    def info(self, verbose=None, buf=None, max_cols=None):
+    def info(self, verbose=None, buf=None, max_cols=None, memory_usage=None):
         """
         Concise summary of a DataFrame.
 
@@ -1403,6 +1403,11 @@ class DataFrame(NDFrame):
         max_cols : int, default None
             Determines whether full summary or short summary is printed.
             None follows the `display.max_info_columns` setting.
+        memory_usage : {None, True, False, 'deep'}, optional
+            Whether to display the total memory usage of the DataFrame
+            (including the index). 'deep' also counts the elements of object
+            columns, which is slower. None follows the `display.memory_usage`
+            setting.
         """
         from pandas.core.format import _put_lines
 
@@ -1474,8 +1479,83 @@ class DataFrame(NDFrame):
         counts = self.get_dtype_counts()
         dtypes = ['%s(%d)' % k for k in sorted(compat.iteritems(counts))]
         lines.append('dtypes: %s' % ', '.join(dtypes))
+
+        if memory_usage is None:
+            memory_usage = get_option('display.memory_usage')
+        if memory_usage:
+            deep = memory_usage == 'deep'
+
+            # the pointers of object columns are a lower bound without deep
+            size_qualifier = ''
+            if not deep and 'object' in counts:
+                size_qualifier = '+'
+
+            mem_usage = self.memory_usage(index=True, deep=deep).sum()
+            lines.append("memory usage: %s" %
+                         _sizeof_fmt(mem_usage, size_qualifier))
+
         _put_lines(buf, lines)
 
+    def memory_usage(self, index=False, deep=False):
+        """
+        Memory usage of each column of the DataFrame
+
+        Parameters
+        ----------
+        index : boolean, default False
+            Include the memory usage of the index as the first entry,
+            labelled 'Index'
+        deep : boolean, default False
+            Also count the memory held by the elements of object dtype
+            columns (using ``sys.getsizeof``), not only their pointers
+
+        Returns
+        -------
+        sizes : Series
+            The bytes used by each column (and the index)
+
+        See Also
+        --------
+        Series.memory_usage
+        """
+        result = Series([c.memory_usage(deep=deep)
+                         for col, c in self.iteritems()],
+                        index=self.columns)
+        if index:
+            result = Series(self.index.memory_usage(deep=deep),
+                            index=['Index']).append(result)
+        return result
+
+    def downcast(self, categories=0.5, copy=True):
+        """
+        Shrink each column to the smallest dtype that holds its values
+
+        Integer columns are cast to the narrowest of int8, int16, int32
+        spanning their range, float64 columns to float32 if the values
+        round-trip exactly through float32, and object columns with few
+        distinct values to Categorical
+
+        Parameters
+        ----------
+        categories : float or None, default 0.5
+            Convert an object column to a Categorical if its number of
+            unique values is at most this fraction of its length; None
+            leaves object columns as is
+        copy : boolean, default True
+            Copy the columns that are not downcast
+
+        Returns
+        -------
+        downcast : DataFrame
+
+        See Also
+        --------
+        DataFrame.memory_usage
+        """
+        return self._constructor(
+            self._data.shrink(categories=categories,
+                              copy=copy)).__finalize__(self)
+
     def transpose(self):
         """Transpose index and columns"""
         return super(DataFrame, self).transpose(1, 0)
@@ -1562,6 +1642,12 @@ class DataFrame(NDFrame):
             otherwise a new object
         """
         try:
+            # copy a block shared by a copy-on-write copy before writing
+            # through the cached series
+            item = self.columns[col] if takeable is True else col
+            if self._data._materialize(item):
+                self._clear_item_cache()
+
             if takeable is True:
                 series = self._iget_item_cache(col)
                 return series.set_value(index, value, takeable=True)
@@ -2906,31 +2992,11 @@ class DataFrame(NDFrame):
 
         if this._is_mixed_type or other._is_mixed_type:
 
-            # unique
-            if this.columns.is_unique:
+            def f(i):
+                return _arith_op(this.iloc[:, i].values,
+                                 other.iloc[:, i].values)
 
-                def f(col):
-                    r = _arith_op(this[col].values, other[col].values)
-                    return self._constructor_sliced(r, index=new_index,
-                                                    dtype=r.dtype)
-
-                result = dict([(col, f(col)) for col in this])
-
-            # non-unique
-            else:
-
-                def f(i):
-                    r = _arith_op(this.iloc[:, i].values,
-                                  other.iloc[:, i].values)
-                    return self._constructor_sliced(r, index=new_index,
-                                                    dtype=r.dtype)
-
-                result = dict([
-                    (i, f(i)) for i, col in enumerate(this.columns)
-                ])
-                result = self._constructor(result, index=new_index, copy=False)
-                result.columns = new_columns
-                return result
+            return this._combine_blockwise(other, _arith_op, f)
 
         else:
             result = _arith_op(this.values, other.values)
@@ -2994,8 +3060,47 @@ class DataFrame(NDFrame):
         new_data = self._data.eval(func=func, other=other, raise_on_error=raise_on_error)
         return self._constructor(new_data)
 
+    def _combine_blockwise(self, other, func, column_func):
+        """
+        Combine self and other, which are aligned, by evaluating func on the
+        2-d values of all the numeric columns sharing a pair of dtypes at once
+        (making them large enough for numexpr), and column_func on the
+        position of each of the other columns
+        """
+        # unsigned ints go column by column, where the Series arithmetic
+        # handles their wraparound (e.g. sub gives object)
+        groups, rest = {}, []
+        for i, dtypes in enumerate(zip(self.dtypes, other.dtypes)):
+            if all(dtype.kind in 'bif' for dtype in dtypes):
+                groups.setdefault(dtypes, []).append(i)
+            else:
+                rest.append(i)
+
+        blocks = []
+        for locs in groups.values():
+            result = func(self.iloc[:, locs].values, other.iloc[:, locs].values)
+            blocks.append(make_block(result.T, placement=locs))
+        for i in rest:
+            result = _values_from_object(column_func(i))
+            blocks.append(make_block(result.reshape(1, -1), placement=[i]))
+
+        mgr = create_block_manager_from_blocks(blocks,
+                                               [self.columns, self.index])
+        return self._constructor(mgr)
+
     def _compare_frame_evaluate(self, other, func, str_rep):
 
+        # mixed, evaluate the numeric columns by pairs of dtypes
+        if self._is_mixed_type or other._is_mixed_type:
+
+            def _compare(a, b):
+                return expressions.evaluate(func, str_rep, a, b)
+
+            def f(i):
+                return func(self.iloc[:, i], other.iloc[:, i])
+
+            return self._combine_blockwise(other, _compare, f)
+
         # unique
         if self.columns.is_unique:
             def _compare(a, b):
@@ -4893,6 +4998,15 @@ def _put_str(s, space):
     return ('%s' % s)[:space].ljust(space)
 
 
+def _sizeof_fmt(num, size_qualifier=''):
+    # returns size in human readable format
+    for x in ['bytes', 'KB', 'MB', 'GB', 'TB']:
+        if num < 1024.0:
+            return "%3.1f%s %s" % (num, size_qualifier, x)
+        num /= 1024.0
+    return "%3.1f%s %s" % (num, size_qualifier, 'PB')
+
+
 #----------------------------------------------------------------------
 # Add plotting methods to DataFrame
 
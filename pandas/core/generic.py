@@ -787,7 +787,7 @@ class NDFrame(PandasObject):
 
     def to_json(self, path_or_buf=None, orient=None, date_format='epoch',
                 double_precision=10, force_ascii=True, date_unit='ms',
-                default_handler=None):
+                default_handler=None, lines=False):
         """
         Convert the object to a JSON string.
 
@@ -835,6 +835,11 @@ class NDFrame(PandasObject):
             Handler to call if object cannot otherwise be converted to a
             suitable format for JSON. Should receive a single argument which is
             the object to convert and return a serialisable object.
+        lines : boolean, default False
+            If 'orient' is 'records', write out line delimited json format
+            (one record per line). The rows are serialized in chunks, so the
+            whole document is never held in memory when writing to a file.
+            Will raise a ValueError for any other 'orient'.
 
         Returns
         -------
@@ -850,7 +855,8 @@ class NDFrame(PandasObject):
             double_precision=double_precision,
             force_ascii=force_ascii,
             date_unit=date_unit,
-            default_handler=default_handler)
+            default_handler=default_handler,
+            lines=lines)
 
     def to_hdf(self, path_or_buf, key, **kwargs):
         """ activate the HDFStore
@@ -910,13 +916,16 @@ class NDFrame(PandasObject):
             (default is False)
         compress : type of compressor (zlib or blosc), default to None (no
             compression)
+        aligned : boolean whether to write the numeric buffers aligned, so
+            they can be memory mapped with read_msgpack(mmap=True)
+            (default is False)
         """
 
         from pandas.io import packers
         return packers.to_msgpack(path_or_buf, self, **kwargs)
 
     def to_sql(self, name, con, flavor='sqlite', if_exists='fail', index=True,
-               index_label=None, chunksize=None):
+               index_label=None, chunksize=None, method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -945,12 +954,17 @@ class NDFrame(PandasObject):
         chunksize : int, default None
             If not None, then rows will be written in batches of this size at a 
             time.  If None, all rows will be written at once.
+        method : {None, 'multi'}, default None
+            - None: one ``INSERT`` statement per row, passed to the driver's
+              ``executemany``.
+            - 'multi': multi-row ``INSERT ... VALUES (...), (...), ...``
+              statements sized to the database's limit on bound parameters.
 
         """
         from pandas.io import sql
         sql.to_sql(
             self, name, con, flavor=flavor, if_exists=if_exists, index=index,
-            index_label=index_label, chunksize=chunksize)
+            index_label=index_label, chunksize=chunksize, method=method)
 
     def to_pickle(self, path):
         """
@@ -3,6 +3,7 @@ from functools import wraps
 import numpy as np
 import datetime
 import collections
+from multiprocessing.pool import ThreadPool
 
 from pandas.compat import(
     zip, builtins, range, long, lzip,
@@ -25,7 +26,7 @@ from pandas.core.common import(_possibly_downcast_to_dtype, isnull,
                                notnull, _DATELIKE_DTYPES, is_numeric_dtype,
                                is_timedelta64_dtype, is_datetime64_dtype,
                                is_categorical_dtype, _values_from_object)
-from pandas.core.config import option_context
+from pandas.core.config import option_context, get_option
 import pandas.lib as lib
 from pandas.lib import Timestamp
 import pandas.tslib as tslib
@@ -118,6 +119,44 @@ def _groupby_function(name, alias, npfunc, numeric_only=True,
     return f
 
 
+def _groupby_cumulative(name):
+    def f(self, axis=None):
+        if self.axis == 0 and not axis:
+            try:
+                return self._cython_transform(name)
+            except (NotImplementedError, TypeError):
+                pass
+
+        kwargs = {} if axis is None else {'axis': axis}
+        return self._make_wrapper(name)(**kwargs)
+
+    f.__doc__ = "Compute %s of group values, indexed like the input" % name
+    f.__name__ = name
+
+    return f
+
+
+def _split_blocks(blocks, nchunks):
+    """
+    Split blocks along their items into about nchunks pieces in total, so
+    that they can be aggregated in parallel
+    """
+    per_block = max(1, int(np.ceil(nchunks / float(len(blocks)))))
+
+    result = []
+    for block in blocks:
+        n = len(block.mgr_locs)
+        step = max(1, int(np.ceil(n / float(per_block))))
+        if step >= n:
+            result.append(block)
+            continue
+
+        for start in range(0, n, step):
+            result.append(block.getitem_block(slice(start, start + step)))
+
+    return result
+
+
 def _first_compat(x, axis=0):
     def _first(x):
         x = np.asarray(x)
@@ -772,6 +811,27 @@ class GroupBy(PandasObject):
     def count(self, axis=0):
         return self._count().astype('int64')
 
+    cumsum = _groupby_cumulative('cumsum')
+    cumprod = _groupby_cumulative('cumprod')
+    cummin = _groupby_cumulative('cummin')
+    cummax = _groupby_cumulative('cummax')
+
+    def shift(self, periods=1, freq=None, axis=0):
+        """
+        Shift each group by periods observations, indexed like the input
+        """
+        if freq is None and axis == 0 and self.axis == 0:
+            labels, _, ngroups = self.grouper.group_info
+            indexer = np.empty(len(labels), dtype=np.int64)
+            _algos.group_shift_indexer(indexer, labels, ngroups, periods)
+            try:
+                return self._transform_selected(
+                    lambda x: com.take_nd(x.values, indexer))
+            except NotImplementedError:
+                pass
+
+        return self._make_wrapper('shift')(periods, freq=freq, axis=axis)
+
     def ohlc(self):
         """
         Compute sum of values, excluding missing values
@@ -1004,28 +1064,18 @@ class GroupBy(PandasObject):
         """
         ascending = kwargs.pop('ascending', True)
 
+        labels, _, ngroups = self.grouper.group_info
+        cumcounts = _algos.group_cumcount(labels, ngroups, ascending)
         if arr is None:
-            arr = np.arange(self.grouper._max_groupsize, dtype='int64')
-
-        len_index = len(self._selected_obj.index)
-        cumcounts = np.zeros(len_index, dtype=arr.dtype)
-        if not len_index:
             return cumcounts
 
-        indices, values = [], []
-        for v in self.indices.values():
-            indices.append(v)
+        if not len(arr):
+            return np.zeros(len(cumcounts), dtype=arr.dtype)
 
-            if ascending:
-                values.append(arr[:len(v)])
-            else:
-                values.append(arr[len(v)-1::-1])
-
-        indices = np.concatenate(indices)
-        values = np.concatenate(values)
-        cumcounts[indices] = values
-
-        return cumcounts
+        # rows in the NA group take the zero of arr's dtype
+        result = arr.take(cumcounts)
+        result[labels < 0] = 0
+        return result
 
     def _index_with_as_index(self, b):
         """
@@ -1078,6 +1128,30 @@ class GroupBy(PandasObject):
 
         return self._wrap_aggregated_output(output, names)
 
+    def _cython_transform(self, how):
+        return self._transform_selected(
+            lambda x: self._try_cast(self.grouper.transform(x.values, how), x))
+
+    def _transform_selected(self, f):
+        """
+        Apply f, mapping a Series to an array of the same length, to each
+        selected column and wrap the results like the selected object
+        """
+        self._set_selection_from_grouper()
+        obj = self._selected_obj
+
+        if obj.ndim == 1:
+            return Series(f(obj), index=obj.index, name=obj.name)
+
+        if obj.ndim > 2 or self.axis != 0 or not obj.columns.is_unique:
+            raise NotImplementedError
+
+        output = OrderedDict()
+        for name, col in compat.iteritems(obj):
+            output[name] = f(col)
+
+        return DataFrame(output, index=obj.index, columns=obj.columns)
+
     def _python_agg_general(self, func, *args, **kwargs):
         func = _intercept_function(func)
         f = lambda x: func(x, *args, **kwargs)
@@ -1342,7 +1416,11 @@ class BaseGrouper(object):
 
     def _get_compressed_labels(self):
         all_labels = [ping.labels for ping in self.groupings]
-        if self._overflow_possible:
+        if self._hash_labels:
+            # obs_group_ids are the positions where each group is first seen
+            comp_ids = _hash_group_index(all_labels, self.shape)
+            return comp_ids, _first_seen_positions(comp_ids)
+        elif self._overflow_possible:
             tups = lib.fast_zip(all_labels)
             labs, uniques = algos.factorize(tups)
 
@@ -1363,6 +1441,12 @@ class BaseGrouper(object):
 
             return comp_ids, obs_group_ids
 
+    @cache_readonly
+    def _hash_labels(self):
+        # without sorting, factorize the rows of the labels directly rather
+        # than going through the cartesian product of the keys
+        return not self.sort and len(self.groupings) > 1
+
     @cache_readonly
     def _overflow_possible(self):
         return _int64_overflow_possible(self.shape)
@@ -1382,7 +1466,10 @@ class BaseGrouper(object):
         if not self.compressed and len(self.groupings) == 1:
             return [self.groupings[0].group_index]
 
-        if self._overflow_possible:
+        if self._hash_labels:
+            recons_labels = [ping.labels.take(obs_ids)
+                             for ping in self.groupings]
+        elif self._overflow_possible:
             recons_labels = [np.array(x) for x in zip(*obs_ids)]
         else:
             recons_labels = decons_group_index(obs_ids, self.shape)
@@ -1421,6 +1508,13 @@ class BaseGrouper(object):
         'ohlc': 4,  # OHLC
     }
 
+    _cython_transforms = {
+        'cumsum': 'group_cumsum',
+        'cumprod': 'group_cumprod',
+        'cummin': 'group_cummin',
+        'cummax': 'group_cummax',
+    }
+
     _name_functions = {}
 
     _filter_empty_groups = True
@@ -1526,6 +1620,50 @@ class BaseGrouper(object):
 
         return result, names
 
+    def transform(self, values, how, axis=0):
+        """
+        Apply the cumulative kernel how within each group, returning an
+        array shaped like values
+        """
+        # integers are left to the python path, which keeps them exact
+        # (float64 can't represent all int64 values)
+        dtype_str = values.dtype.name
+        if not com.is_float_dtype(values):
+            raise NotImplementedError("function is not implemented for this"
+                                      "dtype: [how->%s,dtype->%s]" %
+                                      (how, dtype_str))
+
+        vdim = values.ndim
+        swapped = False
+        if vdim == 1:
+            values = values[:, None]
+        elif axis > 0:
+            swapped = True
+            values = values.swapaxes(0, axis)
+
+        if values.ndim > 2:
+            # punting for now
+            raise NotImplementedError
+
+        func = getattr(_algos, "%s_%s" % (self._cython_transforms[how],
+                                          values.dtype.name), None)
+        if func is None:
+            raise NotImplementedError("function is not implemented for this"
+                                      "dtype: [how->%s,dtype->%s]" %
+                                      (how, dtype_str))
+
+        comp_ids, _, ngroups = self.group_info
+        result = np.empty_like(values)
+        func(result, values, comp_ids, ngroups)
+
+        if vdim == 1:
+            result = result[:, 0]
+
+        if swapped:
+            result = result.swapaxes(0, axis)
+
+        return result
+
     def _aggregate(self, result, counts, values, how, is_numeric):
         agg_func, dtype = self._get_aggregate_function(how, values)
 
@@ -1721,6 +1859,20 @@ class BinGrouper(BaseGrouper):
                 i = bin
         return indices
 
+    @cache_readonly
+    def group_info(self):
+        ngroups = self.ngroups
+        obs_group_ids = np.arange(ngroups)
+        rep = com._ensure_platform_int(np.diff(np.r_[0, self.bins]))
+
+        if ngroups == len(self.bins):
+            comp_ids = np.repeat(np.arange(ngroups), rep)
+        else:
+            comp_ids = np.repeat(np.r_[-1, np.arange(ngroups)], rep)
+
+        return (com._ensure_int64(comp_ids),
+                com._ensure_int64(obs_group_ids), ngroups)
+
     @cache_readonly
     def ngroups(self):
         return len(self.binlabels)
@@ -2441,13 +2593,10 @@ class NDFrameGroupBy(GroupBy):
     def _cython_agg_blocks(self, how, numeric_only=True):
         data, agg_axis = self._get_data_to_aggregate()
 
-        new_blocks = []
-
         if numeric_only:
             data = data.get_numeric_data(copy=False)
 
-        for block in data.blocks:
-
+        def _agg_block(block):
             values = block._try_operate(block.values)
 
             if block.is_numeric:
@@ -2458,8 +2607,24 @@ class NDFrameGroupBy(GroupBy):
             # see if we can cast the block back to the original dtype
             result = block._try_coerce_and_cast_result(result)
 
-            newb = make_block(result, placement=block.mgr_locs)
-            new_blocks.append(newb)
+            return make_block(result, placement=block.mgr_locs)
+
+        nthreads = get_option('compute.groupby_threads')
+        if nthreads > 1 and len(data.blocks):
+            # compute the labels once, rather than racing in each thread
+            self.grouper.group_info
+
+            # the kernels release the GIL, so blocks (or slices of columns
+            # of a block) can be aggregated concurrently
+            blocks = _split_blocks(data.blocks, nthreads)
+            pool = ThreadPool(min(nthreads, len(blocks)))
+            try:
+                new_blocks = pool.map(_agg_block, blocks)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            new_blocks = [_agg_block(block) for block in data.blocks]
 
         if len(new_blocks) == 0:
             raise DataError('No numeric types to aggregate')
@@ -3581,6 +3746,45 @@ def _compress_group_index(group_index, sort=True):
     return comp_ids, obs_group_ids
 
 
+def _hash_group_index(label_list, shape):
+    """
+    Factorize the rows of label_list into group ids numbered in the order
+    each group is first seen. Pairs of keys are combined and re-factorized
+    with a hash table one key at a time, so the ids never exceed the number
+    of rows and the cartesian product of all possible labels is never formed.
+    Rows with a missing label in any key get -1.
+    """
+    comp_ids = com._ensure_int64(label_list[0])
+    mask = comp_ids < 0
+
+    for labels, size in zip(label_list[1:], shape[1:]):
+        labels = com._ensure_int64(labels)
+        mask |= labels < 0
+
+        codes = comp_ids * size + labels
+        np.putmask(codes, mask, -1)
+
+        table = _hash.Int64HashTable(min(1000000, len(codes)))
+        comp_ids, _ = table.get_labels_groupby(codes)
+
+    return comp_ids
+
+
+def _first_seen_positions(comp_ids):
+    """
+    Positions at which each id of comp_ids (numbered in order of first
+    appearance, -1 for missing) first occurs
+    """
+    if not len(comp_ids):
+        return np.array([], dtype=np.int64)
+
+    seen = np.maximum.accumulate(comp_ids)
+    prev = np.empty_like(seen)
+    prev[0] = -1
+    prev[1:] = seen[:-1]
+    return np.flatnonzero(comp_ids > prev).astype(np.int64)
+
+
 def _reorder_by_uniques(uniques, labels):
     # sorter is index where elements ought to go
     sorter = uniques.argsort()
@@ -2,8 +2,10 @@
 import datetime
 import warnings
 import operator
-from functools import partial
-from pandas.compat import range, zip, lrange, lzip, u, reduce
+import threading
+import weakref
+from functools import partial, wraps
+from pandas.compat import range, zip, lrange, lzip, u, reduce, OrderedDict
 from pandas import compat
 import numpy as np
 
@@ -66,6 +68,103 @@ class InvalidIndexError(Exception):
 _o_dtype = np.dtype(object)
 _Identity = object
 
+
+class _IndexerCache(object):
+    """
+    LRU cache of the indexers computed by get_indexer between pairs of live
+    Index objects, bounded by the total number of cached elements. Entries
+    hold weak references to both indexes and are dropped when either one is
+    collected; an index whose identity was reset (e.g. set_levels with
+    inplace=True) misses.
+
+    The cache is shared by threads, so it is only modified under a lock.
+    The weakref callbacks can run at any time (including while the lock is
+    held by the same thread), so like WeakValueDictionary they only queue
+    the key, which is removed by the next get or set.
+    """
+
+    def __init__(self, max_elements):
+        self.max_elements = max_elements
+        self.nelements = 0
+        self._entries = OrderedDict()
+        self._pending_removals = []
+        self._lock = threading.Lock()
+
+    def get(self, index, target, method, limit):
+        key = (id(index), id(target), method, limit)
+        with self._lock:
+            self._purge()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            index_ref, index_id, target_ref, target_id, indexer = entry
+            if (index_ref() is not index or target_ref() is not target or
+                    getattr(index, '_id', None) is not index_id or
+                    getattr(target, '_id', None) is not target_id):
+                self._pop(key)
+                return None
+
+            # most recently used last
+            self._entries[key] = self._entries.pop(key)
+        return indexer.copy()
+
+    def set(self, index, target, method, limit, indexer):
+        if len(indexer) > self.max_elements:
+            return
+
+        key = (id(index), id(target), method, limit)
+        remove = lambda ref: self._pending_removals.append(key)
+        entry = (weakref.ref(index, remove), getattr(index, '_id', None),
+                 weakref.ref(target, remove), getattr(target, '_id', None),
+                 indexer.copy())
+
+        with self._lock:
+            self._purge()
+            self._pop(key)
+            self._entries[key] = entry
+            self.nelements += len(indexer)
+
+            while self.nelements > self.max_elements:
+                self._pop(next(iter(self._entries)))
+
+    def _purge(self):
+        while self._pending_removals:
+            self._pop(self._pending_removals.pop())
+
+    def _pop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nelements -= len(entry[-1])
+
+    def clear(self):
+        with self._lock:
+            del self._pending_removals[:]
+            self._entries.clear()
+            self.nelements = 0
+
+_indexer_cache = _IndexerCache(max_elements=10 ** 6)
+
+
+def _cache_indexer(get_indexer):
+    """
+    Decorate get_indexer to reuse the indexer of a previous call with the
+    same (index, target Index, method, limit). The callers get a copy, as
+    some of them modify the indexer in place.
+    """
+
+    @wraps(get_indexer)
+    def wrapper(self, target, method=None, limit=None):
+        if not isinstance(target, Index):
+            return get_indexer(self, target, method=method, limit=limit)
+
+        indexer = _indexer_cache.get(self, target, method, limit)
+        if indexer is None:
+            indexer = get_indexer(self, target, method=method, limit=limit)
+            _indexer_cache.set(self, target, method, limit, indexer)
+        return indexer
+    return wrapper
+
 def _new_Index(cls, d):
     """ This is called upon unpickling, rather than the default which doesn't have arguments
         and breaks __new__ """
@@ -1424,6 +1523,7 @@ class Index(IndexOpsMixin, PandasObject):
         self._validate_index_level(level)
         return self
 
+    @_cache_indexer
     def get_indexer(self, target, method=None, limit=None):
         """
         Compute indexer and mask for new index given the current index. The
@@ -2884,6 +2984,24 @@ class MultiIndex(Index):
         self._tuples = lib.fast_zip(values)
         return self._tuples
 
+    def memory_usage(self, deep=False):
+        """
+        Memory usage of the levels and labels (materialized tuples of the
+        values are a cache and not counted)
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Also count the memory held by the elements of object dtype
+            levels (using ``sys.getsizeof``), not only their pointers
+
+        Returns
+        -------
+        bytes used : int
+        """
+        return (sum(lev.memory_usage(deep=deep) for lev in self.levels) +
+                sum(lab.nbytes for lab in self.labels))
+
     # fml
     @property
     def _is_v1(self):
@@ -3575,6 +3693,7 @@ class MultiIndex(Index):
 
         return new_index, indexer
 
+    @_cache_indexer
     def get_indexer(self, target, method=None, limit=None):
         """
         Compute indexer and mask for new index given the current index. The
@@ -2,6 +2,7 @@ import copy
 import itertools
 import re
 import operator
+import weakref
 from datetime import datetime, timedelta
 from collections import defaultdict
 
@@ -23,16 +24,46 @@ import pandas.lib as lib
 import pandas.tslib as tslib
 import pandas.computation.expressions as expressions
 from pandas.util.decorators import cache_readonly
+from pandas.core.config import get_option
 
 from pandas.tslib import Timestamp
 from pandas import compat
-from pandas.compat import range, map, zip, u
+from pandas.compat import range, map, zip, u, OrderedDict
 from pandas.tseries.timedeltas import _coerce_scalar_to_timedelta_type
 
 
 from pandas.lib import BlockPlacement
 
 
+# copy-on-write bookkeeping: id of a base ndarray that is shared between
+# several blocks (by a lazy copy) -> weakref to that array. A block whose
+# values are (a view on) a registered base copies them before writing.
+_cow_bases = {}
+
+
+def _cow_root(values):
+    """ return the ndarray that ultimately owns the memory of values """
+    while isinstance(values.base, np.ndarray):
+        values = values.base
+    return values
+
+
+def _cow_register(values):
+    root = _cow_root(values)
+    key = id(root)
+    if key not in _cow_bases:
+        _cow_bases[key] = weakref.ref(root,
+                                      lambda ref: _cow_bases.pop(key, None))
+
+
+def _cow_is_shared(values):
+    if not _cow_bases or not isinstance(values, np.ndarray):
+        return False
+    root = _cow_root(values)
+    ref = _cow_bases.get(id(root))
+    return ref is not None and ref() is root
+
+
 class Block(PandasObject):
 
     """
@@ -198,6 +229,16 @@ class Block(PandasObject):
     def ftype(self):
         return "%s:%s" % (self.dtype, self._ftype)
 
+    def memory_usage(self, deep=False):
+        """
+        Return the number of bytes held by my values, with deep also
+        counting the elements of object values
+        """
+        v = self.values.nbytes
+        if deep and self.is_object:
+            v += lib.memory_usage_of_objects(self.values.ravel())
+        return v
+
     def merge(self, other):
         return _merge_blocks([self, other])
 
@@ -232,6 +273,7 @@ class Block(PandasObject):
         -------
         None
         """
+        self._materialize()
         self.values[locs] = values
 
     def delete(self, loc):
@@ -332,6 +374,36 @@ class Block(PandasObject):
 
         return blocks
 
+    def shrink(self, categories=None, copy=True):
+        """
+        shrink my values to the smallest dtype that holds them without loss,
+        returns a list of blocks (items that end up with different dtypes
+        are split into separate blocks); the base class is left as is
+        """
+        return [self.copy()] if copy else [self]
+
+    def _shrink_items(self, dtypes, copy=True):
+        """
+        return a list of blocks, one per distinct dtype in the list of
+        per-item dtypes
+        """
+        if all(dtype == self.dtype for dtype in dtypes):
+            return [self.copy()] if copy else [self]
+
+        values = self.values
+        if self.ndim == 1:
+            return [make_block(values.astype(dtypes[0]), ndim=1,
+                               fastpath=True, placement=self.mgr_locs)]
+
+        blocks = []
+        for dtype in sorted(set(dtypes), key=lambda x: x.itemsize):
+            locs = np.array([i for i, d in enumerate(dtypes) if d == dtype],
+                            dtype=np.int64)
+            blocks.append(make_block(values[locs].astype(dtype),
+                                     ndim=self.ndim, fastpath=True,
+                                     placement=self.mgr_locs[locs]))
+        return blocks
+
     def astype(self, dtype, copy=False, raise_on_error=True, values=None):
         return self._astype(dtype, copy=copy, raise_on_error=raise_on_error,
                             values=values)
@@ -464,11 +536,30 @@ class Block(PandasObject):
     def copy(self, deep=True):
         values = self.values
         if deep:
-            values = values.copy()
+            if (isinstance(values, np.ndarray) and
+                    get_option('mode.copy_on_write')):
+                # share the data, the first inplace write will copy it
+                _cow_register(values)
+            else:
+                values = values.copy()
         return make_block(values, ndim=self.ndim,
                           klass=self.__class__, fastpath=True,
                           placement=self.mgr_locs)
 
+    def _materialize(self):
+        """
+        Copy values that are shared with another object by a copy-on-write
+        copy, so that they can be modified in-place
+
+        Returns
+        -------
+        copied : boolean
+        """
+        if _cow_is_shared(self.values):
+            self.values = self.values.copy()
+            return True
+        return False
+
     def replace(self, to_replace, value, inplace=False, filter=None,
                 regex=False):
         """ replace the to_replace value with value, possible to create new
@@ -493,6 +584,7 @@ class Block(PandasObject):
         indexer is a direct slice/positional indexer; value must be a
         compatible shape
         """
+        self._materialize()
 
         # coerce None values, if appropriate
         if value is None:
@@ -581,6 +673,8 @@ class Block(PandasObject):
         a new block(s), the result of the putmask
         """
 
+        if inplace:
+            self._materialize()
         new_values = self.values if inplace else self.values.copy()
 
         # may need to align the new
@@ -719,6 +813,8 @@ class Block(PandasObject):
                     return [self.copy()]
 
         fill_value = self._try_fill(fill_value)
+        if inplace:
+            self._materialize()
         values = self.values if inplace else self.values.copy()
         values = self._try_operate(values)
         values = com.interpolate_2d(values,
@@ -739,6 +835,8 @@ class Block(PandasObject):
                      inplace=False, downcast=None, **kwargs):
         """ interpolate using scipy wrappers """
 
+        if inplace:
+            self._materialize()
         data = self.values if inplace else self.values.copy()
 
         # only deal with floats
@@ -1122,6 +1220,13 @@ class NumericBlock(Block):
     is_numeric = True
     _can_hold_na = True
 
+    def shrink(self, categories=None, copy=True):
+        values = self.values
+        if self.ndim == 1:
+            values = values.reshape(1, -1)
+        dtypes = [com._smallest_numeric_dtype(v) for v in values]
+        return self._shrink_items(dtypes, copy=copy)
+
 
 class FloatOrComplexBlock(NumericBlock):
     __slots__ = ()
@@ -1362,6 +1467,44 @@ class ObjectBlock(Block):
         """
         return lib.is_bool_array(self.values.ravel())
 
+    def shrink(self, categories=None, copy=True):
+        """
+        convert the items whose number of unique values is at most the
+        categories fraction of their length to Categoricals; can return
+        multiple blocks!
+        """
+        if categories is None or categories is False or not len(self.values):
+            return super(ObjectBlock, self).shrink(copy=copy)
+
+        from pandas.core.algorithms import unique
+
+        values = self.values
+        if self.ndim == 1:
+            values = values.reshape(1, -1)
+
+        blocks = []
+        keep = []
+        for i, v in enumerate(values):
+            if v.ndim == 1 and len(unique(v)) <= categories * len(v):
+                if self.ndim == 1:
+                    placement = self.mgr_locs
+                else:
+                    placement = self.mgr_locs[[i]]
+                blocks.append(make_block(Categorical(v), ndim=self.ndim,
+                                         fastpath=True, placement=placement))
+            else:
+                keep.append(i)
+
+        if not blocks:
+            return super(ObjectBlock, self).shrink(copy=copy)
+
+        if keep:
+            keep = np.array(keep, dtype=np.int64)
+            blocks.append(make_block(values[keep], ndim=self.ndim,
+                                     fastpath=True,
+                                     placement=self.mgr_locs[keep]))
+        return blocks
+
     def convert(self, convert_dates=True, convert_numeric=True, convert_timedeltas=True,
                 copy=True, by_item=True):
         """ attempt to coerce any object types to better types
@@ -1415,6 +1558,7 @@ class ObjectBlock(Block):
                     return
             except:
                 pass
+        self._materialize()
         try:
             self.values[locs] = values
         except (ValueError):
@@ -1523,6 +1667,8 @@ class ObjectBlock(Block):
                 result = [result]
             return result
 
+        if inplace:
+            self._materialize()
         new_values = self.values if inplace else self.values.copy()
 
         # deal with replacing values with objects (strings) that match but
@@ -1581,6 +1727,12 @@ class CategoricalBlock(NonConsolidatableMixIn, ObjectBlock):
     def shape(self):
         return (len(self.mgr_locs), len(self.values))
 
+    def memory_usage(self, deep=False):
+        return self.values.memory_usage(deep=deep)
+
+    def shrink(self, categories=None, copy=True):
+        return Block.shrink(self, copy=copy)
+
     @property
     def array_dtype(self):
         """ the dtype to return if I want to construct this block as an array """
@@ -1775,6 +1927,8 @@ class DatetimeBlock(Block):
                inplace=False, downcast=None):
 
         # straight putmask here
+        if inplace:
+            self._materialize()
         values = self.values if inplace else self.values.copy()
         mask = isnull(self.values)
         value = self._try_fill(value)
@@ -1838,6 +1992,7 @@ class DatetimeBlock(Block):
             # Workaround for numpy 1.6 bug
             values = tslib.cast_to_nanoseconds(values)
 
+        self._materialize()
         self.values[locs] = values
 
     def get_values(self, dtype=None):
@@ -2180,6 +2335,14 @@ class BlockManager(PandasObject):
     def ndim(self):
         return len(self.axes)
 
+    def memory_usage(self, deep=False):
+        """
+        Return the number of bytes held by the values of the blocks (the
+        axes are not included), with deep also counting the elements of
+        object blocks
+        """
+        return sum(b.memory_usage(deep=deep) for b in self.blocks)
+
     def set_axis(self, axis, new_labels):
         new_labels = _ensure_index(new_labels)
         old_len = len(self.axes[axis])
@@ -2471,6 +2634,9 @@ class BlockManager(PandasObject):
     def downcast(self, **kwargs):
         return self.apply('downcast', **kwargs)
 
+    def shrink(self, **kwargs):
+        return self.apply('shrink', **kwargs)
+
     def astype(self, dtype, **kwargs):
         return self.apply('astype', dtype=dtype, **kwargs)
 
@@ -2665,6 +2831,26 @@ class BlockManager(PandasObject):
         return self.apply('copy', axes=new_axes, deep=deep,
                           do_integrity_check=False)
 
+    def _materialize(self, item=None):
+        """
+        Copy the values of the blocks (or only of the block holding item) that
+        are still shared by a copy-on-write copy, so that they can be
+        written to directly
+
+        Returns
+        -------
+        copied : boolean
+        """
+        blocks = self.blocks
+        if item is not None:
+            loc = self.items.get_loc(item)
+            if isinstance(loc, int):
+                blocks = [self.blocks[self._blknos[loc]]]
+        copied = False
+        for blk in blocks:
+            copied = blk._materialize() or copied
+        return copied
+
     def as_matrix(self, items=None):
         if len(self.blocks) == 0:
             return np.empty(self.shape, dtype=float)
@@ -3074,7 +3260,37 @@ class BlockManager(PandasObject):
         self._known_consolidated = False
 
         if len(self.blocks) > 100:
-            self._consolidate_inplace()
+            self._merge_inserted_blocks()
+
+    def _merge_inserted_blocks(self):
+        """
+        Merge same-dtype blocks pairwise, in the order they were added, until
+        each block holds more than twice the items of the next one of its
+        dtype. Unlike a full consolidation this does not copy the large blocks
+        again every time a few single-item blocks have been inserted: an item
+        is copied O(log n) times while a frame is built one column at a time,
+        and the number of blocks stays logarithmic in the number of items.
+        """
+        runs = OrderedDict()
+        new_blocks = []
+        for blk in self.blocks:
+            can_consolidate, dtype = blk._consolidate_key
+            if not can_consolidate:
+                new_blocks.append(blk)
+                continue
+
+            stack = runs.setdefault(dtype, [])
+            stack.append(blk)
+            while len(stack) > 1 and len(stack[-2]) <= 2 * len(stack[-1]):
+                newer = stack.pop()
+                stack[-1] = _merge_blocks([stack[-1], newer], dtype=dtype)
+
+        for stack in runs.values():
+            new_blocks.extend(stack)
+
+        self.blocks = tuple(new_blocks)
+        self._known_consolidated = False
+        self._rebuild_blknos_and_blklocs()
 
     def reindex_axis(self, new_index, axis, method=None, limit=None,
                      fill_value=None, copy=True):
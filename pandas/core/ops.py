@@ -884,6 +884,9 @@ def _flex_comp_method_FRAME(op, name, str_rep=None, default_axis='columns',
 
 
 def _comp_method_FRAME(func, name, str_rep, masker=False):
+    def na_op(x, y):
+        return expressions.evaluate(func, str_rep, x, y)
+
     @Appender('Wrapper for comparison method %s' % name)
     def f(self, other):
         if isinstance(other, pd.DataFrame):    # Another DataFrame
@@ -894,7 +897,7 @@ def _comp_method_FRAME(func, name, str_rep, masker=False):
 
             # straight boolean comparisions we want to allow all columns
             # (regardless of dtype to pass thru) See #4537 for discussion.
-            res = self._combine_const(other, func, raise_on_error=False)
+            res = self._combine_const(other, na_op, raise_on_error=False)
             return res.fillna(True).astype(bool)
 
     f.__name__ = name
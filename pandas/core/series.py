@@ -307,6 +307,31 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         """ same as values (but handles sparseness conversions); is a view """
         return self._data.get_values()
 
+    def memory_usage(self, index=False, deep=False):
+        """
+        Memory usage of the Series
+
+        Parameters
+        ----------
+        index : boolean, default False
+            Include the memory usage of the index
+        deep : boolean, default False
+            Also count the memory held by the elements of object dtype
+            values (using ``sys.getsizeof``), not only their pointers
+
+        Returns
+        -------
+        bytes used : int
+
+        See Also
+        --------
+        DataFrame.memory_usage
+        """
+        v = self._data.memory_usage(deep=deep)
+        if index:
+            v += self.index.memory_usage(deep=deep)
+        return v
+
 
     # ops
     def ravel(self, order='C'):
@@ -647,6 +672,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
 
         # do the setitem
         cacher_needs_updating = self._check_is_chained_assignment_possible()
+        self._data._materialize()
         setitem(key, value)
         if cacher_needs_updating:
             self._maybe_update_cacher()
@@ -789,6 +815,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             If label is contained, will be reference to calling Series,
             otherwise a new object
         """
+        self._data._materialize()
         try:
             if takeable:
                 self.values[label] = value
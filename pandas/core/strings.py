@@ -89,12 +89,18 @@ def _length_check(others):
     return n
 
 
-def _na_map(f, arr, na_result=np.nan, dtype=object):
+def _na_map(f, arr, na_result=np.nan, dtype=object, kernel=None):
     # should really _check_ for NA
-    return _map(f, arr, na_mask=True, na_value=na_result, dtype=dtype)
+    return _map(f, arr, na_mask=True, na_value=na_result, dtype=dtype,
+                kernel=kernel)
 
 
-def _map(f, arr, na_mask=False, na_value=np.nan, dtype=object):
+def _map(f, arr, na_mask=False, na_value=np.nan, dtype=object, kernel=None):
+    """
+    kernel : tuple, optional
+        The method and argument of lib.str_map_mask equivalent to f, used
+        instead of calling f on each element when all of them are strings
+    """
     if not len(arr):
         return np.ndarray(0, dtype=dtype)
 
@@ -105,7 +111,11 @@ def _map(f, arr, na_mask=False, na_value=np.nan, dtype=object):
     if na_mask:
         mask = isnull(arr)
         try:
-            result = lib.map_infer_mask(arr, f, mask.view(np.uint8))
+            result = None
+            if kernel is not None and arr.dtype == object:
+                result = lib.str_map_mask(arr, mask.view(np.uint8), *kernel)
+            if result is None:
+                result = lib.map_infer_mask(arr, f, mask.view(np.uint8))
         except (TypeError, AttributeError):
             def g(x):
                 try:
@@ -130,7 +140,7 @@ def str_title(arr):
     -------
     titled : array
     """
-    return _na_map(lambda x: x.title(), arr)
+    return _na_map(lambda x: x.title(), arr, kernel=('title',))
 
 
 def str_count(arr, pat, flags=0):
@@ -195,7 +205,9 @@ def str_contains(arr, pat, case=True, flags=0, na=np.nan, regex=True):
         else:
             upper_pat = pat.upper()
             f = lambda x: upper_pat in x
-            return _na_map(f, str_upper(arr), na, dtype=bool)
+            return _na_map(f, str_upper(arr), na, dtype=bool,
+                           kernel=('contains', upper_pat))
+        return _na_map(f, arr, na, dtype=bool, kernel=('contains', pat))
     return _na_map(f, arr, na, dtype=bool)
 
 
@@ -215,7 +227,7 @@ def str_startswith(arr, pat, na=np.nan):
     startswith : array (boolean)
     """
     f = lambda x: x.startswith(pat)
-    return _na_map(f, arr, na, dtype=bool)
+    return _na_map(f, arr, na, dtype=bool, kernel=('startswith', pat))
 
 
 def str_endswith(arr, pat, na=np.nan):
@@ -234,7 +246,7 @@ def str_endswith(arr, pat, na=np.nan):
     endswith : array (boolean)
     """
     f = lambda x: x.endswith(pat)
-    return _na_map(f, arr, na, dtype=bool)
+    return _na_map(f, arr, na, dtype=bool, kernel=('endswith', pat))
 
 
 def str_lower(arr):
@@ -245,7 +257,7 @@ def str_lower(arr):
     -------
     lowercase : array
     """
-    return _na_map(lambda x: x.lower(), arr)
+    return _na_map(lambda x: x.lower(), arr, kernel=('lower',))
 
 
 def str_upper(arr):
@@ -256,7 +268,7 @@ def str_upper(arr):
     -------
     uppercase : array
     """
-    return _na_map(lambda x: x.upper(), arr)
+    return _na_map(lambda x: x.upper(), arr, kernel=('upper',))
 
 
 def str_replace(arr, pat, repl, n=-1, case=True, flags=0):
@@ -554,7 +566,7 @@ def str_len(arr):
     -------
     lengths : array
     """
-    return _na_map(len, arr, dtype=int)
+    return _na_map(len, arr, dtype=int, kernel=('len',))
 
 
 def str_findall(arr, pat, flags=0):
@@ -673,7 +685,7 @@ def str_slice(arr, start=None, stop=None, step=1):
     """
     obj = slice(start, stop, step)
     f = lambda x: x[obj]
-    return _na_map(f, arr)
+    return _na_map(f, arr, kernel=('slice', obj))
 
 
 def str_slice_replace(arr, start=None, stop=None, repl=None):
@@ -701,7 +713,8 @@ def str_strip(arr, to_strip=None):
     -------
     stripped : array
     """
-    return _na_map(lambda x: x.strip(to_strip), arr)
+    return _na_map(lambda x: x.strip(to_strip), arr,
+                   kernel=('strip', to_strip))
 
 
 def str_lstrip(arr, to_strip=None):
@@ -717,7 +730,8 @@ def str_lstrip(arr, to_strip=None):
     -------
     stripped : array
     """
-    return _na_map(lambda x: x.lstrip(to_strip), arr)
+    return _na_map(lambda x: x.lstrip(to_strip), arr,
+                   kernel=('lstrip', to_strip))
 
 
 def str_rstrip(arr, to_strip=None):
@@ -733,7 +747,8 @@ def str_rstrip(arr, to_strip=None):
     -------
     stripped : array
     """
-    return _na_map(lambda x: x.rstrip(to_strip), arr)
+    return _na_map(lambda x: x.rstrip(to_strip), arr,
+                   kernel=('rstrip', to_strip))
 
 
 def str_wrap(arr, width, **kwargs):
@@ -66,6 +66,16 @@ def set_value_at(ndarray arr, object loc, object val):
 # Don't populate hash tables in monotonic indexes larger than this
 _SIZE_CUTOFF = 1000000
 
+# Smaller monotonic integer/datetime indexes answer this many lookups by
+# binary search before building their hash table, see the
+# compute.bin_search_lookups option
+_BIN_SEARCH_LOOKUPS = 100
+
+
+def set_bin_search_lookups(n):
+    global _BIN_SEARCH_LOOKUPS
+    _BIN_SEARCH_LOOKUPS = n
+
 
 cdef class IndexEngine:
 
@@ -77,6 +87,7 @@ cdef class IndexEngine:
     cdef:
         bint unique, monotonic
         bint initialized, monotonic_check, unique_check
+        Py_ssize_t lookups
 
     def __init__(self, vgetter, n):
         self.vgetter = vgetter
@@ -85,11 +96,19 @@ cdef class IndexEngine:
 
         self.initialized = 0
         self.monotonic_check = 0
+        self.lookups = 0
 
         self.unique = 0
         self.monotonic = 0
 
     def __contains__(self, object val):
+        if self._bin_search_key(val) is not None:
+            try:
+                self.get_loc(val)
+                return True
+            except KeyError:
+                return False
+
         self._ensure_mapping_populated()
         hash(val)
         return val in self.mapping
@@ -135,7 +154,18 @@ cdef class IndexEngine:
                 return self._get_loc_duplicates(val)
             values = self._get_index_values()
             loc = _bin_search(values, val) # .searchsorted(val, side='left')
-            if util.get_value_at(values, loc) != val:
+            if loc == len(values) or util.get_value_at(values, loc) != val:
+                raise KeyError(val)
+            return loc
+
+        key = self._bin_search_key(val)
+        if key is not None:
+            self.lookups += 1
+            if not self.is_unique:
+                return self._get_loc_duplicates(key)
+            values = self._get_index_values()
+            loc = values.searchsorted(key, side='left')
+            if loc == len(values) or util.get_value_at(values, loc) != key:
                 raise KeyError(val)
             return loc
 
@@ -150,6 +180,20 @@ cdef class IndexEngine:
         except TypeError:
             raise KeyError(val)
 
+    cdef _bin_search_key(self, object val):
+        """
+        Return the key to binary search for val, or None if the lookup should
+        use the hash table. Only some engines support this, on monotonic
+        indexes that have not built their hash table yet and for the first
+        _BIN_SEARCH_LOOKUPS lookups: building the table of a small index costs
+        more than a handful of binary searches.
+        """
+        return None
+
+    cdef inline bint _use_bin_search(self):
+        return (not self.initialized and not self.over_size_threshold and
+                self.lookups < _BIN_SEARCH_LOOKUPS and self.is_monotonic)
+
     cdef inline _get_loc_duplicates(self, object val):
         cdef:
             Py_ssize_t diff
@@ -358,6 +402,11 @@ cdef class Int64Engine(IndexEngine):
         elif util.is_float_object(val):
             raise KeyError(val)
 
+    cdef _bin_search_key(self, object val):
+        if util.is_integer_object(val) and self._use_bin_search():
+            return val
+        return None
+
     cdef _maybe_get_bool_indexer(self, object val):
         cdef:
             ndarray[uint8_t, cast=True] indexer
@@ -507,9 +556,22 @@ cdef class DatetimeEngine(Int64Engine):
             loc = values.searchsorted(conv, side='left')
             return util.get_value_at(values, loc) == conv
 
+        if self._bin_search_key(val) is not None:
+            try:
+                self.get_loc(val)
+                return True
+            except KeyError:
+                return False
+
         self._ensure_mapping_populated()
         return _to_i8(val) in self.mapping
 
+    cdef _bin_search_key(self, object val):
+        conv = _to_i8(val)
+        if util.is_integer_object(conv) and self._use_bin_search():
+            return conv
+        return None
+
     cdef _get_index_values(self):
         return self.vgetter().view('i8')
 
@@ -533,6 +595,17 @@ cdef class DatetimeEngine(Int64Engine):
                 raise KeyError(val)
             return loc
 
+        conv = self._bin_search_key(val)
+        if conv is not None:
+            self.lookups += 1
+            if not self.is_unique:
+                return self._get_loc_duplicates(conv)
+            values = self._get_index_values()
+            loc = values.searchsorted(conv, side='left')
+            if loc == len(values) or util.get_value_at(values, loc) != conv:
+                raise KeyError(val)
+            return loc
+
         self._ensure_mapping_populated()
         if not self.unique:
             val = _to_i8(val)
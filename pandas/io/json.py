@@ -2,12 +2,14 @@
 
 import os
 import copy
+import itertools
 from collections import defaultdict
 import numpy as np
 
 import pandas.json as _json
+import pandas.lib as lib
 from pandas.tslib import iNaT
-from pandas.compat import long, u
+from pandas.compat import long, u, lrange, StringIO
 from pandas import compat, isnull
 from pandas import Series, DataFrame, to_datetime
 from pandas.io.common import get_filepath_or_buffer
@@ -18,30 +20,58 @@ dumps = _json.dumps
 ### interface to/from ###
 
 
+# number of rows serialized at a time when writing with lines=True
+_LINES_CHUNKSIZE = 10000
+
+
 def to_json(path_or_buf, obj, orient=None, date_format='epoch',
             double_precision=10, force_ascii=True, date_unit='ms',
-            default_handler=None):
+            default_handler=None, lines=False):
+
+    if lines and orient != 'records':
+        raise ValueError("'lines' keyword only valid when 'orient' is "
+                         "records")
 
     if isinstance(obj, Series):
-        s = SeriesWriter(
-            obj, orient=orient, date_format=date_format,
-            double_precision=double_precision, ensure_ascii=force_ascii,
-            date_unit=date_unit, default_handler=default_handler).write()
+        klass = SeriesWriter
     elif isinstance(obj, DataFrame):
-        s = FrameWriter(
+        klass = FrameWriter
+    else:
+        raise NotImplementedError
+
+    def _write(obj):
+        return klass(
             obj, orient=orient, date_format=date_format,
             double_precision=double_precision, ensure_ascii=force_ascii,
             date_unit=date_unit, default_handler=default_handler).write()
+
+    if lines:
+        # serialize a bounded number of rows at a time, one record per line
+        pieces = (_convert_to_line_delimits(
+                      _write(obj.iloc[i:i + _LINES_CHUNKSIZE])) + '\n'
+                  for i in range(0, len(obj), _LINES_CHUNKSIZE))
     else:
-        raise NotImplementedError
+        pieces = [_write(obj)]
 
     if isinstance(path_or_buf, compat.string_types):
         with open(path_or_buf, 'w') as fh:
-            fh.write(s)
+            for s in pieces:
+                fh.write(s)
     elif path_or_buf is None:
-        return s
+        return ''.join(pieces)
     else:
-        path_or_buf.write(s)
+        for s in pieces:
+            path_or_buf.write(s)
+
+
+def _convert_to_line_delimits(s):
+    """
+    Convert a json list of records to newline delimited records
+    """
+    # only a json list can be converted
+    if not (s[0] == '[' and s[-1] == ']'):
+        return s
+    return lib.convert_json_to_lines(s[1:-1])
 
 
 class Writer(object):
@@ -103,7 +133,8 @@ class FrameWriter(Writer):
 
 def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
               convert_axes=True, convert_dates=True, keep_default_dates=True,
-              numpy=False, precise_float=False, date_unit=None):
+              numpy=False, precise_float=False, date_unit=None, lines=False,
+              chunksize=None):
     """
     Convert a JSON string to pandas object
 
@@ -165,23 +196,44 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
         is to try and detect the correct precision, but if this is not desired
         then pass one of 's', 'ms', 'us' or 'ns' to force parsing only seconds,
         milliseconds, microseconds or nanoseconds respectively.
+    lines : boolean, default False
+        Read the file as a json object per line (JSON Lines), each holding
+        one record. Implies ``orient='records'``.
+    chunksize : int, default None
+        Return a JsonReader object for iteration over chunks of ``chunksize``
+        lines, so that only one chunk of the input is held in memory at a
+        time. Can only be passed if ``lines=True``.
 
     Returns
     -------
-    result : Series or DataFrame
+    result : Series or DataFrame, or JsonReader if chunksize is passed
     """
 
+    if lines and orient not in (None, 'records'):
+        raise ValueError("'lines' keyword only valid when 'orient' is "
+                         "records")
+
+    if chunksize is not None:
+        if not lines:
+            raise ValueError("chunksize can only be passed if lines=True")
+        if not com.is_integer(chunksize) or chunksize < 1:
+            raise ValueError("chunksize must be an integer >= 1")
+
     filepath_or_buffer, _ = get_filepath_or_buffer(path_or_buf)
-    if isinstance(filepath_or_buffer, compat.string_types):
-        try:
-            exists = os.path.exists(filepath_or_buffer)
 
-        # if the filepath is too long will raise here
-        # 5874
-        except (TypeError,ValueError):
-            exists = False
+    kwds = dict(orient='records' if lines else orient, typ=typ, dtype=dtype,
+                convert_axes=convert_axes, convert_dates=convert_dates,
+                keep_default_dates=keep_default_dates, numpy=numpy,
+                precise_float=precise_float, date_unit=date_unit)
 
-        if exists:
+    if lines:
+        reader = JsonReader(filepath_or_buffer, chunksize=chunksize, **kwds)
+        if chunksize is not None:
+            return reader
+        return reader.read()
+
+    if isinstance(filepath_or_buffer, compat.string_types):
+        if _is_existing_path(filepath_or_buffer):
             with open(filepath_or_buffer, 'r') as fh:
                 json = fh.read()
         else:
@@ -191,6 +243,23 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
     else:
         json = filepath_or_buffer
 
+    return _parse_json(json, **kwds)
+
+
+def _is_existing_path(path):
+    try:
+        return os.path.exists(path)
+
+    # if the filepath is too long will raise here
+    # 5874
+    except (TypeError, ValueError):
+        return False
+
+
+def _parse_json(json, orient=None, typ='frame', dtype=True,
+                convert_axes=True, convert_dates=True,
+                keep_default_dates=True, numpy=False, precise_float=False,
+                date_unit=None):
     obj = None
     if typ == 'frame':
         obj = FrameParser(json, orient, dtype, convert_axes, convert_dates,
@@ -207,6 +276,92 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
     return obj
 
 
+class JsonReader(object):
+    """
+    Reads line-delimited json (one record per line) from a path, json string
+    or file-like object, either at once or in chunks of ``chunksize`` lines.
+
+    Iterating yields a Series or DataFrame per chunk; the default integer
+    index keeps counting across chunks.
+    """
+
+    def __init__(self, filepath_or_buffer, chunksize=None, **kwds):
+        self.chunksize = chunksize
+        self.kwds = kwds
+        self.nrows_seen = 0
+        self._owns_handle = False
+
+        if isinstance(filepath_or_buffer, compat.string_types):
+            if _is_existing_path(filepath_or_buffer):
+                self.fh = open(filepath_or_buffer, 'r')
+                self._owns_handle = True
+            else:
+                self.fh = StringIO(filepath_or_buffer)
+        elif hasattr(filepath_or_buffer, 'read'):
+            self.fh = filepath_or_buffer
+        else:
+            raise ValueError("Expected a path, json string or file-like "
+                             "object, got %s" % type(filepath_or_buffer))
+
+    def _parse_lines(self, lines):
+        json = '[' + ','.join(lines) + ']'
+        return _parse_json(json, **self.kwds)
+
+    def _nonblank(self, lines):
+        return [line for line in (line.strip() for line in lines) if line]
+
+    def read(self):
+        """Read all remaining lines into a single object"""
+        try:
+            obj = self._parse_lines(self._nonblank(self.fh))
+        finally:
+            self.close()
+        return obj
+
+    def _read_chunk(self):
+        """Return the next chunk, or None at the end of the input"""
+        while True:
+            lines = list(itertools.islice(self.fh, self.chunksize))
+            if not lines:
+                return None
+
+            lines = self._nonblank(lines)
+            if lines:
+                break
+
+        obj = self._parse_lines(lines)
+
+        # make sure the index is contiguous across chunks
+        nrows = len(obj)
+        obj.index = lrange(self.nrows_seen, self.nrows_seen + nrows)
+        self.nrows_seen += nrows
+        return obj
+
+    def __iter__(self):
+        try:
+            while True:
+                obj = self._read_chunk()
+                if obj is None:
+                    break
+                yield obj
+        finally:
+            self.close()
+
+    def get_chunk(self, size=None):
+        if size is not None:
+            self.chunksize = size
+
+        obj = self._read_chunk()
+        if obj is None:
+            self.close()
+            raise StopIteration
+        return obj
+
+    def close(self):
+        if self._owns_handle:
+            self.fh.close()
+
+
 class Parser(object):
 
     _STAMP_UNITS = ('s', 'ms', 'us', 'ns')
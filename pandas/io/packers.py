@@ -41,7 +41,10 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import os
+import mmap as _mmap
+from contextlib import contextmanager
 from datetime import datetime, date, timedelta
+from multiprocessing.pool import ThreadPool
 from dateutil.parser import parse
 
 import numpy as np
@@ -60,7 +63,8 @@ from pandas.io.common import get_filepath_or_buffer
 from pandas.core.internals import BlockManager, make_block
 import pandas.core.internals as internals
 
-from pandas.msgpack import Unpacker as _Unpacker, Packer as _Packer
+from pandas.msgpack import (Unpacker as _Unpacker, Packer as _Packer,
+                            OutOfData)
 import zlib
 
 try:
@@ -73,6 +77,22 @@ except:
 # this is pretty hacky
 compressor = None
 
+# the aligned layout (to_msgpack(aligned=True)): while packing, the buffers
+# of the arrays are collected here instead of being packed inline; while
+# unpacking, references to them are resolved by this callable
+aligned_buffers = None
+aligned_source = None
+
+# alignment (in bytes) of the buffers in the data section of an object
+_ALIGNMENT = 64
+
+# the thread pool (de)compressing the buffers in chunks, see
+# to_msgpack(nthreads=...)
+compress_pool = None
+
+# with threads, compressed buffers are split in chunks of (about) this size
+_COMPRESS_CHUNKSIZE = 1 << 22
+
 
 def to_msgpack(path_or_buf, *args, **kwargs):
     """
@@ -90,21 +110,41 @@ def to_msgpack(path_or_buf, *args, **kwargs):
              (default is False)
     compress : type of compressor (zlib or blosc), default to None (no
                compression)
+    aligned : boolean, write the buffers of the numeric arrays uncompressed,
+              aligned in a data section following each packed object, so
+              they can be memory mapped by read_msgpack(mmap=True)
+              (default is False)
+    nthreads : int, the number of threads compressing the buffers; with more
+               than one, large buffers are split in chunks compressed
+               concurrently (default is 1)
     """
     global compressor
     compressor = kwargs.pop('compress', None)
     append = kwargs.pop('append', None)
+    aligned = kwargs.pop('aligned', False)
+    nthreads = kwargs.pop('nthreads', 1)
     if append:
         mode = 'a+b'
     else:
         mode = 'wb'
 
+    if aligned and compressor is not None:
+        raise ValueError("cannot both compress and align the buffers")
+
     def writer(fh):
-        for a in args:
-            fh.write(pack(a, **kwargs))
+        with _compress_threads(nthreads if compressor else 1):
+            for a in args:
+                if aligned:
+                    _pack_aligned(a, fh, **kwargs)
+                else:
+                    fh.write(pack(a, **kwargs))
 
     if isinstance(path_or_buf, compat.string_types):
         with open(path_or_buf, mode) as fh:
+
+            # the alignment is relative to the end of the file
+            if append:
+                fh.seek(0, os.SEEK_END)
             writer(fh)
     elif path_or_buf is None:
         buf = compat.BytesIO()
@@ -114,7 +154,8 @@ def to_msgpack(path_or_buf, *args, **kwargs):
         writer(path_or_buf)
 
 
-def read_msgpack(path_or_buf, iterator=False, **kwargs):
+def read_msgpack(path_or_buf, iterator=False, mmap=False, nthreads=1,
+                 **kwargs):
     """
     Load msgpack pandas object from the specified
     file path
@@ -127,6 +168,12 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
     path_or_buf : string File path, BytesIO like or string
     iterator : boolean, if True, return an iterator to the unpacker
                (default is False)
+    mmap : boolean, if True, memory map the file at path_or_buf; the
+           numeric arrays of the objects written with
+           to_msgpack(aligned=True) are then copy-on-write views onto the
+           file rather than copies (default is False)
+    nthreads : int, the number of threads decompressing the chunks of the
+               buffers compressed by to_msgpack(nthreads=...) (default is 1)
 
     Returns
     -------
@@ -134,15 +181,37 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
 
     """
     path_or_buf, _ = get_filepath_or_buffer(path_or_buf)
-    if iterator:
-        return Iterator(path_or_buf)
 
-    def read(fh):
-        l = list(unpack(fh))
+    def read(objs):
+        with _compress_threads(nthreads):
+            l = list(objs)
         if len(l) == 1:
             return l[0]
         return l
 
+    if mmap:
+        exists = False
+        if isinstance(path_or_buf, compat.string_types):
+            try:
+                exists = os.path.exists(path_or_buf)
+            except (TypeError, ValueError):
+                exists = False
+        if not exists:
+            raise ValueError("mmap=True requires the path of an existing "
+                             "file")
+        if not os.path.getsize(path_or_buf):
+            return [] if not iterator else iter([])
+
+        # the mapping outlives the file handle
+        with open(path_or_buf, 'rb') as fh:
+            mm = _mmap.mmap(fh.fileno(), 0, access=_mmap.ACCESS_COPY)
+        if iterator:
+            return _unpack_aligned(mm, mm)
+        return read(_unpack_aligned(mm, mm))
+
+    if iterator:
+        return Iterator(path_or_buf, nthreads=nthreads)
+
     # see if we have an actual file
     if isinstance(path_or_buf, compat.string_types):
 
@@ -153,19 +222,19 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
 
         if exists:
             with open(path_or_buf, 'rb') as fh:
-                return read(fh)
+                return read(_unpack_aligned(fh))
 
     # treat as a string-like
     if not hasattr(path_or_buf, 'read'):
 
         try:
             fh = compat.BytesIO(path_or_buf)
-            return read(fh)
+            return read(_unpack_aligned(fh))
         finally:
             fh.close()
 
     # a buffer like
-    return read(path_or_buf)
+    return read(_unpack_aligned(path_or_buf))
 
 dtype_dict = {21: np.dtype('M8[ns]'),
               u('datetime64[ns]'): np.dtype('M8[ns]'),
@@ -210,6 +279,9 @@ def convert(values):
     if dtype == np.object_:
         return v.tolist()
 
+    if aligned_buffers is not None:
+        return _add_aligned_buffer(v)
+
     if compressor == 'zlib':
 
         # return string arrays like they are
@@ -217,8 +289,7 @@ def convert(values):
             return v.tolist()
 
         # convert to a bytes array
-        v = v.tostring()
-        return zlib.compress(v)
+        return _compress(zlib.compress, v)
 
     elif compressor == 'blosc' and _BLOSC:
 
@@ -227,8 +298,8 @@ def convert(values):
             return v.tolist()
 
         # convert to a bytes array
-        v = v.tostring()
-        return blosc.compress(v, typesize=dtype.itemsize)
+        return _compress(lambda b: blosc.compress(b, typesize=dtype.itemsize),
+                         v)
 
     # ndarray (on original dtype)
     return v.tostring()
@@ -239,9 +310,16 @@ def unconvert(values, dtype, compress=None):
     if dtype == np.object_:
         return np.array(values, dtype=object)
 
+    if isinstance(values, dict) and values.get('typ') == 'aligned_buffer':
+        if aligned_source is None:
+            raise ValueError("cannot resolve an aligned buffer outside of "
+                             "its data section")
+        return aligned_source(values['offset'], values['nbytes'],
+                              np.dtype(dtype))
+
     if compress == 'zlib':
 
-        values = zlib.decompress(values)
+        values = _decompress(zlib.decompress, values)
         return np.frombuffer(values, dtype=dtype)
 
     elif compress == 'blosc':
@@ -250,7 +328,7 @@ def unconvert(values, dtype, compress=None):
             raise Exception("cannot uncompress w/o blosc")
 
         # decompress
-        values = blosc.decompress(values)
+        values = _decompress(blosc.decompress, values)
 
         return np.frombuffer(values, dtype=dtype)
 
@@ -258,6 +336,178 @@ def unconvert(values, dtype, compress=None):
     return np.fromstring(values.encode('latin1'), dtype=dtype)
 
 
+@contextmanager
+def _compress_threads(nthreads):
+    """ (de)compress the buffers on a pool of nthreads within the block """
+    global compress_pool
+    if nthreads is None or nthreads <= 1:
+        yield
+        return
+
+    previous, compress_pool = compress_pool, ThreadPool(nthreads)
+    try:
+        yield
+    finally:
+        compress_pool.close()
+        compress_pool.join()
+        compress_pool = previous
+
+
+def _compress(f, v):
+    """
+    compress the 1-d values with f; with a thread pool, large values are
+    compressed as a list of chunks
+    """
+    if compress_pool is None or v.nbytes <= _COMPRESS_CHUNKSIZE:
+        return f(v.tostring())
+
+    # whole items per chunk
+    step = max(_COMPRESS_CHUNKSIZE // v.dtype.itemsize, 1)
+    chunks = [v[i:i + step] for i in range(0, len(v), step)]
+    return compress_pool.map(lambda c: f(c.tostring()), chunks)
+
+
+def _decompress(f, values):
+    """ decompress values with f, either a single blob or a list of chunks """
+
+    # the raw bytes are unpacked as latin1 text
+    def g(c):
+        if isinstance(c, compat.text_type):
+            c = c.encode('latin1')
+        return f(c)
+
+    if not isinstance(values, (list, tuple)):
+        return g(values)
+
+    if compress_pool is None:
+        chunks = [g(c) for c in values]
+    else:
+        chunks = compress_pool.map(g, values)
+    return b''.join(chunks)
+
+
+def _align(nbytes):
+    """ round nbytes up to a multiple of the alignment """
+    return -(-nbytes // _ALIGNMENT) * _ALIGNMENT
+
+
+def _add_aligned_buffer(v):
+    """
+    queue the 1-d values to be written in the data section of the object
+    being packed, returning a reference to their offset in it
+    """
+    offset = 0
+    if aligned_buffers:
+        last_offset, last = aligned_buffers[-1]
+        offset = _align(last_offset + last.nbytes)
+    aligned_buffers.append((offset, np.ascontiguousarray(v)))
+    return {'typ': 'aligned_buffer',
+            'offset': offset,
+            'nbytes': v.nbytes}
+
+
+def _pack_aligned(obj, fh, **kwargs):
+    """
+    write obj to fh in the aligned layout: a small 'aligned' map giving the
+    sizes of what follows, the packed object (with its numeric buffers
+    replaced by references), padding up to the alignment and the data
+    section holding the buffers
+    """
+    global aligned_buffers
+    aligned_buffers = []
+    try:
+        header = pack(obj, **kwargs)
+        buffers = aligned_buffers
+    finally:
+        aligned_buffers = None
+
+    nbytes = 0
+    if buffers:
+        offset, last = buffers[-1]
+        nbytes = offset + last.nbytes
+
+    try:
+        start = fh.tell()
+    except (AttributeError, IOError, ValueError):
+        start = 0
+
+    # the padding is less than the alignment, so is packed in a single byte
+    # whatever its value
+    prefix = {'typ': 'aligned', 'header': len(header), 'nbytes': nbytes,
+              'pad': 0}
+    end = start + len(pack(prefix, **kwargs)) + len(header)
+    prefix['pad'] = _align(end) - end
+
+    fh.write(pack(prefix, **kwargs))
+    fh.write(header)
+    fh.write(b'\0' * prefix['pad'])
+
+    pos = 0
+    for offset, v in buffers:
+        fh.write(b'\0' * (offset - pos))
+        fh.write(v.data)
+        pos = offset + v.nbytes
+
+
+def _unpack_aligned(fh, mm=None):
+    """
+    iterate over the objects packed in fh, resolving the buffers of those
+    written in the aligned layout; if mm (a memory map of the whole of fh)
+    is passed, these are views onto it, otherwise copies read from fh
+    """
+    global aligned_source
+
+    unpacker = unpack(fh)
+    pos = 0
+    while True:
+
+        # with a map, track the position of the objects in it
+        nread = [0]
+
+        def count(b):
+            nread[0] += len(b)
+
+        try:
+            obj = unpacker.unpack(write_bytes=count if mm is not None
+                                  else None)
+        except OutOfData:
+            return
+        pos += nread[0]
+
+        if not (isinstance(obj, dict) and obj.get('typ') == 'aligned'):
+            yield obj
+            continue
+
+        header = unpacker.read_bytes(obj['header'])
+        if mm is not None:
+            data, base = mm, pos + obj['header'] + obj['pad']
+
+            # skip the data section without reading it
+            pos = base + obj['nbytes']
+            fh.seek(pos)
+            unpacker = unpack(fh)
+        else:
+            data = unpacker.read_bytes(obj['pad'] + obj['nbytes'])
+            base = obj['pad']
+
+        def source(offset, nbytes, dtype):
+            if not nbytes:
+                return np.empty(0, dtype=dtype)
+            values = np.frombuffer(data, dtype=dtype,
+                                   count=nbytes // dtype.itemsize,
+                                   offset=base + offset)
+            if mm is None:
+                values = values.copy()
+            return values
+
+        aligned_source = source
+        try:
+            result = next(iter(unpack(compat.BytesIO(header))))
+        finally:
+            aligned_source = None
+        yield result
+
+
 def encode(obj):
     """
     Data encoder
@@ -609,6 +859,7 @@ class Iterator(object):
 
         needs_closing = True
         try:
+            nthreads = self.kwargs.get('nthreads', 1)
 
             # see if we have an actual file
             if isinstance(self.path, compat.string_types):
@@ -634,9 +885,9 @@ class Iterator(object):
                     needs_closing = False
                     fh = self.path
 
-            unpacker = unpack(fh)
-            for o in unpacker:
-                yield o
+            with _compress_threads(nthreads):
+                for o in _unpack_aligned(fh):
+                    yield o
         finally:
             if needs_closing:
                 fh.close()
@@ -4,9 +4,11 @@ Module contains tools for processing files into DataFrames or other objects
 from __future__ import print_function
 from pandas.compat import range, lrange, StringIO, lzip, zip, string_types, map
 from pandas import compat
+import os
 import re
 import csv
 import warnings
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
@@ -116,6 +118,13 @@ comment : str, default None
     result in '1,2,3' being treated as the header.
 decimal : str, default '.'
     Character to recognize as decimal point. E.g. use ',' for European data
+nthreads : int, default 1
+    Number of threads used to tokenize and convert a local, uncompressed file
+    with the C parser. The file is split into newline-aligned byte ranges
+    that are parsed concurrently, so quoted fields must not contain embedded
+    line terminators. Ignored for other inputs and when ``skiprows`` or
+    ``memory_map`` is given. Cannot be combined with ``nrows``, ``chunksize``
+    or ``iterator``.
 nrows : int, default None
     Number of rows of file to read. Useful for reading pieces of large files
 iterator : boolean, default False
@@ -135,6 +144,10 @@ encoding : string, default None
     Encoding to use for UTF when reading/writing (ex. 'utf-8')
 squeeze : boolean, default False
     If the parsed data only contains one column then return a Series
+downcast : boolean, default False
+    Shrink the parsed columns to the smallest dtypes that hold them, see
+    ``DataFrame.downcast``. When iterating, each chunk is downcast on its
+    own, so the dtypes of the chunks may differ
 na_filter : boolean, default True
     Detect missing value markers (empty strings and the value of na_values). In
     data without any NAs, passing na_filter=False can improve the performance
@@ -230,6 +243,11 @@ def _read(filepath_or_buffer, kwds):
     nrows = kwds.pop('nrows', None)
     chunksize = kwds.get('chunksize', None)
 
+    if kwds.get('nthreads', 1) > 1 and (nrows is not None or chunksize or
+                                        iterator):
+        raise ValueError("'nthreads' can only be used to read the whole "
+                         "file at once")
+
     # Create the parser.
     parser = TextFileReader(filepath_or_buffer, **kwds)
 
@@ -282,6 +300,7 @@ _parser_defaults = {
     'verbose': False,
     'encoding': None,
     'squeeze': False,
+    'downcast': False,
     'compression': None,
     'mangle_dupe_cols': True,
     'tupleize_cols': False,
@@ -301,7 +320,8 @@ _c_parser_defaults = {
     'error_bad_lines': True,
     'warn_bad_lines': True,
     'dtype': None,
-    'decimal': b'.'
+    'decimal': b'.',
+    'nthreads': 1
 }
 
 _fwf_defaults = {
@@ -367,6 +387,7 @@ def _make_parser_function(name, sep=','):
                  date_parser=None,
 
                  memory_map=False,
+                 nthreads=1,
                  nrows=None,
                  iterator=False,
                  chunksize=None,
@@ -374,6 +395,7 @@ def _make_parser_function(name, sep=','):
                  verbose=False,
                  encoding=None,
                  squeeze=False,
+                 downcast=False,
                  mangle_dupe_cols=True,
                  tupleize_cols=False,
                  infer_datetime_format=False):
@@ -434,7 +456,9 @@ def _make_parser_function(name, sep=','):
                     verbose=verbose,
                     encoding=encoding,
                     squeeze=squeeze,
+                    downcast=downcast,
                     memory_map=memory_map,
+                    nthreads=nthreads,
 
                     na_filter=na_filter,
                     compact_ints=compact_ints,
@@ -533,6 +557,7 @@ class TextFileReader(object):
 
         self.chunksize = options.pop('chunksize', None)
         self.squeeze = options.pop('squeeze', False)
+        self.downcast = options.pop('downcast', False)
 
         # might mutate self.engine
         self.options, self.engine = self._clean_options(options, engine)
@@ -702,6 +727,9 @@ class TextFileReader(object):
 
         df = DataFrame(col_dict, columns=columns, index=index)
 
+        if self.downcast:
+            df = df.downcast(copy=False)
+
         if self.squeeze and len(df.columns) == 1:
             return df[df.columns[0]]
         return df
@@ -1029,6 +1057,8 @@ class CParserWrapper(ParserBase):
         self.as_recarray = kwds.get('as_recarray', False)
         ParserBase.__init__(self, kwds)
 
+        nthreads = kwds.pop('nthreads', 1)
+
         if 'utf-16' in (kwds.get('encoding') or ''):
             if isinstance(src, compat.string_types):
                 src = open(src, 'rb')
@@ -1038,6 +1068,18 @@ class CParserWrapper(ParserBase):
         # #2442
         kwds['allow_leading_cols'] = self.index_col is not False
 
+        # byte ranges of the file left to the worker threads; the first
+        # range is read by self._reader, which also parses the header
+        self._ranges = []
+        if nthreads > 1 and self._can_read_parallel(src, kwds):
+            ranges = _split_file_on_lines(src, nthreads,
+                                          kwds.get('lineterminator'))
+            if len(ranges) > 1:
+                self._path = src
+                self._ranges = ranges[1:]
+                src = self._first_range = _FileRange(src, *ranges[0])
+
+        self._reader_kwds = kwds
         self._reader = _parser.TextReader(src, **kwds)
 
         # XXX
@@ -1129,14 +1171,76 @@ class CParserWrapper(ParserBase):
 
     def set_error_bad_lines(self, status):
         self._reader.set_error_bad_lines(int(status))
+        self._reader_kwds['error_bad_lines'] = bool(status)
+
+    def _can_read_parallel(self, src, kwds):
+        return (isinstance(src, compat.string_types) and
+                os.path.isfile(src) and
+                not kwds.get('compression') and
+                not kwds.get('memory_map') and
+                not kwds.get('skiprows') and
+                not self.as_recarray)
+
+    def _make_range_reader(self, source):
+        # the header was already parsed from the first range, so the other
+        # ranges are pure data and take the column layout from self._reader
+        kwds = dict(self._reader_kwds, header=None, names=None,
+                    skiprows=None)
+        reader = _parser.TextReader(source, **kwds)
+        reader.header = self._reader.header
+        reader.table_width = self._reader.table_width
+        reader.leading_cols = self._reader.leading_cols
+        reader.noconvert = set(self._reader.noconvert)
+        return reader
+
+    def _read_parallel(self):
+        ranges, self._ranges = self._ranges, []
+
+        def _read_range(reader):
+            try:
+                return reader.read()
+            except StopIteration:
+                return None
+
+        # the range sources are closed even if a reader raises
+        sources = [self._first_range]
+        pool = None
+        try:
+            readers = [self._reader]
+            for start, end in ranges:
+                sources.append(_FileRange(self._path, start, end))
+                readers.append(self._make_range_reader(sources[-1]))
+
+            pool = ThreadPool(len(readers))
+            chunks = pool.map(_read_range, readers)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            for source in sources:
+                source.close()
+
+        chunks = [chunk for chunk in chunks if chunk is not None]
+        if not chunks:
+            raise StopIteration
+
+        # destructive to chunks
+        return _parser._concatenate_chunks(chunks)
 
     def read(self, nrows=None):
         if self.as_recarray:
             # what to do if there are leading columns?
             return self._reader.read(nrows)
 
+        if self._ranges and nrows is not None:
+            raise ValueError("'nthreads' can only be used to read the "
+                             "whole file at once")
+
         try:
-            data = self._reader.read(nrows)
+            if self._ranges:
+                data = self._read_parallel()
+            else:
+                data = self._reader.read(nrows)
         except StopIteration:
             if nrows is None:
                 return None, self.names, {}
@@ -1219,6 +1323,72 @@ class CParserWrapper(ParserBase):
         return values
 
 
+class _FileRange(object):
+    """
+    Read-only file-like object over the bytes [start, end) of a file
+    """
+
+    def __init__(self, path, start, end):
+        self._f = open(path, 'rb')
+        self._f.seek(start)
+        self._remaining = end - start
+
+    def read(self, size=-1):
+        if self._remaining <= 0:
+            self.close()
+            return b''
+
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+
+        data = self._f.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def close(self):
+        self._f.close()
+
+
+# ranges smaller than this are not worth a thread
+_MIN_RANGE_BYTES = 1 << 20
+
+
+def _split_file_on_lines(path, nranges, lineterminator=None):
+    """
+    Split the file at path into at most nranges contiguous (start, end) byte
+    ranges, each of which ends just after a line terminator (or at EOF)
+    """
+    terminator = lineterminator or '\n'
+    if not isinstance(terminator, bytes):
+        terminator = terminator.encode('ascii')
+
+    size = os.path.getsize(path)
+    step = max(size // nranges, _MIN_RANGE_BYTES)
+
+    bounds = [0]
+    with open(path, 'rb') as f:
+        pos = step
+        while pos < size:
+            f.seek(pos)
+            while True:
+                block = f.read(1 << 16)
+                if not block:
+                    pos = size
+                    break
+                idx = block.find(terminator)
+                if idx >= 0:
+                    pos += idx + 1
+                    break
+                pos += len(block)
+
+            if pos < size:
+                bounds.append(pos)
+            pos += step
+
+    bounds.append(size)
+    return lzip(bounds[:-1], bounds[1:])
+
+
 def TextParser(*args, **kwds):
     """
     Converts lists of lists/tuples into DataFrames with proper type inference
@@ -11,6 +11,9 @@ import copy
 import itertools
 import warnings
 import os
+import threading
+from collections import namedtuple, OrderedDict
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 from pandas import (Series, TimeSeries, DataFrame, Panel, Panel4D, Index,
@@ -33,7 +36,7 @@ from pandas import compat
 from pandas.compat import u_safe as u, PY3, range, lrange, string_types, filter
 from pandas.io.common import PerformanceWarning
 from pandas.core.config import get_option
-from pandas.computation.pytables import Expr, maybe_expression
+from pandas.computation.pytables import Expr, Query, maybe_expression
 
 import pandas.lib as lib
 import pandas.algos as algos
@@ -102,10 +105,30 @@ def _ensure_term(where, scope_level):
     return where
 
 
+# HDF5 (and so PyTables) is not thread-safe; concurrent reads hold this
+# lock while touching the file and only overlap the conversions
+_hdf5_lock = threading.RLock()
+
+
+def _map_threads(f, values, nthreads):
+    """ map f over values, on a pool of at most nthreads threads """
+    if nthreads is None or nthreads <= 1 or len(values) <= 1:
+        return [f(v) for v in values]
+    pool = ThreadPool(min(nthreads, len(values)))
+    try:
+        return pool.map(f, values)
+    finally:
+        pool.close()
+        pool.join()
+
+
 class PossibleDataLossError(Exception):
     pass
 
 
+_CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
 class ClosedFileError(Exception):
     pass
 
@@ -317,6 +340,11 @@ def read_hdf(path_or_buf, key, **kwargs):
         chunksize : optional, nrows to include in iteration, return an iterator
         auto_close : optional, boolean, should automatically close the store
             when finished, default is False
+        downcast : optional, boolean, shrink the columns of a selected
+            DataFrame (or of each chunk) to the smallest dtypes that hold
+            them, see ``DataFrame.downcast``, default is False
+        query : optional, a ``DataFrame.query`` expression to filter a table
+            with, see ``HDFStore.select``
 
         Returns
         -------
@@ -327,6 +355,8 @@ def read_hdf(path_or_buf, key, **kwargs):
     # grab the scope
     if 'where' in kwargs:
         kwargs['where'] = _ensure_term(kwargs['where'], scope_level=1)
+    if isinstance(kwargs.get('query'), string_types):
+        kwargs['query'] = Query(kwargs['query'], scope_level=1)
 
     f = lambda store, auto_close: store.select(
         key, auto_close=auto_close, **kwargs)
@@ -382,6 +412,12 @@ class HDFStore(StringMixin):
             in the store wherever possible
     fletcher32 : bool, default False
             If applying compression use the fletcher32 checksum
+    cache_size : int, default 0
+            Keep the results of up to this many calls to ``select`` in a
+            least recently used cache, keyed by the node, the where
+            condition, columns, start and stop, and invalidated when the
+            node is written to or removed through this store (see
+            ``cache_info``). 0 disables the cache
 
     Examples
     --------
@@ -395,7 +431,7 @@ class HDFStore(StringMixin):
     """
 
     def __init__(self, path, mode=None, complevel=None, complib=None,
-                 fletcher32=False, **kwargs):
+                 fletcher32=False, cache_size=0, **kwargs):
         try:
             import tables
         except ImportError:  # pragma: no cover
@@ -410,6 +446,10 @@ class HDFStore(StringMixin):
         self._complib = complib
         self._fletcher32 = fletcher32
         self._filters = None
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
         self.open(mode=mode, **kwargs)
 
     @property
@@ -578,6 +618,60 @@ class HDFStore(StringMixin):
         if self._handle is not None:
             self._handle.close()
         self._handle = None
+        self._cache.clear()
+
+    def cache_info(self):
+        """
+        Report the statistics of the select cache
+
+        Returns
+        -------
+        info : namedtuple with the hits, misses, maxsize and currsize of the
+            cache
+        """
+        return _CacheInfo(self._cache_hits, self._cache_misses,
+                          self._cache_size, len(self._cache))
+
+    def clear_cache(self):
+        """ empty the select cache and reset its statistics """
+        self._cache.clear()
+        self._cache_hits = self._cache_misses = 0
+
+    def _select_cache_key(self, s, where, start, stop, columns, **kwargs):
+        """
+        return the key of a selection in the select cache, or None if it
+        cannot be cached; the where is normalized to the numexpr condition
+        it evaluates to, so that it captures the values of the variables it
+        refers to
+        """
+        if where is not None:
+            if not s.is_table or isinstance(where, np.ndarray):
+                return None
+            try:
+                terms = Expr(where, queryables=s.queryables(),
+                             encoding=s.encoding)
+                condition, filter = terms.evaluate()
+            except Exception:
+                return None
+
+            # filters are applied in memory with functions of the values
+            if filter is not None:
+                return None
+            where = condition.format() if condition is not None else None
+
+        if com.is_list_like(columns):
+            columns = tuple(columns)
+        return (s.group._v_pathname, where, columns, start, stop,
+                tuple(sorted(kwargs.items())))
+
+    def _invalidate_cache(self, key):
+        """ drop the cached selections of the node key and its children """
+        if not self._cache:
+            return
+        path = '/' + key.strip('/')
+        for k in list(self._cache):
+            if k[0] == path or k[0].startswith(path + '/'):
+                del self._cache[k]
 
     @property
     def is_open(self):
@@ -630,7 +724,8 @@ class HDFStore(StringMixin):
         return self._read_group(group)
 
     def select(self, key, where=None, start=None, stop=None, columns=None,
-               iterator=False, chunksize=None, auto_close=False, **kwargs):
+               iterator=False, chunksize=None, auto_close=False,
+               downcast=False, query=None, **kwargs):
         """
         Retrieve pandas object stored in file, optionally based on where
         criteria
@@ -647,33 +742,136 @@ class HDFStore(StringMixin):
         chunksize : nrows to include in iteration, return an iterator
         auto_close : boolean, should automatically close the store when
             finished, default is False
+        downcast : boolean, shrink the columns of a selected DataFrame (or
+            of each chunk) to the smallest dtypes that hold them, see
+            ``DataFrame.downcast``, default is False
+        query : a ``DataFrame.query`` expression (or Query) to filter a table
+            with, the parts of it comparing the index or data columns with
+            values are evaluated by PyTables while reading, the rest on the
+            selected rows, optional
 
         Returns
         -------
         The selected object
 
         """
-        group = self.get_node(key)
-        if group is None:
-            raise KeyError('No object named %s in the file' % key)
+        where = _ensure_term(where, scope_level=1)
+        if query is not None and not isinstance(query, Query):
+            query = Query(query, scope_level=1)
 
         # create the storer and axes
-        where = _ensure_term(where, scope_level=1)
-        s = self._create_storer(group)
-        s.infer_axes()
+        with _hdf5_lock:
+            group = self.get_node(key)
+            if group is None:
+                raise KeyError('No object named %s in the file' % key)
+            s = self._create_storer(group)
+            s.infer_axes()
+
+            residual = None
+            if query is not None:
+                if not s.is_table:
+                    raise TypeError("can only query a table, not a fixed "
+                                    "format [%s]" % s.pathname)
+                condition, residual = query.split(s.queryables())
+                if isinstance(where, (np.ndarray, Index)):
+                    # coordinates are selected as is, filter them in memory
+                    residual = query.expr
+                elif condition is not None:
+                    if where is None:
+                        where = condition
+                    elif isinstance(where, list):
+                        where = where + [condition]
+                    else:
+                        where = [where, condition]
+
+            cache_key = None
+            if self._cache_size > 0 and not (iterator or chunksize or kwargs
+                                             or residual):
+                cache_key = self._select_cache_key(s, where, start, stop,
+                                                   columns, downcast=downcast)
+            if cache_key is not None:
+                if cache_key in self._cache:
+                    self._cache_hits += 1
+                    result = self._cache.pop(cache_key)
+                    self._cache[cache_key] = result
+                    if auto_close:
+                        self.close()
+
+                    # the cached object is kept away from the caller
+                    return result.copy()
+                self._cache_misses += 1
 
         # function to call on iteration
         def func(_start, _stop, _where):
-            return s.read(start=_start, stop=_stop,
-                          where=_where,
-                          columns=columns, **kwargs)
+            if s.is_table:
+                # tables take the lock themselves around the selection
+                result = s.read(start=_start, stop=_stop,
+                                where=_where,
+                                columns=columns, **kwargs)
+            else:
+                with _hdf5_lock:
+                    result = s.read(start=_start, stop=_stop,
+                                    where=_where,
+                                    columns=columns, **kwargs)
+            if residual is not None:
+                result = query.filter(result, residual)
+            if (downcast and isinstance(result, DataFrame) and
+                    not isinstance(result, SparseDataFrame)):
+                result = result.downcast(copy=False)
+            return result
 
         # create the iterator
         it = TableIterator(self, s, func, where=where, nrows=s.nrows, start=start,
                            stop=stop, iterator=iterator, chunksize=chunksize,
                            auto_close=auto_close)
 
-        return it.get_result()
+        result = it.get_result()
+        if cache_key is not None and not auto_close:
+            with _hdf5_lock:
+                self._cache[cache_key] = result.copy()
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def select_many(self, keys, where=None, start=None, stop=None,
+                    columns=None, downcast=False, nthreads=1, **kwargs):
+        """
+        Retrieve several pandas objects stored in file, each selected with the
+        same where criteria
+
+        Parameters
+        ----------
+        keys : a list of the keys to select
+        where : list of Term (or convertable) objects, optional
+        start : integer (defaults to None), row number to start selection
+        stop  : integer (defaults to None), row number to stop selection
+        columns : a list of columns that if not None, will limit the return
+            columns
+        downcast : boolean, shrink the columns of each selected DataFrame to
+            the smallest dtypes that hold them, default is False
+        nthreads : int, default 1
+            number of threads used to convert the selections; reading the
+            file itself is serialized as HDF5 is not thread-safe
+
+        Returns
+        -------
+        a list of the selected objects, in the order of keys
+
+        Exceptions
+        ----------
+        raises TypeError if keys is not a list or tuple
+        raises KeyError if any of the keys is not found
+        """
+        if not isinstance(keys, (list, tuple)):
+            raise TypeError("keys must be a list/tuple")
+
+        where = _ensure_term(where, scope_level=1)
+
+        def _select(key):
+            return self.select(key, where=where, start=start, stop=stop,
+                               columns=columns, downcast=downcast, **kwargs)
+
+        return _map_threads(_select, list(keys), nthreads)
 
     def select_as_coordinates(
             self, key, where=None, start=None, stop=None, **kwargs):
@@ -713,7 +911,8 @@ class HDFStore(StringMixin):
 
     def select_as_multiple(self, keys, where=None, selector=None, columns=None,
                            start=None, stop=None, iterator=False,
-                           chunksize=None, auto_close=False, **kwargs):
+                           chunksize=None, auto_close=False, nthreads=1,
+                           **kwargs):
         """ Retrieve pandas objects from multiple tables
 
         Parameters
@@ -726,6 +925,10 @@ class HDFStore(StringMixin):
         stop  : integer (defaults to None), row number to stop selection
         iterator : boolean, return an iterator, default False
         chunksize : nrows to include in iteration, return an iterator
+        nthreads : int, default 1
+            number of threads used to read the tables; reading the file
+            itself is serialized as HDF5 is not thread-safe, the conversion
+            of the selected rows runs concurrently
 
         Exceptions
         ----------
@@ -779,7 +982,9 @@ class HDFStore(StringMixin):
         def func(_start, _stop, _where):
 
             # retrieve the objs, _where is always passed as a set of coordinates here
-            objs = [t.read(where=_where, columns=columns, **kwargs) for t in tbls]
+            objs = _map_threads(
+                lambda t: t.read(where=_where, columns=columns, **kwargs),
+                tbls, nthreads)
 
             # concat and return
             return concat(objs, axis=axis,
@@ -842,6 +1047,7 @@ class HDFStore(StringMixin):
 
         """
         where = _ensure_term(where, scope_level=1)
+        self._invalidate_cache(key)
         try:
             s = self.get_storer(key)
         except:
@@ -1219,6 +1425,7 @@ class HDFStore(StringMixin):
 
     def _write_to_group(self, key, value, format, index=True, append=False,
                         complib=None, encoding=None, **kwargs):
+        self._invalidate_cache(key)
         group = self.get_node(key)
 
         # remove the node if we are not appending
@@ -3071,16 +3278,18 @@ class Table(Fixed):
         for success
         """
 
-        # validate the version
-        self.validate_version(where)
+        with _hdf5_lock:
 
-        # infer the data kind
-        if not self.infer_axes():
-            return False
+            # validate the version
+            self.validate_version(where)
 
-        # create the selection
-        self.selection = Selection(self, where=where, **kwargs)
-        values = self.selection.select()
+            # infer the data kind
+            if not self.infer_axes():
+                return False
+
+            # create the selection
+            self.selection = Selection(self, where=where, **kwargs)
+            values = self.selection.select()
 
         # convert the data
         for a in self.axes:
@@ -108,6 +108,46 @@ def _parse_date_columns(data_frame, parse_dates):
     return data_frame
 
 
+def _wrap_result(data, columns, index_col=None, coerce_float=True,
+                 parse_dates=None):
+    """Wrap result set of query in a DataFrame """
+
+    frame = DataFrame.from_records(data, columns=columns,
+                                   coerce_float=coerce_float)
+
+    _parse_date_columns(frame, parse_dates)
+
+    if index_col is not None:
+        frame.set_index(index_col, inplace=True)
+
+    return frame
+
+
+def _query_iterator(cursor, chunksize, columns, index_col=None,
+                    coerce_float=True, parse_dates=None):
+    """Return generator of DataFrames through chunked result set"""
+
+    try:
+        while True:
+            data = cursor.fetchmany(chunksize)
+            if not data:
+                break
+            if not isinstance(data, list):
+                data = list(data)
+            yield _wrap_result(data, columns, index_col=index_col,
+                               coerce_float=coerce_float,
+                               parse_dates=parse_dates)
+    finally:
+        cursor.close()
+
+
+def _downcast_result(result, chunksize=None):
+    """Downcast a DataFrame, or each DataFrame of a chunked result"""
+    if chunksize is not None:
+        return (frame.downcast(copy=False) for frame in result)
+    return result.downcast(copy=False)
+
+
 def execute(sql, con, cur=None, params=None):
     """
     Execute the given SQL query using the provided connection object.
@@ -254,7 +294,8 @@ def uquery(sql, con=None, cur=None, retry=True, params=None):
 #--- Read and write to DataFrames
 
 def read_sql_table(table_name, con, index_col=None, coerce_float=True,
-                   parse_dates=None, columns=None):
+                   parse_dates=None, columns=None, chunksize=None,
+                   downcast=False):
     """Read SQL database table into a DataFrame.
 
     Given a table name and an SQLAlchemy engine, returns a DataFrame.
@@ -282,6 +323,13 @@ def read_sql_table(table_name, con, index_col=None, coerce_float=True,
           such as SQLite
     columns : list
         List of column names to select from sql table
+    chunksize : int, default None
+        If specified, return an iterator where `chunksize` is the number of
+        rows to include in each chunk.
+    downcast : boolean, default False
+        Shrink the columns to the smallest dtypes that hold them, see
+        ``DataFrame.downcast``; with `chunksize` each chunk is downcast
+        on its own.
 
     Returns
     -------
@@ -307,16 +355,17 @@ def read_sql_table(table_name, con, index_col=None, coerce_float=True,
     pandas_sql = PandasSQLAlchemy(con, meta=meta)
     table = pandas_sql.read_table(
         table_name, index_col=index_col, coerce_float=coerce_float,
-        parse_dates=parse_dates, columns=columns)
+        parse_dates=parse_dates, columns=columns, chunksize=chunksize)
 
-    if table is not None:
-        return table
-    else:
+    if table is None:
         raise ValueError("Table %s not found" % table_name, con)
+    if downcast:
+        table = _downcast_result(table, chunksize)
+    return table
 
 
 def read_sql_query(sql, con, index_col=None, coerce_float=True, params=None,
-                   parse_dates=None):
+                   parse_dates=None, chunksize=None, downcast=False):
     """Read SQL query into a DataFrame.
 
     Returns a DataFrame corresponding to the result set of the query
@@ -347,6 +396,13 @@ def read_sql_query(sql, con, index_col=None, coerce_float=True, params=None,
           to the keyword arguments of :func:`pandas.to_datetime`
           Especially useful with databases without native Datetime support,
           such as SQLite
+    chunksize : int, default None
+        If specified, return an iterator where `chunksize` is the number of
+        rows to include in each chunk.
+    downcast : boolean, default False
+        Shrink the columns to the smallest dtypes that hold them, see
+        ``DataFrame.downcast``; with `chunksize` each chunk is downcast
+        on its own.
 
     Returns
     -------
@@ -359,13 +415,16 @@ def read_sql_query(sql, con, index_col=None, coerce_float=True, params=None,
 
     """
     pandas_sql = pandasSQL_builder(con)
-    return pandas_sql.read_sql(
+    result = pandas_sql.read_sql(
         sql, index_col=index_col, params=params, coerce_float=coerce_float,
-        parse_dates=parse_dates)
+        parse_dates=parse_dates, chunksize=chunksize)
+    if downcast:
+        result = _downcast_result(result, chunksize)
+    return result
 
 
 def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
-             parse_dates=None, columns=None):
+             parse_dates=None, columns=None, chunksize=None, downcast=False):
     """
     Read SQL query or database table into a DataFrame.
 
@@ -396,6 +455,13 @@ def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
     columns : list
         List of column names to select from sql table (only used when reading
         a table).
+    chunksize : int, default None
+        If specified, return an iterator where `chunksize` is the number of
+        rows to include in each chunk.
+    downcast : boolean, default False
+        Shrink the columns to the smallest dtypes that hold them, see
+        ``DataFrame.downcast``; with `chunksize` each chunk is downcast
+        on its own.
 
     Returns
     -------
@@ -417,28 +483,31 @@ def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
     pandas_sql = pandasSQL_builder(con)
 
     if isinstance(pandas_sql, PandasSQLLegacy):
-        return pandas_sql.read_sql(
-            sql, index_col=index_col, params=params,
-            coerce_float=coerce_float, parse_dates=parse_dates)
-
-    try:
-        _is_table_name = pandas_sql.has_table(sql)
-    except:
         _is_table_name = False
+    else:
+        try:
+            _is_table_name = pandas_sql.has_table(sql)
+        except:
+            _is_table_name = False
 
     if _is_table_name:
         pandas_sql.meta.reflect(only=[sql])
-        return pandas_sql.read_table(
+        result = pandas_sql.read_table(
             sql, index_col=index_col, coerce_float=coerce_float,
-            parse_dates=parse_dates, columns=columns)
+            parse_dates=parse_dates, columns=columns, chunksize=chunksize)
     else:
-        return pandas_sql.read_sql(
+        result = pandas_sql.read_sql(
             sql, index_col=index_col, params=params,
-            coerce_float=coerce_float, parse_dates=parse_dates)
+            coerce_float=coerce_float, parse_dates=parse_dates,
+            chunksize=chunksize)
+
+    if downcast:
+        result = _downcast_result(result, chunksize)
+    return result
 
 
 def to_sql(frame, name, con, flavor='sqlite', if_exists='fail', index=True,
-           index_label=None, chunksize=None):
+           index_label=None, chunksize=None, method=None):
     """
     Write records stored in a DataFrame to a SQL database.
 
@@ -468,11 +537,24 @@ def to_sql(frame, name, con, flavor='sqlite', if_exists='fail', index=True,
     chunksize : int, default None
         If not None, then rows will be written in batches of this size at a 
         time.  If None, all rows will be written at once.
+    method : {None, 'multi'}, default None
+        Controls the SQL insertion clause used:
+
+        - None : one ``INSERT`` statement per row, passed to the driver's
+          ``executemany``.
+        - 'multi' : multi-row ``INSERT ... VALUES (...), (...), ...``
+          statements, each holding as many rows as the database's limit on
+          bound parameters allows. This is usually much faster for
+          databases (like sqlite) where ``executemany`` costs a round trip
+          per row.
 
     """
     if if_exists not in ('fail', 'replace', 'append'):
         raise ValueError("'{0}' is not valid for if_exists".format(if_exists))
 
+    if method not in (None, 'multi'):
+        raise ValueError("'{0}' is not valid for method".format(method))
+
     pandas_sql = pandasSQL_builder(con, flavor=flavor)
 
     if isinstance(frame, Series):
@@ -481,7 +563,8 @@ def to_sql(frame, name, con, flavor='sqlite', if_exists='fail', index=True,
         raise NotImplementedError
 
     pandas_sql.to_sql(frame, name, if_exists=if_exists, index=index,
-                      index_label=index_label, chunksize=chunksize)
+                      index_label=index_label, chunksize=chunksize,
+                      method=method)
 
 
 def has_table(table_name, con, flavor='sqlite'):
@@ -586,13 +669,12 @@ class PandasSQLTable(PandasObject):
     def insert_statement(self):
         return self.table.insert()
 
-    def maybe_asscalar(self, i):
-        try:
-            return np.asscalar(i)
-        except AttributeError:
-            return i
-
     def insert_data(self):
+        """
+        Return the column names and a list of object arrays, one per column,
+        holding native Python values (None for missing values).
+        The conversion is done block-wise instead of per row.
+        """
         if self.index is not None:
             temp = self.frame.copy()
             temp.index.names = self.index
@@ -604,34 +686,102 @@ class PandasSQLTable(PandasObject):
         else:
             temp = self.frame
 
-        return temp
+        column_names = list(map(str, temp.columns))
+        data_list = [None] * len(column_names)
 
-    def insert(self, chunksize=None):
+        for b in temp._data.blocks:
+            if b.is_datetime:
+                # microsecond resolution converts to datetime.datetime
+                d = b.values.astype('M8[us]').astype(object)
+            elif b.is_timedelta:
+                # written as integer values (ns frequency)
+                d = b.values.view('i8').astype(object)
+            else:
+                d = np.array(b.values, dtype=object)
 
-        ins = self.insert_statement()
-        temp = self.insert_data()
-        keys = list(map(str, temp.columns))
+            if b._can_hold_na:
+                d[com.isnull(b.values)] = None
 
-        nrows = len(temp)
-        if chunksize is None: 
+            for col_loc, col in zip(b.mgr_locs, d):
+                data_list[col_loc] = col
+
+        return column_names, data_list
+
+    def _max_params(self):
+        return _MAX_INSERT_PARAMS.get(self.pd_sql.engine.dialect.name,
+                                      _DEFAULT_MAX_INSERT_PARAMS)
+
+    def _execute_insert(self, conn, keys, data_iter):
+        data = [dict(zip(keys, row)) for row in data_iter]
+        conn.execute(self.insert_statement(), data)
+
+    def _execute_insert_multi(self, conn, keys, data_iter):
+        data = [dict(zip(keys, row)) for row in data_iter]
+        conn.execute(self.insert_statement().values(data))
+
+    def _rows_per_statement(self, ncols, chunksize, method):
+        if method == 'multi':
+            rows = max(1, self._max_params() // max(ncols, 1))
+            return min(rows, chunksize)
+        return chunksize
+
+    def _insert_chunks(self, conn, chunksize=None, method=None):
+        keys, data_list = self.insert_data()
+
+        nrows = len(self.frame)
+        if nrows == 0:
+            return
+
+        if chunksize is None:
             chunksize = nrows
-        chunks = int(nrows / chunksize) + 1
+        elif chunksize == 0:
+            raise ValueError('chunksize argument should be non-zero')
+
+        if method == 'multi':
+            exec_insert = self._execute_insert_multi
+        else:
+            exec_insert = self._execute_insert
 
+        chunksize = self._rows_per_statement(len(keys), chunksize, method)
+
+        for start_i in range(0, nrows, chunksize):
+            end_i = min(start_i + chunksize, nrows)
+            chunk_iter = zip(*[arr[start_i:end_i] for arr in data_list])
+            exec_insert(conn, keys, chunk_iter)
+
+    def insert(self, chunksize=None, method=None):
         con = self.pd_sql.engine.connect()
         with con.begin() as trans:
-            for i in range(chunks):
-                start_i = i * chunksize
-                end_i = min((i + 1) * chunksize, nrows)
-                if start_i >= end_i:
+            self._insert_chunks(con, chunksize=chunksize, method=method)
+
+    def _query_iterator(self, result, chunksize, columns, coerce_float=True,
+                        parse_dates=None):
+        """Return generator through chunked result set"""
+
+        try:
+            while True:
+                data = result.fetchmany(chunksize)
+                if not data:
                     break
-                data_list = []
-                for t in temp.iloc[start_i:end_i].itertuples():
-                    data = dict((k, self.maybe_asscalar(v))
-                                for k, v in zip(keys, t[1:]))
-                    data_list.append(data)
-                con.execute(ins, data_list)
+                yield self._wrap_frame(data, columns,
+                                       coerce_float=coerce_float,
+                                       parse_dates=parse_dates)
+        finally:
+            result.close()
 
-    def read(self, coerce_float=True, parse_dates=None, columns=None):
+    def _wrap_frame(self, data, columns, coerce_float=True, parse_dates=None):
+        self.frame = DataFrame.from_records(
+            data, columns=columns, coerce_float=coerce_float)
+
+        self._harmonize_columns(parse_dates=parse_dates)
+
+        if self.index is not None:
+            self.frame.set_index(self.index, inplace=True)
+
+        return self.frame
+
+    def read(self, coerce_float=True, parse_dates=None, columns=None,
+             chunksize=None):
 
         if columns is not None and len(columns) > 0:
             from sqlalchemy import select
@@ -643,18 +793,16 @@ class PandasSQLTable(PandasObject):
             sql_select = self.table.select()
 
         result = self.pd_sql.execute(sql_select)
-        data = result.fetchall()
         column_names = result.keys()
 
-        self.frame = DataFrame.from_records(
-            data, columns=column_names, coerce_float=coerce_float)
-
-        self._harmonize_columns(parse_dates=parse_dates)
-
-        if self.index is not None:
-            self.frame.set_index(self.index, inplace=True)
+        if chunksize is not None:
+            return self._query_iterator(result, chunksize, column_names,
+                                        coerce_float=coerce_float,
+                                        parse_dates=parse_dates)
 
-        return self.frame
+        data = result.fetchall()
+        return self._wrap_frame(data, column_names, coerce_float=coerce_float,
+                                parse_dates=parse_dates)
 
     def _index_name(self, index, index_label):
         # for writing: index=True to include index in sql table
@@ -843,36 +991,37 @@ class PandasSQLAlchemy(PandasSQL):
         return self.engine.execute(*args, **kwargs)
 
     def read_table(self, table_name, index_col=None, coerce_float=True,
-                   parse_dates=None, columns=None):
+                   parse_dates=None, columns=None, chunksize=None):
 
         table = PandasSQLTable(table_name, self, index=index_col)
         return table.read(coerce_float=coerce_float,
-                          parse_dates=parse_dates, columns=columns)
+                          parse_dates=parse_dates, columns=columns,
+                          chunksize=chunksize)
 
     def read_sql(self, sql, index_col=None, coerce_float=True,
-                 parse_dates=None, params=None):
+                 parse_dates=None, params=None, chunksize=None):
         args = _convert_params(sql, params)
 
         result = self.execute(*args)
-        data = result.fetchall()
         columns = result.keys()
 
-        data_frame = DataFrame.from_records(
-            data, columns=columns, coerce_float=coerce_float)
-
-        _parse_date_columns(data_frame, parse_dates)
+        if chunksize is not None:
+            return _query_iterator(result, chunksize, columns,
+                                   index_col=index_col,
+                                   coerce_float=coerce_float,
+                                   parse_dates=parse_dates)
 
-        if index_col is not None:
-            data_frame.set_index(index_col, inplace=True)
-
-        return data_frame
+        data = result.fetchall()
+        return _wrap_result(data, columns, index_col=index_col,
+                            coerce_float=coerce_float,
+                            parse_dates=parse_dates)
 
     def to_sql(self, frame, name, if_exists='fail', index=True,
-               index_label=None, chunksize=None):
+               index_label=None, chunksize=None, method=None):
         table = PandasSQLTable(
             name, self, frame=frame, index=index, if_exists=if_exists,
             index_label=index_label)
-        table.insert(chunksize)
+        table.insert(chunksize, method=method)
 
     @property
     def tables(self):
@@ -930,6 +1079,13 @@ _SQL_TYPES = {
     }
 }
 
+# Maximum number of bound parameters in a single statement, used to size
+# multi-row INSERT statements (SQLITE_MAX_VARIABLE_NUMBER for sqlite)
+_MAX_INSERT_PARAMS = {
+    'sqlite': 999,
+}
+_DEFAULT_MAX_INSERT_PARAMS = 32766
+
 # SQL enquote and wildcard symbols
 _SQL_SYMB = {
     'mysql': {
@@ -960,7 +1116,7 @@ class PandasSQLTableLegacy(PandasSQLTable):
     def create(self):
         self.pd_sql.execute(self.table)
 
-    def insert_statement(self):
+    def insert_statement(self, num_rows=1):
         names = list(map(str, self.frame.columns))
         flv = self.pd_sql.flavor
         br_l = _SQL_SYMB[flv]['br_l']  # left val quote char
@@ -972,34 +1128,31 @@ class PandasSQLTableLegacy(PandasSQLTable):
 
         bracketed_names = [br_l + column + br_r for column in names]
         col_names = ','.join(bracketed_names)
-        wildcards = ','.join([wld] * len(names))
-        insert_statement = 'INSERT INTO %s (%s) VALUES (%s)' % (
-            self.name, col_names, wildcards)
+        wildcards = '(%s)' % ','.join([wld] * len(names))
+        insert_statement = 'INSERT INTO %s (%s) VALUES %s' % (
+            self.name, col_names, ','.join([wildcards] * num_rows))
         return insert_statement
 
-    def insert(self, chunksize=None):
+    def _max_params(self):
+        return _MAX_INSERT_PARAMS.get(self.pd_sql.flavor,
+                                      _DEFAULT_MAX_INSERT_PARAMS)
 
-        ins = self.insert_statement()
-        temp = self.insert_data()
+    def _execute_insert(self, conn, keys, data_iter):
+        data_list = list(data_iter)
+        conn.executemany(self.insert_statement(), data_list)
 
-        nrows = len(temp)
-        if chunksize is None: 
-            chunksize = nrows
-        chunks = int(nrows / chunksize) + 1
+    def _execute_insert_multi(self, conn, keys, data_iter):
+        data_list = list(data_iter)
+        flattened = list(itertools.chain.from_iterable(data_list))
+        conn.execute(self.insert_statement(num_rows=len(data_list)),
+                     flattened)
 
+    def insert(self, chunksize=None, method=None):
         with self.pd_sql.con:
-            for i in range(chunks):
-                start_i = i * chunksize
-                end_i = min((i + 1) * chunksize, nrows)
-                if start_i >= end_i:
-                    break
-                data_list = []
-                for t in temp.iloc[start_i:end_i].itertuples():
-                    data = tuple((self.maybe_asscalar(v) for v in t[1:]))
-                    data_list.append(data)
-
-                cur = self.pd_sql.con.cursor()
-                cur.executemany(ins, data_list)
+            cur = self.pd_sql.con.cursor()
+            try:
+                self._insert_chunks(cur, chunksize=chunksize, method=method)
+            finally:
                 cur.close()
 
     def _create_table_statement(self):
@@ -1090,21 +1243,23 @@ class PandasSQLLegacy(PandasSQL):
             raise_with_traceback(ex)
 
     def read_sql(self, sql, index_col=None, coerce_float=True, params=None,
-                 parse_dates=None):
+                 parse_dates=None, chunksize=None):
         args = _convert_params(sql, params)
         cursor = self.execute(*args)
         columns = [col_desc[0] for col_desc in cursor.description]
-        data = self._fetchall_as_list(cursor)
-        cursor.close()
 
-        data_frame = DataFrame.from_records(
-            data, columns=columns, coerce_float=coerce_float)
+        if chunksize is not None:
+            return _query_iterator(cursor, chunksize, columns,
+                                   index_col=index_col,
+                                   coerce_float=coerce_float,
+                                   parse_dates=parse_dates)
 
-        _parse_date_columns(data_frame, parse_dates)
+        data = self._fetchall_as_list(cursor)
+        cursor.close()
 
-        if index_col is not None:
-            data_frame.set_index(index_col, inplace=True)
-        return data_frame
+        return _wrap_result(data, columns, index_col=index_col,
+                            coerce_float=coerce_float,
+                            parse_dates=parse_dates)
 
     def _fetchall_as_list(self, cur):
         result = cur.fetchall()
@@ -1113,7 +1268,7 @@ class PandasSQLLegacy(PandasSQL):
         return result
 
     def to_sql(self, frame, name, if_exists='fail', index=True,
-               index_label=None, chunksize=None):
+               index_label=None, chunksize=None, method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1126,12 +1281,15 @@ class PandasSQLLegacy(PandasSQL):
             fail: If table exists, do nothing.
             replace: If table exists, drop it, recreate it, and insert data.
             append: If table exists, insert data. Create if does not exist.
+        method: {None, 'multi'}, default None
+            None: one INSERT per row through executemany.
+            multi: multi-row INSERT statements.
 
         """
         table = PandasSQLTableLegacy(
             name, self, frame=frame, index=index, if_exists=if_exists,
             index_label=index_label)
-        table.insert(chunksize)
+        table.insert(chunksize, method=method)
 
     def has_table(self, name):
         flavor_map = {
@@ -627,3 +627,52 @@ class TestPandasContainer(tm.TestCase):
             raise TypeError("raisin")
         self.assertRaises(TypeError, frame.to_json,
                           default_handler=my_handler_raises)
+
+    def test_read_jsonl(self):
+        result = read_json('{"a": 1, "b": 2}\n{"b":2, "a" :1}\n', lines=True)
+        expected = DataFrame([[1, 2], [1, 2]], columns=['a', 'b'])
+        assert_frame_equal(result, expected)
+
+        # commas and braces inside strings are kept
+        result = read_json('{"a": "foo,}", "b": 2}\n\n{"a": "b\\"ar", "b": 3}',
+                           lines=True)
+        expected = DataFrame([['foo,}', 2], ['b"ar', 3]], columns=['a', 'b'])
+        assert_frame_equal(result, expected)
+
+        self.assertRaises(ValueError, read_json, '{"a": 1}', lines=True,
+                          orient='split')
+
+    def test_to_jsonl(self):
+        df = DataFrame([[1, 2], [1, 2]], columns=['a', 'b'])
+        result = df.to_json(orient='records', lines=True)
+        expected = '{"a":1,"b":2}\n{"a":1,"b":2}\n'
+        self.assertEqual(result, expected)
+
+        df = DataFrame([["foo}", "bar"], ['foo"', "bar"]], columns=['a', 'b'])
+        result = df.to_json(orient='records', lines=True)
+        expected = '{"a":"foo}","b":"bar"}\n{"a":"foo\\"","b":"bar"}\n'
+        self.assertEqual(result, expected)
+        assert_frame_equal(read_json(result, lines=True), df)
+
+        self.assertRaises(ValueError, df.to_json, lines=True)
+
+    def test_jsonl_chunksize(self):
+        df = DataFrame({'a': np.arange(25), 'b': ['x', 'y', 'z', 'w', 'v'] * 5})
+
+        with ensure_clean('__jsonl__') as path:
+            df.to_json(path, orient='records', lines=True)
+
+            chunks = list(read_json(path, lines=True, chunksize=10))
+            self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+            assert_frame_equal(pd.concat(chunks), df)
+
+            reader = read_json(path, lines=True, chunksize=10)
+            assert_frame_equal(reader.get_chunk(5), df.iloc[:5])
+
+        json = df.to_json(orient='records', lines=True)
+        chunks = list(read_json(StringIO(json), lines=True, chunksize=7))
+        assert_frame_equal(pd.concat(chunks), df)
+
+        self.assertRaises(ValueError, read_json, json, chunksize=7)
+        self.assertRaises(ValueError, read_json, json, lines=True,
+                          chunksize=0)
@@ -23,6 +23,7 @@ from pandas import Timestamp, tslib
 nan = np.nan
 
 from pandas.io.packers import to_msgpack, read_msgpack
+import pandas.io.packers as packers
 
 _multiprocess_can_split_ = False
 
@@ -373,6 +374,50 @@ class TestNDFrame(TestPackers):
             for i, packed in enumerate(read_msgpack(path, iterator=True)):
                 check_arbitrary(packed, l[i])
 
+    def test_aligned_mmap(self):
+
+        frames = [self.frame['float'], self.frame['int'], self.frame['mixed']]
+        with ensure_clean(self.path) as path:
+            to_msgpack(path, *frames, aligned=True)
+
+            for mmap in [False, True]:
+                result = read_msgpack(path, mmap=mmap)
+                for expected, rec in zip(frames, result):
+                    assert_frame_equal(rec, expected)
+
+                it = read_msgpack(path, iterator=True, mmap=mmap)
+                for expected, rec in zip(frames, it):
+                    assert_frame_equal(rec, expected)
+
+            # the numeric blocks are views onto the file, writes to
+            # them are not
+            result = read_msgpack(path, mmap=True)[0]
+            for b in result._data.blocks:
+                self.assertFalse(b.values.flags.owndata)
+            result.values[:] = -1
+            assert_frame_equal(read_msgpack(path, mmap=True)[0],
+                               self.frame['float'])
+
+            # plain and aligned objects can be appended to each other
+            to_msgpack(path, self.frame['float'].A, append=True)
+            to_msgpack(path, self.panel['float'], append=True, aligned=True)
+            for mmap in [False, True]:
+                result = read_msgpack(path, mmap=mmap)
+                self.assertEqual(len(result), 5)
+                assert_frame_equal(result[2], self.frame['mixed'])
+                assert_series_equal(result[3], self.frame['float'].A)
+                assert_panel_equal(result[4], self.panel['float'])
+
+        self.assertRaises(ValueError, to_msgpack, None, self.frame['float'],
+                          aligned=True, compress='zlib')
+        self.assertRaises(ValueError, read_msgpack,
+                          to_msgpack(None, self.frame['float']), mmap=True)
+
+        # in memory
+        result = read_msgpack(to_msgpack(None, self.frame['int'],
+                                         aligned=True))
+        assert_frame_equal(result, self.frame['int'])
+
     def tests_datetimeindex_freq_issue(self):
 
         # GH 5947
@@ -385,6 +430,51 @@ class TestNDFrame(TestPackers):
         result = self.encode_decode(df)
         assert_frame_equal(result, df)
 
+class TestCompression(TestPackers):
+
+    def setUp(self):
+        super(TestCompression, self).setUp()
+        self.frame = DataFrame({'A': np.arange(1000.),
+                                'B': np.arange(1000),
+                                'C': ['foo'] * 1000,
+                                'D': date_range('20130101', periods=1000)})
+
+    def _check_roundtrip(self, compress):
+        for nthreads in [1, 4]:
+            packed = to_msgpack(None, self.frame, compress=compress,
+                                nthreads=nthreads)
+            for read_threads in [1, 4]:
+                result = read_msgpack(packed, nthreads=read_threads)
+                assert_frame_equal(result, self.frame)
+
+        with ensure_clean(self.path) as path:
+            to_msgpack(path, self.frame, self.frame.A, compress=compress,
+                       nthreads=4)
+            result = list(read_msgpack(path, iterator=True, nthreads=4))
+            assert_frame_equal(result[0], self.frame)
+            assert_series_equal(result[1], self.frame.A)
+
+    def test_zlib(self):
+        self._check_roundtrip('zlib')
+
+    def test_blosc(self):
+        if not packers._BLOSC:
+            raise nose.SkipTest('no blosc')
+        self._check_roundtrip('blosc')
+
+    def test_chunks(self):
+        chunksize = packers._COMPRESS_CHUNKSIZE
+        try:
+            # a chunk holds whole items, so 100 bytes is 12 of them
+            packers._COMPRESS_CHUNKSIZE = 100
+            self.test_zlib()
+            self.test_blosc()
+        except nose.SkipTest:
+            pass
+        finally:
+            packers._COMPRESS_CHUNKSIZE = chunksize
+
+
 class TestSparse(TestPackers):
 
     def _check_roundtrip(self, obj, comparator, **kwargs):
@@ -263,6 +263,32 @@ c,3
         tm.assert_isinstance(result, Series)
         tm.assert_series_equal(result, expected)
 
+    def test_downcast(self):
+        data = """\
+a,b,c,d
+1,0.5,x,70000
+2,1.5,y,-3
+3,,x,12
+4,2.25,x,1
+"""
+        result = self.read_csv(StringIO(data), downcast=True)
+        self.assertEqual(result['a'].dtype, np.int8)
+        self.assertEqual(result['b'].dtype, np.float32)
+        self.assertTrue(pd.core.common.is_categorical_dtype(result['c']))
+        self.assertEqual(result['d'].dtype, np.int32)
+
+        expected = self.read_csv(StringIO(data))
+        cols = ['a', 'b', 'd']
+        tm.assert_frame_equal(result[cols].astype(np.float64),
+                              expected[cols].astype(np.float64))
+        self.assert_numpy_array_equal(np.asarray(result['c']),
+                                      expected['c'].values)
+
+        # each chunk is downcast
+        reader = self.read_csv(StringIO(data), downcast=True, chunksize=2)
+        for chunk in reader:
+            self.assertEqual(chunk['a'].dtype, np.int8)
+
     def test_inf_parsing(self):
         data = """\
 ,A
@@ -3219,6 +3245,48 @@ one,two
         # it works!
         result = self.read_csv(self.csv1, memory_map=True)
 
+    def test_nthreads(self):
+        df = DataFrame({'a': np.arange(1000),
+                        'b': np.random.randn(1000),
+                        'c': ['foo', 'bar', np.nan, 'baz'] * 250},
+                       columns=['a', 'b', 'c'])
+
+        # force small ranges so that the file is actually split
+        min_bytes = parsers._MIN_RANGE_BYTES
+        parsers._MIN_RANGE_BYTES = 1024
+        try:
+            with tm.ensure_clean() as path:
+                df.to_csv(path)
+
+                ranges = parsers._split_file_on_lines(path, 4)
+                self.assertEqual(len(ranges), 4)
+                self.assertEqual(ranges[0][0], 0)
+                self.assertEqual(ranges[-1][1], os.path.getsize(path))
+                with open(path, 'rb') as f:
+                    data = f.read()
+                for start, end in ranges:
+                    self.assertEqual(data[end - 1:end], b'\n')
+
+                expected = self.read_csv(path, index_col=0)
+                result = self.read_csv(path, index_col=0, nthreads=4)
+                tm.assert_frame_equal(result, expected)
+
+                expected = self.read_csv(path, usecols=['a', 'c'])
+                result = self.read_csv(path, usecols=['a', 'c'], nthreads=4)
+                tm.assert_frame_equal(result, expected)
+
+                self.assertRaises(ValueError, self.read_csv, path,
+                                  nthreads=4, chunksize=100)
+                self.assertRaises(ValueError, self.read_csv, path,
+                                  nthreads=4, nrows=100)
+        finally:
+            parsers._MIN_RANGE_BYTES = min_bytes
+
+        # non-file input falls back to a single thread
+        result = self.read_csv(StringIO(df.to_csv()), index_col=0,
+                               nthreads=4)
+        tm.assert_frame_equal(result, df)
+
     def test_disable_bool_parsing(self):
         # #2090
 
@@ -3123,6 +3123,125 @@ class TestHDFStore(tm.TestCase):
             expected = df[df.A > 0].reindex(columns=['C', 'D'])
             tm.assert_frame_equal(expected, result)
 
+    def test_select_cache(self):
+        df = tm.makeTimeDataFrame()
+
+        with ensure_clean_path(self.path) as path:
+            store = HDFStore(path, cache_size=2)
+            try:
+                store.append('df', df, data_columns=['A'])
+                store.put('fixed', df)
+
+                # a miss, then hits
+                expected = df[df.A > 0]
+                for i in range(3):
+                    result = store.select('df', 'A > 0')
+                    tm.assert_frame_equal(result, expected)
+                self.assertEqual(store.cache_info(), (2, 1, 2, 1))
+
+                # the cached object is not handed out
+                result['A'] = 0
+                tm.assert_frame_equal(store.select('df', 'A > 0'), expected)
+
+                # the where is keyed by the values it refers to
+                value = 0
+                store.select('df', 'A > value')
+                self.assertEqual(store.cache_info().hits, 4)
+                value = 1
+                result = store.select('df', 'A > value')
+                tm.assert_frame_equal(result, df[df.A > 1])
+                self.assertEqual(store.cache_info().misses, 2)
+
+                # columns, start and stop are part of the key
+                result = store.select('df', 'A > 0', columns=['A', 'B'])
+                tm.assert_frame_equal(result, expected[['A', 'B']])
+                result = store.select('df', start=5, stop=10)
+                tm.assert_frame_equal(result, df.iloc[5:10])
+                self.assertEqual(store.cache_info().misses, 4)
+
+                # bounded, the least recently used selection is dropped
+                self.assertEqual(store.cache_info().currsize, 2)
+                store.select('df', 'A > 0')
+                self.assertEqual(store.cache_info().misses, 5)
+
+                # coordinates and iterators are not cached
+                store.select('df', where=np.arange(5))
+                list(store.select('df', chunksize=10))
+                self.assertEqual(store.cache_info().misses, 5)
+
+                # fixed stores are cached whole
+                for i in range(2):
+                    tm.assert_frame_equal(store.select('fixed'), df)
+                self.assertEqual(store.cache_info()[:2], (5, 6))
+
+                # writes invalidate the node
+                store.select('df')
+                store.append('df', df)
+                expected = concat([df, df])
+                tm.assert_frame_equal(store.select('df'), expected)
+                store.remove('df', where='A > 0')
+                tm.assert_frame_equal(store.select('df'),
+                                      expected[expected.A <= 0])
+                self.assertEqual(store.cache_info()[:2], (5, 9))
+
+                store.clear_cache()
+                self.assertEqual(store.cache_info(), (0, 0, 2, 0))
+            finally:
+                store.close()
+
+    def test_select_query(self):
+        df = tm.makeTimeDataFrame()
+        df['string'] = 'foo'
+        df.ix[4:8, 'string'] = 'bar'
+
+        with ensure_clean_store(self.path) as store:
+            store.append('df', df, data_columns=['A', 'string'])
+            queryables = store.get_storer('df').queryables()
+
+            # data columns and the index are pushed down
+            value = 0
+            q = pytables.Query('A > @value and string == "foo"')
+            condition, residual = q.split(queryables)
+            self.assertIsNotNone(condition)
+            self.assertIsNone(residual)
+            result = store.select('df', query='A > @value and string == "foo"')
+            expected = df.query('A > @value and string == "foo"')
+            tm.assert_frame_equal(result, expected)
+
+            # non-data columns and column comparisons are evaluated in memory
+            for expr in ['A > 0 & B > 0', 'A > 0 and A < C',
+                         '(A > 0) | (B > 0)', 'index > @df.index[4] and B < 0',
+                         'string in ["foo"] and index < @df.index[10]']:
+                result = store.select('df', query=expr)
+                tm.assert_frame_equal(result, df.query(expr))
+
+            condition, residual = pytables.Query('A > 0 & B > 0').split(queryables)
+            self.assertIsNotNone(condition)
+            self.assertTrue('B' in residual and 'A' not in residual)
+
+            condition, residual = pytables.Query('(A > 0) | (B > 0)').split(queryables)
+            self.assertIsNone(condition)
+
+            # combined with a where, and with chunks
+            result = store.select('df', 'string == "foo"', query='A > 0 and B > 0')
+            tm.assert_frame_equal(result, df.query('string == "foo" and A > 0 and B > 0'))
+            result = concat(store.select('df', query='A > 0 and B > 0', chunksize=7))
+            tm.assert_frame_equal(result, df.query('A > 0 and B > 0'))
+
+            # coordinates are filtered in memory
+            result = store.select('df', where=np.arange(10), query='A > 0')
+            expected = df.iloc[:10]
+            tm.assert_frame_equal(result, expected[expected.A > 0])
+
+            store.put('fixed', df)
+            self.assertRaises(TypeError, store.select, 'fixed', query='A > 0')
+
+        with ensure_clean_path(self.path) as path:
+            df.to_hdf(path, 'df', format='table', data_columns=['A'])
+            value = 0.5
+            result = read_hdf(path, 'df', query='A > @value and B < @value')
+            tm.assert_frame_equal(result, df.query('A > @value and B < @value'))
+
     def test_select_dtypes(self):
 
         with ensure_clean_store(self.path) as store:
@@ -4050,6 +4169,41 @@ class TestHDFStore(tm.TestCase):
             self.assertRaises(ValueError, store.select_as_multiple,
                               ['df1','df3'], where=['A>0', 'B>0'], selector='df1')
 
+    def test_select_as_multiple_nthreads(self):
+
+        df1 = tm.makeTimeDataFrame()
+        df2 = tm.makeTimeDataFrame().rename(columns=lambda x: "%s_2" % x)
+        df3 = tm.makeTimeDataFrame().rename(columns=lambda x: "%s_3" % x)
+        df2['foo'] = 'bar'
+
+        with ensure_clean_store(self.path) as store:
+            store.append('df1', df1, data_columns=['A', 'B'])
+            store.append('df2', df2)
+            store.append('df3', df3)
+
+            expected = store.select_as_multiple(
+                ['df1', 'df2', 'df3'], where=['A>0', 'B>0'], selector='df1')
+            result = store.select_as_multiple(
+                ['df1', 'df2', 'df3'], where=['A>0', 'B>0'], selector='df1',
+                nthreads=3)
+            tm.assert_frame_equal(result, expected)
+
+            # batched selects
+            for nthreads in [1, 2]:
+                result = store.select_many(['df1', 'df2'], where='index>df1.index[4]',
+                                           nthreads=nthreads)
+                self.assertEqual(len(result), 2)
+                tm.assert_frame_equal(result[0], df1[5:])
+                tm.assert_frame_equal(result[1], df2[5:])
+
+            store.put('fixed', df3)
+            result = store.select_many(['fixed', 'df1'], nthreads=2)
+            tm.assert_frame_equal(result[0], df3)
+            tm.assert_frame_equal(result[1], df1)
+
+            self.assertRaises(KeyError, store.select_many, ['df1', 'foo'])
+            self.assertRaises(TypeError, store.select_many, 'df1')
+
     def test_nan_selection_bug_4858(self):
 
         # GH 4858; nan selection bug, only works for pytables >= 3.1
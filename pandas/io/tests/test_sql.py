@@ -29,7 +29,7 @@ import numpy as np
 from datetime import datetime, date, time
 
 from pandas import DataFrame, Series, Index, MultiIndex, isnull
-from pandas import date_range, to_datetime, to_timedelta
+from pandas import date_range, to_datetime, to_timedelta, concat
 import pandas.compat as compat
 from pandas.compat import StringIO, range, lrange, string_types
 from pandas.core.datetools import format as date_format
@@ -464,6 +464,29 @@ class _TestSQLApi(PandasSQLTest):
             con=self.conn)
         tm.assert_frame_equal(result, self.test_frame1)        
 
+    def test_roundtrip_multi(self):
+        df = DataFrame({'a': np.arange(500, dtype='int64'),
+                        'b': np.random.randn(500),
+                        'c': ['foo', None, 'bar', 'baz', 'qux'] * 100})
+        df.loc[::7, 'b'] = np.nan
+
+        # 1500 parameters, so sqlite needs at least two statements
+        sql.to_sql(df, 'test_frame_multi', con=self.conn, index=False,
+                   flavor='sqlite', method='multi')
+        result = sql.read_sql_query('SELECT * FROM test_frame_multi',
+                                    con=self.conn)
+        tm.assert_frame_equal(result, df)
+
+        sql.to_sql(df, 'test_frame_multi', con=self.conn, index=False,
+                   flavor='sqlite', method='multi', chunksize=7,
+                   if_exists='replace')
+        result = sql.read_sql_query('SELECT * FROM test_frame_multi',
+                                    con=self.conn)
+        tm.assert_frame_equal(result, df)
+
+        self.assertRaises(ValueError, sql.to_sql, df, 'test_frame_multi',
+                          self.conn, if_exists='replace', method='bulk')
+
     def test_execute_sql(self):
         # drop_sql = "DROP TABLE IF EXISTS test"  # should already be done
         iris_results = sql.execute("SELECT * FROM iris", con=self.conn)
@@ -609,6 +632,32 @@ class _TestSQLApi(PandasSQLTest):
                                     con=self.conn)
         self.assertTrue('CREATE' in create_sql)
 
+    def test_chunksize_read(self):
+        df = DataFrame(np.random.randn(22, 5), columns=list('abcde'))
+        df.to_sql('test_chunksize', self.conn, index=False)
+
+        # reading the query in one time
+        res1 = sql.read_sql_query("select * from test_chunksize", self.conn)
+
+        # reading the query in chunks with read_sql_query
+        res2 = DataFrame()
+        i = 0
+        sizes = [5, 5, 5, 5, 2]
+
+        for chunk in sql.read_sql_query("select * from test_chunksize",
+                                        self.conn, chunksize=5):
+            res2 = concat([res2, chunk], ignore_index=True)
+            self.assertEqual(len(chunk), sizes[i])
+            i += 1
+
+        tm.assert_frame_equal(res1, res2)
+
+        # reading the query in chunks with read_sql
+        chunks = list(sql.read_sql("select * from test_chunksize",
+                                   self.conn, chunksize=5))
+        self.assertEqual([len(chunk) for chunk in chunks], sizes)
+        tm.assert_frame_equal(res1, concat(chunks, ignore_index=True))
+
 
 class TestSQLApi(_TestSQLApi):
     """
@@ -654,6 +703,16 @@ class TestSQLApi(_TestSQLApi):
         self.assertEqual(result.columns.tolist(), ["C", "D"],
                          "columns not set correctly whith index_col")
 
+    def test_read_table_chunksize(self):
+        sql.to_sql(self.test_frame1, 'test_frame', self.conn)
+
+        expected = sql.read_sql_table('test_frame', self.conn,
+                                      index_col='index')
+        chunks = list(sql.read_sql_table('test_frame', self.conn,
+                                         index_col='index', chunksize=3))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 1])
+        tm.assert_frame_equal(concat(chunks), expected)
+
     def test_read_sql_delegate(self):
         iris_frame1 = sql.read_sql_query(
             "SELECT * FROM iris", self.conn)
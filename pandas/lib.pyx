@@ -1,6 +1,7 @@
 cimport numpy as np
 cimport cython
 import numpy as np
+from sys import getsizeof
 
 from numpy cimport *
 
@@ -850,6 +851,20 @@ def max_len_string_array(ndarray[object, ndim=1] arr):
 
     return m
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def memory_usage_of_objects(ndarray[object, ndim=1] arr):
+    """ return the sum of sys.getsizeof of the elements of an object array;
+    the pointers themselves are not included """
+    cdef:
+        Py_ssize_t i, n = len(arr)
+        int64_t s = 0
+
+    for i from 0 <= i < n:
+        s += getsizeof(arr[i])
+
+    return s
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def string_array_replace_from_nan_rep(ndarray[object, ndim=1] arr, object nan_rep, object replace = None):
@@ -911,6 +926,49 @@ def write_csv_rows(list data, list data_index, int nlevels, list cols, object wr
     if  j >= 0 and (j < N-1 or (j % N) != N-1 ):
         writer.writerows(rows[:((j+1) % N)])
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def convert_json_to_lines(object arr):
+    """
+    replace the commas separating the top-level elements of a json string
+    (without its enclosing brackets) with line feeds, skipping commas in
+    nested objects/arrays and in quoted strings
+    """
+    cdef:
+        Py_ssize_t i, length
+        int depth = 0
+        bint in_quotes = 0, is_escaping = 0
+        ndarray[uint8_t] narr
+        uint8_t v
+
+    if PyBytes_Check(arr):
+        narr = np.frombuffer(arr, dtype='u1').copy()
+    else:
+        narr = np.frombuffer(arr.encode('utf-8'), dtype='u1').copy()
+    length = narr.shape[0]
+
+    for i in range(length):
+        v = narr[i]
+        if in_quotes:
+            if is_escaping:
+                is_escaping = 0
+            elif v == 92:  # backslash
+                is_escaping = 1
+            elif v == 34:  # quote
+                in_quotes = 0
+        elif v == 34:
+            in_quotes = 1
+        elif v == 123 or v == 91:  # { [
+            depth += 1
+        elif v == 125 or v == 93:  # } ]
+            depth -= 1
+        elif v == 44 and depth == 0:  # comma
+            narr[i] = 10  # newline
+
+    if PyBytes_Check(arr):
+        return narr.tostring()
+    return narr.tostring().decode('utf-8')
+
 #-------------------------------------------------------------------------------
 # Groupby-related functions
 
@@ -1698,3 +1756,4 @@ cdef class BlockPlacement:
 include "reduce.pyx"
 include "properties.pyx"
 include "inference.pyx"
+include "strings.pyx"
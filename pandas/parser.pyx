@@ -165,8 +165,8 @@ cdef extern from "parser/tokenizer.h":
         int *line_start
         int col
 
-    void coliter_setup(coliter_t *it, parser_t *parser, int i, int start)
-    char* COLITER_NEXT(coliter_t it)
+    void coliter_setup(coliter_t *it, parser_t *parser, int i, int start) nogil
+    char* COLITER_NEXT(coliter_t it) nogil
 
     parser_t* parser_new()
 
@@ -182,15 +182,15 @@ cdef extern from "parser/tokenizer.h":
 
     void debug_print_parser(parser_t *self)
 
-    int tokenize_all_rows(parser_t *self)
-    int tokenize_nrows(parser_t *self, size_t nrows)
+    int tokenize_all_rows(parser_t *self) nogil
+    int tokenize_nrows(parser_t *self, size_t nrows) nogil
 
     int64_t str_to_int64(char *p_item, int64_t int_min,
-                         int64_t int_max, int *error, char tsep)
+                         int64_t int_max, int *error, char tsep) nogil
     uint64_t str_to_uint64(char *p_item, uint64_t uint_max, int *error)
 
     inline int to_double(char *item, double *p_value,
-                         char sci, char decimal, char thousands)
+                         char sci, char decimal, char thousands) nogil
     inline int to_complex(char *item, double *p_real,
                           double *p_imag, char sci, char decimal)
     inline int to_longlong(char *item, long long *p_value)
@@ -780,7 +780,8 @@ cdef class TextReader:
 
     cdef _tokenize_rows(self, size_t nrows):
         cdef int status
-        status = tokenize_nrows(self.parser, nrows)
+        with nogil:
+            status = tokenize_nrows(self.parser, nrows)
 
         if self.parser.warn_msg != NULL:
             print >> sys.stderr, self.parser.warn_msg
@@ -794,6 +795,7 @@ cdef class TextReader:
         cdef:
             int buffered_lines
             int irows, footer = 0
+            int status
 
         self._start_clock()
 
@@ -807,7 +809,8 @@ cdef class TextReader:
                 raise ValueError('skip_footer can only be used to read '
                                  'the whole file')
         else:
-            status = tokenize_all_rows(self.parser)
+            with nogil:
+                status = tokenize_all_rows(self.parser)
 
             if self.parser.warn_msg != NULL:
                 print >> sys.stderr, self.parser.warn_msg
@@ -1424,93 +1427,141 @@ cdef _try_double(parser_t *parser, int col, int line_start, int line_end,
     lines = line_end - line_start
     result = np.empty(lines, dtype=np.float64)
     data = <double *> result.data
+
+    if not use_na_flist:
+        # the common case needs no Python objects, so let other parser
+        # threads run while converting
+        with nogil:
+            error = _try_double_nogil(parser, col, line_start, line_end,
+                                      na_filter, na_hashset, NA, data,
+                                      &na_count)
+        if error != 0:
+            return None, None
+        return result, na_count
+
     coliter_setup(&it, parser, col, line_start)
 
-    if na_filter:
-        for i in range(lines):
-            word = COLITER_NEXT(it)
+    for i in range(lines):
+        word = COLITER_NEXT(it)
 
+        if na_filter:
             k = kh_get_str(na_hashset, word)
             # in the hash table
             if k != na_hashset.n_buckets:
                 na_count += 1
                 data[0] = NA
+                data += 1
+                continue
+
+        error = to_double(word, data, parser.sci, parser.decimal, parser.thousands)
+        if error != 1:
+            if strcasecmp(word, cinf) == 0:
+                data[0] = INF
+            elif strcasecmp(word, cneginf) == 0:
+                data[0] = NEGINF
             else:
-                error = to_double(word, data, parser.sci, parser.decimal, parser.thousands)
-                if error != 1:
-                    if strcasecmp(word, cinf) == 0:
-                        data[0] = INF
-                    elif strcasecmp(word, cneginf) == 0:
-                        data[0] = NEGINF
-                    else:
-                        return None, None
-                if use_na_flist:
-                    if data[0] in na_flist:
-                        na_count += 1
-                        data[0] = NA
-            data += 1
-    else:
-        for i in range(lines):
-            word = COLITER_NEXT(it)
-            error = to_double(word, data, parser.sci, parser.decimal, parser.thousands)
-            if error != 1:
-                if strcasecmp(word, cinf) == 0:
-                    data[0] = INF
-                elif strcasecmp(word, cneginf) == 0:
-                    data[0] = NEGINF
-                else:
-                    return None, None
-            data += 1
+                return None, None
+        if data[0] in na_flist:
+            na_count += 1
+            data[0] = NA
+        data += 1
 
     return result, na_count
 
+cdef inline int _try_double_nogil(parser_t *parser, int col, int line_start,
+                                  int line_end, bint na_filter,
+                                  kh_str_t *na_hashset, double NA,
+                                  double *data, int *na_count) nogil:
+    cdef:
+        int error
+        size_t i, lines = line_end - line_start
+        coliter_t it
+        char *word
+        khiter_t k
+
+    na_count[0] = 0
+    coliter_setup(&it, parser, col, line_start)
+
+    for i in range(lines):
+        word = COLITER_NEXT(it)
+
+        if na_filter:
+            k = kh_get_str(na_hashset, word)
+            # in the hash table
+            if k != na_hashset.n_buckets:
+                na_count[0] += 1
+                data[0] = NA
+                data += 1
+                continue
+
+        error = to_double(word, data, parser.sci, parser.decimal, parser.thousands)
+        if error != 1:
+            if strcasecmp(word, cinf) == 0:
+                data[0] = INF
+            elif strcasecmp(word, cneginf) == 0:
+                data[0] = NEGINF
+            else:
+                return 1
+        data += 1
+
+    return 0
+
 
 cdef _try_int64(parser_t *parser, int col, int line_start, int line_end,
                 bint na_filter, kh_str_t *na_hashset):
     cdef:
         int error, na_count = 0
-        size_t i, lines
-        coliter_t it
-        char *word
+        size_t lines
         int64_t *data
         ndarray result
 
         int64_t NA = na_values[np.int64]
-        khiter_t k
 
     lines = line_end - line_start
     result = np.empty(lines, dtype=np.int64)
     data = <int64_t *> result.data
+
+    with nogil:
+        error = _try_int64_nogil(parser, col, line_start, line_end,
+                                 na_filter, na_hashset, NA, data, &na_count)
+    if error != 0:
+        if error == ERROR_OVERFLOW:
+            raise OverflowError('Integer overflow in column %d' % col)
+        return None, None
+
+    return result, na_count
+
+cdef inline int _try_int64_nogil(parser_t *parser, int col, int line_start,
+                                 int line_end, bint na_filter,
+                                 kh_str_t *na_hashset, int64_t NA,
+                                 int64_t *data, int *na_count) nogil:
+    cdef:
+        int error
+        size_t i, lines = line_end - line_start
+        coliter_t it
+        char *word
+        khiter_t k
+
+    na_count[0] = 0
     coliter_setup(&it, parser, col, line_start)
 
-    if na_filter:
-        for i in range(lines):
-            word = COLITER_NEXT(it)
+    for i in range(lines):
+        word = COLITER_NEXT(it)
+
+        if na_filter:
             k = kh_get_str(na_hashset, word)
             # in the hash table
             if k != na_hashset.n_buckets:
-                na_count += 1
+                na_count[0] += 1
                 data[i] = NA
                 continue
 
-            data[i] = str_to_int64(word, INT64_MIN, INT64_MAX,
-                                   &error, parser.thousands)
-            if error != 0:
-                if error == ERROR_OVERFLOW:
-                    raise OverflowError(word)
+        data[i] = str_to_int64(word, INT64_MIN, INT64_MAX,
+                               &error, parser.thousands)
+        if error != 0:
+            return error
 
-                return None, None
-    else:
-        for i in range(lines):
-            word = COLITER_NEXT(it)
-            data[i] = str_to_int64(word, INT64_MIN, INT64_MAX,
-                                   &error, parser.thousands)
-            if error != 0:
-                if error == ERROR_OVERFLOW:
-                    raise OverflowError(word)
-                return None, None
-
-    return result, na_count
+    return 0
 
 
 cdef _try_bool(parser_t *parser, int col, int line_start, int line_end,
@@ -187,6 +187,108 @@ def full_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
 
 
 
+ctypedef fused merge_t:
+    int64_t
+    float64_t
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def sort_merge_join(ndarray[merge_t] left, ndarray[merge_t] right,
+                    how='inner'):
+    """
+    Join two monotonic increasing arrays without NaN by a linear merge of
+    their values, without factorizing them. Returns the (left, right)
+    indexers in key order; equal keys yield the cartesian product of their
+    rows (left-major) and -1 marks the rows without a match kept by a 'left'
+    or 'outer' join.
+    """
+    cdef:
+        Py_ssize_t i, j, k, m, lend, rend, count = 0
+        Py_ssize_t nleft = len(left), nright = len(right)
+        bint keep_left, keep_right
+        ndarray[int64_t] left_indexer, right_indexer
+
+    if how not in ('inner', 'left', 'outer'):
+        raise ValueError('unsupported join type: %s' % how)
+    keep_left = how in ('left', 'outer')
+    keep_right = how == 'outer'
+
+    # first pass, determine the size of the result
+    i = j = 0
+    with nogil:
+        while i < nleft and j < nright:
+            if left[i] < right[j]:
+                count += keep_left
+                i += 1
+            elif left[i] > right[j]:
+                count += keep_right
+                j += 1
+            else:
+                lend = i + 1
+                while lend < nleft and left[lend] == left[i]:
+                    lend += 1
+                rend = j + 1
+                while rend < nright and right[rend] == right[j]:
+                    rend += 1
+                count += (lend - i) * (rend - j)
+                i = lend
+                j = rend
+        if keep_left:
+            count += nleft - i
+        if keep_right:
+            count += nright - j
+
+    left_indexer = np.empty(count, dtype=np.int64)
+    right_indexer = np.empty(count, dtype=np.int64)
+
+    count = 0
+    i = j = 0
+    with nogil:
+        while i < nleft and j < nright:
+            if left[i] < right[j]:
+                if keep_left:
+                    left_indexer[count] = i
+                    right_indexer[count] = -1
+                    count += 1
+                i += 1
+            elif left[i] > right[j]:
+                if keep_right:
+                    left_indexer[count] = -1
+                    right_indexer[count] = j
+                    count += 1
+                j += 1
+            else:
+                lend = i + 1
+                while lend < nleft and left[lend] == left[i]:
+                    lend += 1
+                rend = j + 1
+                while rend < nright and right[rend] == right[j]:
+                    rend += 1
+                for k in range(i, lend):
+                    for m in range(j, rend):
+                        left_indexer[count] = k
+                        right_indexer[count] = m
+                        count += 1
+                i = lend
+                j = rend
+        if keep_left:
+            while i < nleft:
+                left_indexer[count] = i
+                right_indexer[count] = -1
+                count += 1
+                i += 1
+        if keep_right:
+            while j < nright:
+                left_indexer[count] = -1
+                right_indexer[count] = j
+                count += 1
+                j += 1
+
+    return left_indexer, right_indexer
+
+
+
 def _get_result_indexer(sorter, indexer):
     if indexer.dtype != np.int_:
         indexer = indexer.astype(np.int_)
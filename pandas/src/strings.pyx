@@ -0,0 +1,97 @@
+from cpython cimport PyUnicode_Check
+
+# Vectorized versions of the common methods of Series.str
+
+cdef enum StringOp:
+    STR_LEN, STR_LOWER, STR_UPPER, STR_TITLE, STR_STRIP, STR_LSTRIP,
+    STR_RSTRIP, STR_STARTSWITH, STR_ENDSWITH, STR_CONTAINS, STR_SLICE
+
+_string_ops = {
+    'len': STR_LEN,
+    'lower': STR_LOWER,
+    'upper': STR_UPPER,
+    'title': STR_TITLE,
+    'strip': STR_STRIP,
+    'lstrip': STR_LSTRIP,
+    'rstrip': STR_RSTRIP,
+    'startswith': STR_STARTSWITH,
+    'endswith': STR_ENDSWITH,
+    'contains': STR_CONTAINS,
+    'slice': STR_SLICE,
+}
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def str_map_mask(ndarray[object] arr, ndarray[uint8_t] mask, object how,
+                 object arg=None):
+    '''
+    Apply a string method to each element of an object array of strings, with
+    the same result as map_infer_mask with the equivalent function but without
+    calling a python function per element
+
+    Parameters
+    ----------
+    arr : ndarray[object]
+    mask : ndarray[uint8]
+        The missing values, which are left as they are
+    how : {'len', 'lower', 'upper', 'title', 'strip', 'lstrip', 'rstrip',
+           'startswith', 'endswith', 'contains', 'slice'}
+        The method, 'contains' being the in operator
+    arg : object, default None
+        The argument of the method (the pattern, the characters to strip or
+        the slice)
+
+    Returns
+    -------
+    mapped : ndarray, or None if arr holds values other than strings (for
+        the caller to fall back to map_infer_mask)
+    '''
+    cdef:
+        Py_ssize_t i, n = len(arr)
+        StringOp op = _string_ops[how]
+        object val
+        ndarray[object] result
+
+    for i in range(n):
+        if not mask[i] and not util.is_string_object(arr[i]):
+            return None
+
+    result = np.empty(n, dtype=object)
+    for i in range(n):
+        val = arr[i]
+        if mask[i]:
+            result[i] = val
+        elif op == STR_LEN:
+            result[i] = len(val)
+        elif op == STR_LOWER:
+            result[i] = val.lower()
+        elif op == STR_UPPER:
+            result[i] = val.upper()
+        elif op == STR_TITLE:
+            result[i] = val.title()
+        elif op == STR_STRIP:
+            result[i] = val.strip(arg)
+        elif op == STR_LSTRIP:
+            result[i] = val.lstrip(arg)
+        elif op == STR_RSTRIP:
+            result[i] = val.rstrip(arg)
+        elif op == STR_STARTSWITH:
+            if PyUnicode_Check(val):
+                result[i] = (<unicode> val).startswith(arg)
+            else:
+                result[i] = val.startswith(arg)
+        elif op == STR_ENDSWITH:
+            if PyUnicode_Check(val):
+                result[i] = (<unicode> val).endswith(arg)
+            else:
+                result[i] = val.endswith(arg)
+        elif op == STR_CONTAINS:
+            result[i] = arg in val
+        else:
+            result[i] = val[arg]
+
+    return maybe_convert_objects(result,
+                                 try_float=0,
+                                 convert_datetime=0,
+                                 convert_timedelta=0)
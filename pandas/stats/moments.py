@@ -4,15 +4,23 @@ statistics implemented in Cython
 """
 from __future__ import division
 
+from datetime import timedelta
 from functools import wraps
 from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 
 from numpy import NaN
 import numpy as np
 
 from pandas.core.api import DataFrame, Series, Panel, notnull
+from pandas.core.config import get_option
+from pandas.tseries.index import DatetimeIndex
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import DateOffset, Tick
 import pandas.algos as algos
 import pandas.core.common as pdcom
+import pandas.tslib as tslib
+import pandas.compat as compat
 
 from pandas.util.decorators import Substitution, Appender
 
@@ -26,7 +34,8 @@ __all__ = ['rolling_count', 'rolling_max', 'rolling_min',
            'expanding_sum', 'expanding_mean', 'expanding_std',
            'expanding_cov', 'expanding_corr', 'expanding_var',
            'expanding_skew', 'expanding_kurt', 'expanding_quantile',
-           'expanding_median', 'expanding_apply', 'expanding_corr_pairwise']
+           'expanding_median', 'expanding_apply', 'expanding_corr_pairwise',
+           'OnlineRolling', 'OnlineEWM']
 
 #------------------------------------------------------------------------------
 # Docs
@@ -46,9 +55,12 @@ Returns
 %s
 """
 
-_roll_kw = """window : int
+_roll_kw = """window : int or offset
     Size of the moving window. This is the number of observations used for
-    calculating the statistic.
+    calculating the statistic. The sum, mean, count, var, std, min, max, cov
+    and corr of data with a DatetimeIndex also accept a fixed frequency
+    (e.g. '5min', a Tick offset or a timedelta), the window of each
+    observation then spanning the observations of that period up to it.
 min_periods : int, default None
     Minimum number of observations in window required to have a value
     (otherwise result is NA).
@@ -201,13 +213,20 @@ def rolling_count(arg, window, freq=None, center=False, how=None):
     of :meth:`~pandas.Series.resample` (i.e. using the `mean`).
     """
     arg = _conv_timerule(arg, freq, how)
-    window = min(window, len(arg))
+    offset_window = _get_window_nanos(window) is not None
+    if not offset_window:
+        window = min(window, len(arg))
 
     return_hook, values = _process_data_structure(arg, kill_inf=False)
 
     converted = np.isfinite(values).astype(float)
-    result = rolling_sum(converted, window, min_periods=1,
-                         center=center)  # already converted
+    if offset_window:
+        # the width of the windows is taken from the index
+        result = rolling_sum(return_hook(converted), window, min_periods=1,
+                             center=center).values
+    else:
+        result = rolling_sum(converted, window, min_periods=1,
+                             center=center)  # already converted
 
     # putmask here?
     result[np.isnan(result)] = 0
@@ -233,7 +252,10 @@ def rolling_cov(arg1, arg2=None, window=None, min_periods=None, freq=None,
     def _get_cov(X, Y):
         mean = lambda x: rolling_mean(x, window, min_periods, center=center)
         count = rolling_count(X + Y, window, center=center)
+        # a single observation (common with offset windows) has no
+        # covariance, whatever the rounding residue of the means
         bias_adj = count / (count - 1)
+        bias_adj[count < 2] = np.nan
         return (mean(X * Y) - mean(X) * mean(Y)) * bias_adj
     rs = _flex_binary_moment(arg1, arg2, _get_cov, pairwise=bool(pairwise))
     return rs
@@ -287,10 +309,9 @@ def _flex_binary_moment(arg1, arg2, f, pairwise=False):
         if isinstance(arg2, DataFrame):
             if pairwise is False:
                 if arg1 is arg2:
-                    # special case in order to handle duplicate column names
-                    for i, col in enumerate(arg1.columns):
-                        results[i] = f(arg1.iloc[:, i], arg2.iloc[:, i])
-                    return dataframe_from_int_dict(results, arg1)
+                    # the moments of all the columns are computed at once,
+                    # positionally, which handles duplicate column names
+                    return f(arg1, arg2)
                 else:
                     if not arg1.columns.is_unique:
                         raise ValueError("'arg1' columns are not unique")
@@ -300,10 +321,7 @@ def _flex_binary_moment(arg1, arg2, f, pairwise=False):
                     X = X + 0 * Y
                     Y = Y + 0 * X
                     res_columns = arg1.columns.union(arg2.columns)
-                    for col in res_columns:
-                        if col in X and col in Y:
-                            results[col] = f(X[col], Y[col])
-                    return DataFrame(results, index=X.index, columns=res_columns)
+                    return f(X, Y).reindex(columns=res_columns)
             elif pairwise is True:
                 results = defaultdict(dict)
                 for i, k1 in enumerate(arg1.columns):
@@ -319,6 +337,11 @@ def _flex_binary_moment(arg1, arg2, f, pairwise=False):
                 return p
             else:
                 raise ValueError("'pairwise' is not True/False")
+        elif isinstance(arg2, Series) and arg1.columns.is_unique:
+            # broadcast the series against all the columns at once
+            X = arg1.add(0 * arg2, axis=0)
+            Y = (0 * arg1).add(arg2, axis=0)
+            return f(X, Y).reindex(arg1.index)
         else:
             results = {}
             for i, col in enumerate(arg1.columns):
@@ -343,7 +366,7 @@ def rolling_corr_pairwise(df1, df2=None, window=None, min_periods=None,
 
 
 def _rolling_moment(arg, window, func, minp, axis=0, freq=None, center=False,
-                    how=None, args=(), kwargs={}, **kwds):
+                    how=None, args=(), kwargs={}, blockwise=False, **kwds):
     """
     Rolling statistical measure using supplied function. Designed to be
     used with passed-in Cython array-based functions.
@@ -366,6 +389,9 @@ def _rolling_moment(arg, window, func, minp, axis=0, freq=None, center=False,
         Passed on to func
     kwargs : dict
         Passed on to func
+    blockwise : boolean, default False
+        Whether func also accepts 2-d arrays, computing the statistic of each
+        of their columns
 
     Returns
     -------
@@ -373,13 +399,22 @@ def _rolling_moment(arg, window, func, minp, axis=0, freq=None, center=False,
     """
     arg = _conv_timerule(arg, freq, how)
     offset = int((window - 1) / 2.) if center else 0
-    additional_nans = np.array([np.NaN] * offset)
-    calc = lambda x: func(np.concatenate((x, additional_nans)) if center else x,
-                          window, minp=minp, args=args, kwargs=kwargs,
-                          **kwds)
+
+    def calc(x):
+        if center:
+            additional_nans = np.empty((offset,) + x.shape[1:])
+            additional_nans.fill(np.NaN)
+            x = np.concatenate((x, additional_nans))
+        return func(x, window, minp=minp, args=args, kwargs=kwargs, **kwds)
+
     return_hook, values = _process_data_structure(arg)
-    # actually calculate the moment. Faster way to do this?
-    if values.ndim > 1:
+    # actually calculate the moment
+    if values.ndim == 2 and blockwise and axis in (0, 1):
+        if axis == 0:
+            result = _rolling_block(calc, values)
+        else:
+            result = _rolling_block(calc, values.T).T
+    elif values.ndim > 1:
         result = np.apply_along_axis(calc, axis, values)
     else:
         result = calc(values)
@@ -390,6 +425,99 @@ def _rolling_moment(arg, window, func, minp, axis=0, freq=None, center=False,
     return return_hook(result)
 
 
+def _rolling_offset_moment(arg, window, func, minp, axis=0, freq=None,
+                           center=False, how=None, **kwds):
+    """
+    Rolling statistical measure over windows spanning a fixed period of the
+    DatetimeIndex of arg, rather than a fixed number of observations
+
+    Parameters
+    ----------
+    arg : Series or DataFrame
+    window : int
+        Width of the windows in nanoseconds
+    func : Cython function to compute rolling statistic on raw series, from
+        the values, the int64 index, window and minp
+    minp : int
+        Minimum number of observations required to have a value
+    axis : int, default 0
+    freq : None or string alias / date offset object, default=None
+        Frequency to conform to before computing statistic
+    center : boolean, default False
+        Not supported for offset windows
+    how : string, default 'mean'
+        Method for down- or re-sampling
+
+    Returns
+    -------
+    y : type of input
+    """
+    if center:
+        raise NotImplementedError('center is not implemented for offset '
+                                  'windows')
+    if axis != 0:
+        raise NotImplementedError('offset windows are only implemented for '
+                                  'axis=0')
+
+    arg = _conv_timerule(arg, freq, how)
+    if not (isinstance(arg, (Series, DataFrame)) and
+            isinstance(arg.index, DatetimeIndex)):
+        raise ValueError('offset windows require a Series or DataFrame '
+                         'with a DatetimeIndex')
+    index = arg.index.asi8
+    if (index == tslib.iNaT).any() or not arg.index.is_monotonic:
+        raise ValueError('offset windows require a monotonic increasing '
+                         'index without NaT')
+
+    return_hook, values = _process_data_structure(arg)
+    calc = lambda x: func(x, index, window, minp, **kwds)
+    if values.ndim > 1:
+        result = np.apply_along_axis(calc, axis, values)
+    else:
+        result = calc(values)
+
+    return return_hook(result)
+
+
+def _get_window_nanos(window):
+    """
+    The width in nanoseconds of an offset window (a fixed frequency string
+    alias or DateOffset, or a timedelta), or None for a number of
+    observations
+    """
+    if isinstance(window, (timedelta, np.timedelta64)):
+        return tslib._delta_to_nanoseconds(window)
+    if isinstance(window, (compat.string_types, DateOffset)):
+        offset = to_offset(window)
+        if not isinstance(offset, Tick):
+            raise ValueError('window must be a fixed frequency, got %s'
+                             % window)
+        return offset.nanos
+    return None
+
+
+def _rolling_block(calc, values):
+    """
+    Compute the rolling statistic of all the columns of the 2-d values at
+    once, or of slices of them concurrently if compute.rolling_threads > 1
+    """
+    nthreads = min(get_option('compute.rolling_threads'), values.shape[1])
+    if nthreads <= 1:
+        return calc(values)
+
+    # the kernels release the GIL, so slices of columns can be computed
+    # concurrently
+    slices = np.array_split(values, nthreads, axis=1)
+    pool = ThreadPool(nthreads)
+    try:
+        results = pool.map(calc, slices)
+    finally:
+        pool.close()
+        pool.join()
+
+    return np.concatenate(results, axis=1)
+
+
 def _center_window(rs, window, axis):
     if axis > rs.ndim-1:
         raise ValueError("Requested axis is larger then no. of argument "
@@ -422,7 +550,9 @@ def _process_data_structure(arg, kill_inf=True):
         values = values.astype(float)
 
     if kill_inf:
-        values = values.copy()
+        # keep the layout of the values, so that the 2-d kernels walk
+        # contiguous columns
+        values = values.copy(order='K')
         values[np.isinf(values)] = np.NaN
 
     return return_hook, values
@@ -611,7 +741,8 @@ def _use_window(minp, window):
         return minp
 
 
-def _rolling_func(func, desc, check_minp=_use_window, how=None):
+def _rolling_func(func, desc, check_minp=_use_window, how=None,
+                  block_func=None, offset_func=None):
     if how is None:
         how_arg_str = 'None'
     else:
@@ -623,26 +754,54 @@ def _rolling_func(func, desc, check_minp=_use_window, how=None):
     @wraps(func)
     def f(arg, window, min_periods=None, freq=None, center=False, how=how,
           **kwargs):
+        nanos = _get_window_nanos(window)
+        if nanos is not None:
+            if offset_func is None:
+                raise NotImplementedError('offset windows are not '
+                                          'implemented for this moment')
+            # a window of a period holds at least the current observation
+            minp = check_minp(1 if min_periods is None else min_periods,
+                              None)
+            return _rolling_offset_moment(arg, nanos, offset_func, minp,
+                                          freq=freq, center=center, how=how,
+                                          **kwargs)
+
         def call_cython(arg, window, minp, args=(), kwargs={}, **kwds):
             minp = check_minp(minp, window)
+            if arg.ndim > 1:
+                return block_func(arg, window, minp, **kwds)
             return func(arg, window, minp, **kwds)
         return _rolling_moment(arg, window, call_cython, min_periods, freq=freq,
-                               center=center, how=how, **kwargs)
+                               center=center, how=how,
+                               blockwise=block_func is not None, **kwargs)
 
     return f
 
-rolling_max = _rolling_func(algos.roll_max2, 'Moving maximum.', how='max')
-rolling_min = _rolling_func(algos.roll_min2, 'Moving minimum.', how='min')
-rolling_sum = _rolling_func(algos.roll_sum, 'Moving sum.')
-rolling_mean = _rolling_func(algos.roll_mean, 'Moving mean.')
+rolling_max = _rolling_func(algos.roll_max2, 'Moving maximum.', how='max',
+                            block_func=algos.roll_max_2d,
+                            offset_func=algos.roll_max_variable)
+rolling_min = _rolling_func(algos.roll_min2, 'Moving minimum.', how='min',
+                            block_func=algos.roll_min_2d,
+                            offset_func=algos.roll_min_variable)
+rolling_sum = _rolling_func(algos.roll_sum, 'Moving sum.',
+                            block_func=algos.roll_sum_2d,
+                            offset_func=algos.roll_sum_variable)
+rolling_mean = _rolling_func(algos.roll_mean, 'Moving mean.',
+                             block_func=algos.roll_mean_2d,
+                             offset_func=algos.roll_mean_variable)
 rolling_median = _rolling_func(algos.roll_median_cython, 'Moving median.',
                                how='median')
 
 _ts_std = lambda *a, **kw: _zsqrt(algos.roll_var(*a, **kw))
+_block_std = lambda *a, **kw: _zsqrt(algos.roll_var_2d(*a, **kw))
+_offset_std = lambda *a, **kw: _zsqrt(algos.roll_var_variable(*a, **kw))
 rolling_std = _rolling_func(_ts_std, 'Unbiased moving standard deviation.',
-                            check_minp=_require_min_periods(1))
+                            check_minp=_require_min_periods(1),
+                            block_func=_block_std, offset_func=_offset_std)
 rolling_var = _rolling_func(algos.roll_var, 'Unbiased moving variance.',
-                            check_minp=_require_min_periods(1))
+                            check_minp=_require_min_periods(1),
+                            block_func=algos.roll_var_2d,
+                            offset_func=algos.roll_var_variable)
 rolling_skew = _rolling_func(algos.roll_skew, 'Unbiased moving skewness.',
                              check_minp=_require_min_periods(3))
 rolling_kurt = _rolling_func(algos.roll_kurt, 'Unbiased moving kurtosis.',
@@ -851,7 +1010,7 @@ def _pop_args(win_type, arg_names, kwargs):
     return all_args
 
 
-def _expanding_func(func, desc, check_minp=_use_window):
+def _expanding_func(func, desc, check_minp=_use_window, block_func=None):
     @Substitution(desc, _unary_arg, _expanding_kw, _type_of_input_retval, "")
     @Appender(_doc_template)
     @wraps(func)
@@ -860,24 +1019,32 @@ def _expanding_func(func, desc, check_minp=_use_window):
 
         def call_cython(arg, window, minp, args=(), kwargs={}, **kwds):
             minp = check_minp(minp, window)
+            if arg.ndim > 1:
+                return block_func(arg, window, minp, **kwds)
             return func(arg, window, minp, **kwds)
         return _rolling_moment(arg, window, call_cython, min_periods, freq=freq,
-                               **kwargs)
+                               blockwise=block_func is not None, **kwargs)
 
     return f
 
-expanding_max = _expanding_func(algos.roll_max2, 'Expanding maximum.')
-expanding_min = _expanding_func(algos.roll_min2, 'Expanding minimum.')
-expanding_sum = _expanding_func(algos.roll_sum, 'Expanding sum.')
-expanding_mean = _expanding_func(algos.roll_mean, 'Expanding mean.')
+expanding_max = _expanding_func(algos.roll_max2, 'Expanding maximum.',
+                                block_func=algos.roll_max_2d)
+expanding_min = _expanding_func(algos.roll_min2, 'Expanding minimum.',
+                                block_func=algos.roll_min_2d)
+expanding_sum = _expanding_func(algos.roll_sum, 'Expanding sum.',
+                                block_func=algos.roll_sum_2d)
+expanding_mean = _expanding_func(algos.roll_mean, 'Expanding mean.',
+                                 block_func=algos.roll_mean_2d)
 expanding_median = _expanding_func(
     algos.roll_median_cython, 'Expanding median.')
 
 expanding_std = _expanding_func(_ts_std,
                                 'Unbiased expanding standard deviation.',
-                                check_minp=_require_min_periods(2))
+                                check_minp=_require_min_periods(2),
+                                block_func=_block_std)
 expanding_var = _expanding_func(algos.roll_var, 'Unbiased expanding variance.',
-                                check_minp=_require_min_periods(2))
+                                check_minp=_require_min_periods(2),
+                                block_func=algos.roll_var_2d)
 expanding_skew = _expanding_func(
     algos.roll_skew, 'Unbiased expanding skewness.',
     check_minp=_require_min_periods(3))
@@ -1017,3 +1184,252 @@ def expanding_apply(arg, func, min_periods=1, freq=None,
     window = len(arg)
     return rolling_apply(arg, window, func, min_periods=min_periods, freq=freq,
                          args=args, kwargs=kwargs)
+
+#------------------------------------------------------------------------------
+# Online moments
+
+
+class _OnlineMoment(object):
+    """
+    Base class of the moments of a stream of observations, which are updated
+    incrementally from the state left by the previous observations
+    """
+
+    def __init__(self):
+        self._columns = None
+        self._states = None
+
+    def update(self, arg):
+        """
+        Add observations to the stream
+
+        Parameters
+        ----------
+        arg : Series, DataFrame or ndarray
+            The observations following those of the previous updates (the
+            first update can be the whole history). The columns of a
+            DataFrame or 2-d ndarray are separate streams and must be the
+            same for all the updates.
+
+        Returns
+        -------
+        y : type of input, the moment at each of the new observations
+        """
+        return_hook, values = _process_data_structure(arg)
+        if values.ndim > 2:
+            raise ValueError('can only update with 1-d or 2-d data')
+        columns = getattr(arg, 'columns', None)
+        ncols = values.shape[1] if values.ndim == 2 else None
+
+        if self._states is None:
+            self._ncols = ncols
+            self._columns = columns
+            self._states = [self._init_state()
+                            for j in range(ncols or 1)]
+        elif ncols != self._ncols or not (
+                columns is None or self._columns is None or
+                columns.equals(self._columns)):
+            raise ValueError('the columns of the updates must be the same '
+                             'as those of the first one')
+
+        if values.ndim == 1:
+            result = self._update_column(self._states[0], values)
+        else:
+            result = np.empty(values.shape, dtype=float, order='F')
+            for j, state in enumerate(self._states):
+                result[:, j] = self._update_column(state, values[:, j])
+
+        return return_hook(result)
+
+    def _init_state(self):
+        raise NotImplementedError
+
+    def _update_column(self, state, values):
+        raise NotImplementedError
+
+
+class OnlineRolling(_OnlineMoment):
+    """
+    Rolling moment of a stream of observations, updated incrementally
+
+    Parameters
+    ----------
+    window : int
+        Size of the moving window. This is the number of observations used for
+        calculating the statistic.
+    moment : {'sum', 'mean', 'count', 'var', 'std', 'min', 'max'}
+        The statistic to compute, default 'mean'
+    min_periods : int, default None
+        Minimum number of observations in window required to have a value
+        (otherwise result is NA).
+    ddof : int, default 1
+        Delta degrees of freedom of the variance and standard deviation
+
+    Notes
+    -----
+    Each update gives the same results as the corresponding ``rolling_``
+    function over all the observations so far, at the new observations. The
+    sum, mean, count and variance carry on from the running state of the
+    previous updates and keep the last ``window`` observations in a ring
+    buffer, so an update of k observations costs O(k); the minimum and
+    maximum are recomputed over the last ``window`` observations and the new
+    ones, in O(window + k).
+
+    Examples
+    --------
+    >>> roll = OnlineRolling(20, 'std')
+    >>> roll.update(history)  # same as rolling_std(history, 20)
+    >>> roll.update(ticks)  # the next values of rolling_std
+    """
+
+    _moments = ['sum', 'mean', 'count', 'var', 'std', 'min', 'max']
+
+    def __init__(self, window, moment='mean', min_periods=None, ddof=1):
+        super(OnlineRolling, self).__init__()
+        if moment not in self._moments:
+            raise ValueError('moment must be one of %s' % self._moments)
+        window = int(window)
+        if window < 1:
+            raise ValueError('Invalid window size %d' % window)
+
+        if moment == 'count':
+            minp = 1
+        elif moment in ('var', 'std'):
+            minp = _require_min_periods(1)(min_periods, window)
+        else:
+            minp = _use_window(min_periods, window)
+
+        self.window = window
+        self.moment = moment
+        self.min_periods = minp
+        self.ddof = ddof
+
+    def _init_state(self):
+        # the last window observations in a ring buffer, the number of
+        # observations so far, and the running quantities of the kernel
+        nrunning = 3 if self.moment in ('mean', 'var', 'std') else 2
+        return [np.empty(self.window), 0, np.zeros(nrunning)]
+
+    def _update_column(self, state, values):
+        ring, pos, running = state
+        if self.moment == 'count':
+            values = np.isfinite(values).astype(float)
+        state[1] = pos + len(values)
+
+        minp = self.min_periods
+        if self.moment in ('sum', 'count'):
+            result = algos.roll_sum_online(values, ring, pos, minp, running)
+            if self.moment == 'count':
+                result[np.isnan(result)] = 0
+        elif self.moment == 'mean':
+            result = algos.roll_mean_online(values, ring, pos, minp, running)
+        elif self.moment in ('var', 'std'):
+            result = algos.roll_var_online(values, ring, pos, minp, running,
+                                           ddof=self.ddof)
+            if self.moment == 'std':
+                result = _zsqrt(result)
+        elif len(values):
+            window = self.window
+            # the last window observations in order, followed by the new ones
+            slot = pos % window
+            tail = ring[:pos] if pos < window else np.roll(ring, -slot)
+            func = algos.roll_max2 if self.moment == 'max' else algos.roll_min2
+            result = func(np.concatenate((tail, values)), window,
+                          minp)[len(tail):]
+
+            last = values[-window:]
+            ring[np.arange(state[1] - len(last), state[1]) % window] = last
+        else:
+            result = values
+
+        return result
+
+
+class OnlineEWM(_OnlineMoment):
+    """
+    Exponentially-weighted moment of a stream of observations, updated
+    incrementally
+
+    Parameters
+    ----------
+    com : float, optional
+        Center of mass: :math:`\\alpha = 1 / (1 + com)`,
+    span : float, optional
+        Specify decay in terms of span, :math:`\\alpha = 2 / (span + 1)`
+    halflife : float, optional
+        Specify decay in terms of halflife,
+        :math:`\\alpha = 1 - exp(log(0.5) / halflife)`
+    min_periods : int, default 0
+        Number of observations in sample to require (only affects
+        beginning)
+    adjust : boolean, default True
+        Divide by decaying adjustment factor in beginning periods to account
+        for imbalance in relative weightings (viewing EWMA as a moving average)
+    ignore_na : boolean, default False
+        Ignore missing values when calculating weights
+    moment : {'mean', 'var', 'std'}
+        The statistic to compute, default 'mean'
+    bias : boolean, default False
+        Use a standard estimation bias correction for the variance and
+        standard deviation
+
+    Notes
+    -----
+    Each update gives the same results as ``ewma``, ``ewmvar`` or ``ewmstd``
+    over all the observations so far, at the new observations, and costs
+    O(k) for k new observations.
+
+    Examples
+    --------
+    >>> ewm = OnlineEWM(span=20)
+    >>> ewm.update(history)  # same as ewma(history, span=20)
+    >>> ewm.update(ticks)  # the next values of ewma
+    """
+
+    _moments = ['mean', 'var', 'std']
+
+    def __init__(self, com=None, span=None, halflife=None, min_periods=0,
+                 adjust=True, ignore_na=False, moment='mean', bias=False):
+        super(OnlineEWM, self).__init__()
+        if moment not in self._moments:
+            raise ValueError('moment must be one of %s' % self._moments)
+
+        self.com = _get_center_of_mass(com, span, halflife)
+        self.min_periods = min_periods
+        self.adjust = adjust
+        self.ignore_na = ignore_na
+        self.moment = moment
+        self.bias = bias
+
+    def _init_state(self):
+        # the states of the averages of the observations and of their
+        # squares, and the number of observations since the first valid one
+        return [np.array([NaN, 1.]), np.array([NaN, 1.]), 0]
+
+    def _ewma(self, values, running, seen):
+        result = algos.ewma_online(values, self.com, int(self.adjust),
+                                   int(self.ignore_na), running)
+        # the first min_periods - 1 observations from the first valid one
+        # are masked, like in ewma
+        count = seen + np.arange(1, len(values) + 1)
+        if not seen:
+            valid = notnull(values)
+            if not valid.any():
+                return result, 0
+            count -= valid.argmax()
+        result[(count > 0) & (count < self.min_periods)] = NaN
+        return result, (count[-1] if len(count) else seen)
+
+    def _update_column(self, state, values):
+        seen = state[2]
+        result, state[2] = self._ewma(values, state[0], seen)
+
+        if self.moment != 'mean':
+            moment2nd, _ = self._ewma(values * values, state[1], seen)
+            result = moment2nd - result ** 2
+            if not self.bias:
+                result *= (1.0 + 2.0 * self.com) / (2.0 * self.com)
+            if self.moment == 'std':
+                result = _zsqrt(result)
+
+        return result
@@ -2,11 +2,14 @@ import nose
 import sys
 import functools
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from numpy.random import randn
 import numpy as np
 
-from pandas import Series, DataFrame, Panel, bdate_range, isnull, notnull
+from pandas import (Series, DataFrame, Panel, DatetimeIndex, Timestamp,
+                    bdate_range, isnull, notnull)
+from pandas.core.config import option_context
+from pandas.tools.merge import concat as pd_concat
 from pandas.util.testing import (
     assert_almost_equal, assert_series_equal, assert_frame_equal, assert_panel_equal, assert_index_equal
 )
@@ -311,6 +314,206 @@ class TestMoments(tm.TestCase):
         self._check_moment_func(mom.rolling_kurt,
                                 lambda x: kurtosis(x, bias=False))
 
+    def test_rolling_block_kernels(self):
+        frame = DataFrame(randn(N, K), index=self.rng, columns=np.arange(K))
+        frame.iloc[20:40, 2] = np.NaN
+        frame.iloc[::7, 5] = np.NaN
+        frame.iloc[:, 7] = -frame.iloc[:, 7].abs()
+
+        funcs = [mom.rolling_sum, mom.rolling_mean, mom.rolling_var,
+                 mom.rolling_std, mom.rolling_min, mom.rolling_max]
+
+        for func in funcs:
+            for kwds in [dict(), dict(min_periods=5), dict(center=True)]:
+                expected = frame.apply(lambda x: func(x, 10, **kwds))
+                assert_frame_equal(func(frame, 10, **kwds), expected)
+
+                # transposed
+                result = func(frame.T, 10, axis=1, **kwds)
+                assert_frame_equal(result, expected.T)
+
+                with option_context('compute.rolling_threads', 3):
+                    assert_frame_equal(func(frame, 10, **kwds), expected)
+
+        result = mom.rolling_count(frame, 10)
+        expected = frame.apply(lambda x: mom.rolling_count(x, 10))
+        assert_frame_equal(result, expected)
+
+        for func in [mom.expanding_sum, mom.expanding_mean,
+                     mom.expanding_var, mom.expanding_std,
+                     mom.expanding_min, mom.expanding_max]:
+            expected = frame.apply(func)
+            assert_frame_equal(func(frame), expected)
+
+        result = mom.rolling_var(frame, 10, ddof=0)
+        expected = frame.apply(lambda x: mom.rolling_var(x, 10, ddof=0))
+        assert_frame_equal(result, expected)
+
+        # window larger than the frame
+        result = mom.rolling_var(frame.iloc[:5], 10, min_periods=2)
+        expected = frame.iloc[:5].apply(
+            lambda x: mom.rolling_var(x, 10, min_periods=2))
+        assert_frame_equal(result, expected)
+
+        # cov and corr of frames, and of a frame and a series
+        for func in [mom.rolling_cov, mom.rolling_corr]:
+            result = func(frame, frame, 10, pairwise=False)
+            expected = frame.apply(lambda x: func(x, x, 10))
+            assert_frame_equal(result, expected)
+
+            series = frame[3]
+            result = func(frame, series, 10)
+            expected = frame.apply(lambda x: func(x, series, 10))
+            assert_frame_equal(result, expected)
+
+            # the result keeps the index of the frame
+            series = Series(randn(N + 40),
+                            index=bdate_range(datetime(2008, 12, 1),
+                                              periods=N + 40))
+            result = func(frame, series, 10)
+            expected = DataFrame(dict((c, func(frame[c], series, 10))
+                                      for c in frame.columns),
+                                 index=frame.index, columns=frame.columns)
+            assert_frame_equal(result, expected)
+
+    def test_rolling_offset_window(self):
+        # irregular timestamps, a few seconds apart
+        np.random.seed(1234)
+        stamps = np.cumsum(np.random.randint(1, 20, size=N)) * 10**9
+        index = DatetimeIndex(stamps + Timestamp('2014-01-01').value)
+        series = Series(randn(N), index=index)
+        series[10:15] = np.NaN
+        series[50] = np.NaN
+        window = timedelta(seconds=30)
+
+        def brute_force(obj, static_comp, min_periods=1):
+            result = []
+            for t in obj.index:
+                x = obj[(obj.index > t - window) & (obj.index <= t)]
+                x = x[notnull(x)].values
+                if len(x) >= max(min_periods, 1):
+                    result.append(static_comp(x))
+                else:
+                    result.append(np.NaN)
+            return Series(result, index=obj.index)
+
+        static = [(mom.rolling_sum, np.sum),
+                  (mom.rolling_mean, np.mean),
+                  (mom.rolling_max, np.max),
+                  (mom.rolling_min, np.min),
+                  (mom.rolling_var,
+                   lambda x: np.var(x, ddof=1) if len(x) > 1 else 0),
+                  (mom.rolling_std,
+                   lambda x: np.std(x, ddof=1) if len(x) > 1 else 0)]
+
+        for func, static_comp in static:
+            for offset in ['30s', '30S', datetools.Second(30), window]:
+                result = func(series, offset)
+                assert_series_equal(result, brute_force(series, static_comp))
+
+            result = func(series, '30s', min_periods=3)
+            expected = brute_force(series, static_comp, min_periods=3)
+            assert_series_equal(result, expected)
+
+            frame = DataFrame({'A': series, 'B': series * 2})
+            result = func(frame, '30s')
+            expected = frame.apply(lambda x: func(x, '30s'))
+            assert_frame_equal(result, expected)
+
+        result = mom.rolling_count(series, '30s')
+        assert_series_equal(result, brute_force(series, len).fillna(0))
+
+        # the bias adjustment of a single observation is undefined
+        result = mom.rolling_cov(series, series * 2, '30s')
+        expected = 2 * mom.rolling_var(series, '30s')
+        expected[mom.rolling_count(series, '30s') < 2] = np.NaN
+        assert_series_equal(result, expected)
+
+        # not supported
+        self.assertRaises(NotImplementedError, mom.rolling_median,
+                          series, '30s')
+        self.assertRaises(NotImplementedError, mom.rolling_sum,
+                          series, '30s', center=True)
+        self.assertRaises(ValueError, mom.rolling_sum, series, '1M')
+        self.assertRaises(ValueError, mom.rolling_sum, series.values, '30s')
+        self.assertRaises(ValueError, mom.rolling_sum, series[::-1], '30s')
+
+    def _check_online(self, online, batch, data):
+        # same results whether the data comes at once or in pieces
+        for bounds in [[0, N], [0, 1, 2, 30, 31, 75, N], [0, 60, 60, N]]:
+            moment = online()
+            pieces = [moment.update(data[start:stop])
+                      for start, stop in zip(bounds[:-1], bounds[1:])]
+            if isinstance(data, np.ndarray):
+                result = np.concatenate(pieces)
+                assert_almost_equal(result, batch(data))
+            elif isinstance(data, Series):
+                assert_series_equal(pd_concat(pieces), batch(data))
+            else:
+                assert_frame_equal(pd_concat(pieces), batch(data))
+
+    def test_online_rolling(self):
+        frame = self.frame.copy()
+        frame.iloc[20:40, 2] = np.NaN
+        frame.iloc[5, 3] = np.inf
+
+        batch_funcs = {'sum': mom.rolling_sum, 'mean': mom.rolling_mean,
+                       'var': mom.rolling_var, 'std': mom.rolling_std,
+                       'min': mom.rolling_min, 'max': mom.rolling_max}
+        for moment, func in batch_funcs.items():
+            for kwds in [dict(), dict(min_periods=5)]:
+                online = lambda: mom.OnlineRolling(10, moment, **kwds)
+                batch = lambda x: func(x, 10, **kwds)
+                self._check_online(online, batch, self.arr)
+                self._check_online(online, batch, self.series)
+                self._check_online(online, batch, frame)
+
+        online = lambda: mom.OnlineRolling(10, 'var', ddof=0)
+        batch = lambda x: mom.rolling_var(x, 10, ddof=0)
+        self._check_online(online, batch, self.series)
+
+        online = lambda: mom.OnlineRolling(10, 'count')
+        batch = lambda x: mom.rolling_count(x, 10)
+        self._check_online(online, batch, self.series)
+        self._check_online(online, batch, frame)
+
+        # window longer than the data
+        online = lambda: mom.OnlineRolling(200, 'mean', min_periods=1)
+        batch = lambda x: mom.rolling_mean(x, 200, min_periods=1)
+        self._check_online(online, batch, self.series)
+
+        roll = mom.OnlineRolling(10)
+        roll.update(frame)
+        self.assertRaises(ValueError, roll.update, frame.iloc[:, :3])
+        self.assertRaises(ValueError, roll.update, self.series)
+        self.assertRaises(ValueError, mom.OnlineRolling, 10, 'median')
+        self.assertRaises(ValueError, mom.OnlineRolling, 0)
+
+    def test_online_ewm(self):
+        frame = self.frame.copy()
+        frame.iloc[20:40, 2] = np.NaN
+        frame.iloc[:10, 4] = np.NaN
+
+        batch_funcs = {'mean': mom.ewma, 'var': mom.ewmvar,
+                       'std': mom.ewmstd}
+        for moment, func in batch_funcs.items():
+            for kwds in [dict(com=5), dict(span=10, min_periods=5),
+                         dict(halflife=3, ignore_na=True),
+                         dict(com=5, bias=True)]:
+                if moment == 'mean' and 'bias' in kwds:
+                    continue
+                online = lambda: mom.OnlineEWM(moment=moment, **kwds)
+                batch = lambda x: func(x, **kwds)
+                self._check_online(online, batch, self.arr)
+                self._check_online(online, batch, self.series)
+                self._check_online(online, batch, frame)
+
+        online = lambda: mom.OnlineEWM(com=5, adjust=False)
+        batch = lambda x: mom.ewma(x, com=5, adjust=False)
+        self._check_online(online, batch, self.series)
+
+        self.assertRaises(ValueError, mom.OnlineEWM, com=5, moment='corr')
+
     def test_fperr_robustness(self):
         # TODO: remove this once python 2.5 out of picture
         if PY3:
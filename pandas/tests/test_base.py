@@ -271,6 +271,21 @@ class TestIndexOps(Ops):
         self.assertEqual(Index([1]).item(), 1)
         self.assertEqual(Series([1]).item(), 1)
 
+    def test_memory_usage(self):
+        for o in self.objs:
+            res = o.memory_usage()
+            res_deep = o.memory_usage(deep=True)
+
+            if o.dtype == np.object_:
+                self.assertTrue(res_deep > res)
+            else:
+                self.assertEqual(res, res_deep)
+                self.assertEqual(res, o.nbytes)
+
+            if isinstance(o, Series):
+                self.assertEqual(o.memory_usage(index=True),
+                                 res + o.index.memory_usage())
+
     def test_ops(self):
         for op in ['max','min']:
             for o in self.objs:
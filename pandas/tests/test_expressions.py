@@ -204,10 +204,8 @@ class TestExpressions(tm.TestCase):
                        assert_func=assert_panel4d_equal, binary_comp=3)
 
     def test_mixed_arithmetic_frame(self):
-        # TODO: FIGURE OUT HOW TO GET IT TO WORK...
-        # can't do arithmetic because comparison methods try to do *entire*
-        # frame instead of by-column
-        self.run_frame(self.mixed2, self.mixed2, run_binary=False)
+        # the comparisons evaluate the columns by pairs of dtypes
+        self.run_frame(self.mixed2, self.mixed2)
 
     def test_mixed_arithmetic_series(self):
         for col in self.mixed2.columns:
@@ -318,6 +316,34 @@ class TestExpressions(tm.TestCase):
         expr.set_numexpr_threads()
         testit()
 
+    def test_calibration(self):
+        expr.set_numexpr_calibration(True)
+        try:
+            expr._can_use_numexpr(operator.add, '+', self.frame, self.frame,
+                                  'evaluate')
+            thresholds = expr.get_numexpr_thresholds()
+            self.assertEqual(list(thresholds), [('+', 'float64')])
+            self.assertIn(thresholds[('+', 'float64')],
+                          [0] + expr._CALIBRATION_SIZES)
+
+            # below the smallest measured size numpy is used
+            result = expr._can_use_numexpr(operator.add, '+', self.frame2,
+                                           self.frame2, 'evaluate')
+            self.assertFalse(result)
+            self.assertEqual(len(expr.get_numexpr_thresholds()), 1)
+
+            # the measures depend on the number of threads
+            expr.set_numexpr_threads(1)
+            self.assertEqual(expr.get_numexpr_thresholds(), {})
+
+            for f in [self.frame, self.integer, self.mixed]:
+                expected = DataFrame(f.values * 2 > f.values, index=f.index,
+                                     columns=f.columns)
+                assert_frame_equal(f * 2 > f, expected)
+        finally:
+            expr.set_numexpr_threads()
+            expr.set_numexpr_calibration(False)
+
     def test_where(self):
 
         def testit():
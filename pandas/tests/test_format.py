@@ -43,7 +43,9 @@ def has_info_repr(df):
 def has_non_verbose_info_repr(df):
     has_info = has_info_repr(df)
     r = repr(df)
-    nv = len(r.split('\n')) == 4  # 1. <class>, 2. Index, 3. Columns, 4. dtype
+    # 1. <class>, 2. Index, 3. Columns, 4. dtype, 5. memory usage (if shown)
+    nlines = 5 if get_option('display.memory_usage') else 4
+    nv = len(r.split('\n')) == nlines
     return has_info and nv
 
 def has_horizontally_truncated_repr(df):
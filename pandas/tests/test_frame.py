@@ -6472,7 +6472,7 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
 
     def test_info_max_cols(self):
         df = DataFrame(np.random.randn(10, 5))
-        for len_, verbose in [(4, None), (4, False), (9, True)]:
+        for len_, verbose in [(5, None), (5, False), (10, True)]:
         # For verbose always      ^ setting  ^ summarize ^ full output
             with option_context('max_info_columns', 4):
                 buf = StringIO()
@@ -6480,7 +6480,7 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
                 res = buf.getvalue()
                 self.assertEqual(len(res.split('\n')), len_)
 
-        for len_, verbose in [(9, None), (4, False), (9, True)]:
+        for len_, verbose in [(10, None), (5, False), (10, True)]:
 
             # max_cols no exceeded
             with option_context('max_info_columns', 5):
@@ -6489,7 +6489,7 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
                 res = buf.getvalue()
                 self.assertEqual(len(res.split('\n')), len_)
 
-        for len_, max_cols in [(9, 5), (4, 4)]:
+        for len_, max_cols in [(10, 5), (5, 4)]:
             # setting truncates
             with option_context('max_info_columns', 4):
                 buf = StringIO()
@@ -6504,6 +6504,114 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
                 res = buf.getvalue()
                 self.assertEqual(len(res.split('\n')), len_)
 
+    def test_info_memory_usage(self):
+        dtypes = ['int64', 'float64', 'datetime64[ns]', 'timedelta64[ns]',
+                  'complex128', 'object', 'bool']
+        data = {}
+        n = 10
+        for i, dtype in enumerate(dtypes):
+            data[i] = np.random.randint(2, size=n).astype(dtype)
+        df = DataFrame(data)
+
+        buf = StringIO()
+        df.info(buf=buf, memory_usage=True)
+        res = buf.getvalue().splitlines()
+        self.assertTrue("memory usage: " in res[-1])
+        # only the pointers of the object column are counted
+        self.assertTrue('+' in res[-1])
+
+        buf = StringIO()
+        df.info(buf=buf, memory_usage='deep')
+        res = buf.getvalue().splitlines()
+        self.assertTrue("memory usage: " in res[-1])
+        self.assertFalse('+' in res[-1])
+
+        buf = StringIO()
+        df.info(buf=buf, memory_usage=False)
+        res = buf.getvalue().splitlines()
+        self.assertTrue("memory usage: " not in res[-1])
+
+        with option_context('display.memory_usage', False):
+            buf = StringIO()
+            df.info(buf=buf)
+            res = buf.getvalue().splitlines()
+            self.assertTrue("memory usage: " not in res[-1])
+
+        df_with_object_index = DataFrame({'a': [1]}, index=['foo'])
+        buf = StringIO()
+        df_with_object_index.info(buf=buf, memory_usage=True)
+        res = buf.getvalue().splitlines()
+        self.assertTrue(res[-1].endswith('bytes'))
+
+    def test_memory_usage(self):
+        df = DataFrame({'a': np.arange(10, dtype='int64'),
+                        'b': np.arange(10.),
+                        'c': ['x' * 20] * 10})
+
+        result = df.memory_usage()
+        expected = Series([80, 80, 10 * np.dtype(object).itemsize],
+                          index=['a', 'b', 'c'])
+        assert_series_equal(result, expected)
+
+        result = df.memory_usage(index=True)
+        self.assertEqual(result.index[0], 'Index')
+        self.assertEqual(result['Index'], df.index.nbytes)
+        self.assertEqual(result.sum(), df.memory_usage().sum() +
+                         df.index.nbytes)
+
+        deep = df.memory_usage(deep=True)
+        self.assertEqual(deep['a'], 80)
+        self.assertTrue(deep['c'] > result['c'])
+        self.assertEqual(deep['c'] - result['c'],
+                         sum(sys.getsizeof(x) for x in df['c']))
+
+        # the BlockManager totals its blocks
+        self.assertEqual(df._data.memory_usage(), df.memory_usage().sum())
+        self.assertEqual(df._data.memory_usage(deep=True),
+                         df.memory_usage(deep=True).sum())
+
+    def test_downcast(self):
+        df = DataFrame({'a': np.arange(10, dtype='int64'),
+                        'b': np.arange(10, dtype='int64') * 1000,
+                        'c': np.arange(10, dtype='int64') * 10 ** 10,
+                        'd': np.arange(10.) / 4,
+                        'e': np.arange(10.) * 1e6 / 3,
+                        'f': ['x', 'y'] * 5,
+                        'g': list('abcdefghij')},
+                       columns=list('abcdefg'))
+        df.loc[3, 'd'] = np.nan
+
+        result = df.downcast()
+        self.assertEqual(result['a'].dtype, np.int8)
+        self.assertEqual(result['b'].dtype, np.int16)
+        self.assertEqual(result['c'].dtype, np.int64)
+        self.assertEqual(result['d'].dtype, np.float32)
+        self.assertEqual(result['e'].dtype, np.float64)
+        self.assertTrue(com.is_categorical_dtype(result['f']))
+        self.assertEqual(result['g'].dtype, np.object_)
+        self.assertTrue(result.memory_usage().sum() <
+                        df.memory_usage().sum())
+
+        # the values are preserved
+        for col in ['a', 'b', 'c', 'd', 'e']:
+            assert_series_equal(result[col].astype(df[col].dtype), df[col])
+        self.assert_numpy_array_equal(np.asarray(result['f']),
+                                      df['f'].values)
+        assert_series_equal(result['g'], df['g'])
+
+        result = df.downcast(categories=None)
+        self.assertEqual(result['f'].dtype, np.object_)
+
+        # small values that float32 can't hold exactly are kept
+        small = DataFrame({'a': [0.1, 0.123456789], 'b': [0.5, 2. ** -10]})
+        result = small.downcast()
+        self.assertEqual(result['a'].dtype, np.float64)
+        self.assertEqual(result['b'].dtype, np.float32)
+        assert_series_equal(result['a'], small['a'])
+
+        # the original is untouched
+        self.assertEqual(df['a'].dtype, np.int64)
+        self.assertEqual(df['f'].dtype, np.object_)
 
     def test_dtypes(self):
         self.mixed_frame['bool'] = self.mixed_frame['A'] > 0
@@ -2221,6 +2221,55 @@ class TestGroupBy(tm.TestCase):
         result = df.groupby('A', as_index=False).cumsum()
         assert_frame_equal(result,expected)
 
+    def test_cython_agg_threads(self):
+        df = DataFrame(np.random.randn(100, 20))
+        df[20] = np.random.randint(0, 5, size=100)
+        df[21] = df[0] > 0
+        df['key'] = np.random.randint(0, 10, size=100)
+        df.loc[::7, 3] = np.nan
+
+        grouped = df.groupby('key')
+        for how in ['sum', 'mean', 'var', 'min', 'max', 'first', 'last']:
+            expected = getattr(grouped, how)()
+            with option_context('compute.groupby_threads', 4):
+                result = getattr(df.groupby('key'), how)()
+            assert_frame_equal(result, expected)
+
+    def test_cython_transform(self):
+        df = DataFrame({'A': [1, 1, 2, 2, np.nan, 1, 2],
+                        'B': [1., np.nan, 3., -2., 5., 0.5, 4.],
+                        'C': [3, 1, 2, 5, 4, 2, 1]})
+
+        for how in ['cumsum', 'cumprod', 'cummin', 'cummax']:
+            f = lambda x: getattr(x, how)()
+            expected = df.groupby('A').apply(f)[['B', 'C']]
+            result = getattr(df.groupby('A'), how)()
+            assert_frame_equal(result, expected)
+
+            for col in ['B', 'C']:
+                result = getattr(df.groupby('A')[col], how)()
+                assert_series_equal(result, expected[col])
+
+        # int64 values beyond float64 precision stay exact
+        s = Series([2 ** 53 + 1, 1, 1])
+        result = s.groupby([0, 0, 0]).cumsum()
+        assert_series_equal(result, Series([2 ** 53 + 1, 2 ** 53 + 2,
+                                            2 ** 53 + 3]))
+
+    def test_groupby_shift(self):
+        df = DataFrame({'A': [1, 1, 2, 2, np.nan, 1, 2],
+                        'B': [1., np.nan, 3., -2., 5., 0.5, 4.],
+                        'C': [3, 1, 2, 5, 4, 2, 1],
+                        'D': list('abcdefg')})
+
+        for periods in [-3, -1, 0, 1, 2]:
+            f = lambda x: x.shift(periods)
+            expected = df.groupby('A').apply(f)[['B', 'C', 'D']]
+            assert_frame_equal(df.groupby('A').shift(periods), expected)
+
+            result = df.groupby('A')['C'].shift(periods)
+            assert_series_equal(result, expected['C'])
+
     def test_grouping_ndarray(self):
         grouped = self.df.groupby(self.df['A'].values)
 
@@ -2716,6 +2765,27 @@ class TestGroupBy(tm.TestCase):
         result = grouped.sum()
         _check_groupby(df, result, ['a', 'b'], 'd')
 
+    def test_groupby_nosort_multi(self):
+        # groups come out in the order they are first seen
+        df = DataFrame({'a': ['x', 'y', 'x', 'z', 'y', 'x', np.nan],
+                        'b': [2, 1, 2, 1, 3, 1, 1],
+                        'c': ['p', 'q', 'p', 'q', 'q', 'q', 'p'],
+                        'd': np.arange(7.)})
+
+        result = df.groupby(['a', 'b', 'c'], sort=False).sum()
+        expected_index = MultiIndex.from_tuples(
+            [('x', 2, 'p'), ('y', 1, 'q'), ('z', 1, 'q'), ('y', 3, 'q'),
+             ('x', 1, 'q')], names=['a', 'b', 'c'])
+        expected = DataFrame({'d': [2., 1., 3., 4., 5.]},
+                             index=expected_index)
+        assert_frame_equal(result, expected)
+
+        sorted_result = df.groupby(['a', 'b', 'c'], sort=True).sum()
+        assert_frame_equal(result.sort_index(), sorted_result)
+
+        result = df.groupby(['a', 'b', 'c'], sort=False)['d'].sum()
+        assert_series_equal(result, expected['d'])
+
     def test_intercept_builtin_sum(self):
         s = Series([1., 2., np.nan, 3.])
         grouped = s.groupby([0, 1, 2, 2])
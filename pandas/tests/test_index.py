@@ -795,6 +795,52 @@ class TestIndex(Base, tm.TestCase):
         rbfill1 = idx2.get_indexer(idx1, method='bfill')
         assert_almost_equal(r1, rbfill1)
 
+    def test_get_indexer_cache(self):
+        from pandas.core.index import _indexer_cache, _IndexerCache
+        import gc
+
+        idx1 = Index([1, 2, 3, 4, 5])
+        idx2 = Index([2, 4, 6])
+
+        r1 = idx1.get_indexer(idx2)
+        self.assertIsNotNone(_indexer_cache.get(idx1, idx2, None, None))
+
+        # callers get their own copy
+        r1[:] = 0
+        r2 = idx1.get_indexer(idx2)
+        assert_almost_equal(r2, [1, 3, -1])
+        assert_almost_equal(idx2.get_indexer(idx1, method='pad'),
+                            [-1, 0, 0, 1, 1])
+
+        # the entries go away with the index
+        cache = _IndexerCache(max_elements=10)
+        cache.set(idx1, idx2, None, None, r2)
+        cache.set(idx2, idx1, 'pad', None, np.array([-1, 0, 0, 1, 1]))
+        self.assertEqual(cache.nelements, 8)
+        del idx2
+        gc.collect()
+        self.assertIsNone(cache.get(idx1, idx1, None, None))
+        self.assertEqual(cache.nelements, 0)
+
+        # bounded by the number of elements, least recently used first out
+        idx3 = Index([1, 2])
+        cache.set(idx1, idx1, None, None, np.arange(5))
+        cache.set(idx3, idx3, None, None, np.arange(2))
+        cache.get(idx1, idx1, None, None)
+        cache.set(idx1, idx3, None, None, np.arange(2))
+        cache.set(idx3, idx1, None, None, np.arange(3))
+        self.assertIsNone(cache.get(idx3, idx3, None, None))
+        self.assertIsNotNone(cache.get(idx1, idx1, None, None))
+        self.assertEqual(cache.nelements, 10)
+
+        # an index whose identity was reset misses
+        mi = MultiIndex.from_tuples([(1, 'a'), (2, 'b')])
+        target = MultiIndex.from_tuples([(2, 'b'), (1, 'a')])
+        assert_almost_equal(mi.get_indexer(target), [1, 0])
+        mi.set_levels([[2, 1], ['b', 'a']], inplace=True)
+        self.assertIsNone(_indexer_cache.get(mi, target, None, None))
+        assert_almost_equal(mi.get_indexer(target), [0, 1])
+
     def test_slice_locs(self):
         idx = Index([0, 1, 2, 5, 6, 7, 9, 10])
         n = len(idx)
@@ -1238,6 +1284,44 @@ class TestInt64Index(Numeric, tm.TestCase):
         with tm.assertRaisesRegexp(TypeError, 'casting'):
             Int64Index(arr_with_floats)
 
+    def test_get_loc_bin_search(self):
+        with cf.option_context('compute.bin_search_lookups', 4):
+            index = Int64Index(np.arange(0, 20, 2))
+            self.assertEqual(index.get_loc(4), 2)
+            self.assertIn(18, index)
+            self.assertRaises(KeyError, index.get_loc, 5)
+            self.assertNotIn(20, index)
+            self.assertIsNone(index._engine.mapping)
+
+            # the hash table is built once the lookups add up
+            self.assertEqual(index.get_loc(0), 0)
+            self.assertIsNotNone(index._engine.mapping)
+            self.assertRaises(KeyError, index.get_loc, 20)
+
+            # duplicates
+            index = Int64Index([1, 2, 2, 3])
+            self.assertEqual(index.get_loc(2), slice(1, 3))
+            self.assertIsNone(index._engine.mapping)
+
+            # unsorted, non integer keys use the hash table
+            index = Int64Index([3, 1, 2])
+            self.assertEqual(index.get_loc(1), 1)
+            self.assertIsNotNone(index._engine.mapping)
+            index = Int64Index([1, 2, 3])
+            self.assertRaises(KeyError, index.get_loc, 1.5)
+
+            index = date_range('20130101', periods=5)
+            self.assertEqual(index.get_loc(Timestamp('20130103')), 2)
+            self.assertEqual(index.get_loc(datetime(2013, 1, 4)), 3)
+            self.assertRaises(KeyError, index.get_loc,
+                              Timestamp('20130110'))
+            self.assertIsNone(index._engine.mapping)
+
+        with cf.option_context('compute.bin_search_lookups', 0):
+            index = Int64Index(np.arange(0, 20, 2))
+            self.assertEqual(index.get_loc(4), 2)
+            self.assertIsNotNone(index._engine.mapping)
+
     def test_hash_error(self):
         with tm.assertRaisesRegexp(TypeError,
                                    "unhashable type: %r" %
@@ -405,6 +405,27 @@ class TestBlockManager(tm.TestCase):
         for blk in self.mgr.blocks:
             yield self.assertIs, self.mgr.items, blk.ref_items
 
+    def test_insert_many(self):
+        # inserting item by item keeps the block count logarithmic without
+        # consolidating everything every 100 inserts
+        df = DataFrame(index=lrange(5))
+        for i in range(1000):
+            df[i] = np.arange(5) + i
+            if i % 3 == 0:
+                df['s%d' % i] = 'x%d' % i
+
+        self.assertTrue(len(df._data.blocks) < 50)
+        for blk in df._data.blocks:
+            self.assertEqual(len(set(blk.mgr_locs.as_array)), len(blk))
+
+        self.assertEqual(df[999].tolist(), lrange(999, 1004))
+        self.assertEqual(df['s999'].tolist(), ['x999'] * 5)
+        self.assertEqual(df.columns[:4].tolist(), [0, 's0', 1, 2])
+
+        df._consolidate_inplace()
+        self.assertEqual(len(df._data.blocks), 2)
+        self.assertEqual(df[500].tolist(), lrange(500, 505))
+
     def test_set_change_dtype(self):
         self.mgr.set('baz', np.zeros(N, dtype=bool))
 
@@ -433,6 +454,56 @@ class TestBlockManager(tm.TestCase):
                     break
             self.assertTrue(found)
 
+    def test_copy_on_write(self):
+        df = DataFrame({'a': [1., 2., 3.], 'b': [4., 5., np.nan],
+                        'c': ['x', 'y', 'z']})
+        expected = df.copy()
+
+        def shares(left, right, col):
+            return np.may_share_memory(left[col].values, right[col].values)
+
+        with pd.option_context('mode.copy_on_write', True):
+            cp = df.copy()
+            for col in df.columns:
+                self.assertTrue(shares(df, cp, col))
+
+            cp.loc[0, 'a'] = 10.
+            self.assertFalse(shares(df, cp, 'a'))
+            self.assertTrue(shares(df, cp, 'c'))
+            self.assertEqual(cp.loc[0, 'a'], 10.)
+            assert_frame_equal(df, expected)
+
+            cp = df.copy()
+            cp.fillna(0, inplace=True)
+            self.assertEqual(cp.loc[2, 'b'], 0.)
+            assert_frame_equal(df, expected)
+
+            cp = df.copy()
+            cp.set_value(1, 'c', 'w')
+            self.assertEqual(cp.loc[1, 'c'], 'w')
+            assert_frame_equal(df, expected)
+
+            cp = df.copy()
+            cp['a'] = 0.
+            assert_frame_equal(df, expected)
+
+            # writes to the original don't show up in the copy either
+            cp = df.copy()
+            df.loc[1, 'b'] = -1.
+            assert_frame_equal(cp, expected)
+            df.loc[1, 'b'] = 5.
+
+            s = df['a'].copy()
+            self.assertTrue(np.may_share_memory(s.values, df['a'].values))
+            s[0] = 100.
+            s.set_value(1, 200.)
+            self.assertEqual(s.tolist(), [100., 200., 3.])
+            assert_frame_equal(df, expected)
+
+        # the default copies eagerly
+        cp = df.copy()
+        self.assertFalse(shares(df, cp, 'a'))
+
     def test_sparse(self):
         mgr = create_mgr('a: sparse-1; b: sparse-2')
 
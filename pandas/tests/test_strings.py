@@ -18,6 +18,7 @@ import pandas.compat as compat
 from pandas import (Index, Series, TimeSeries, DataFrame, isnull, notnull,
                     bdate_range, date_range, MultiIndex)
 import pandas.core.common as com
+import pandas.lib as lib
 
 from pandas.util.testing import assert_series_equal, assert_almost_equal
 import pandas.util.testing as tm
@@ -1193,6 +1194,51 @@ class TestStringMethods(tm.TestCase):
 
         tm.assert_series_equal(result, exp)
 
+    def test_str_map_mask(self):
+        # the vectorized kernels give the same results as mapping the
+        # equivalent functions
+        values = np.array(['a_b ', ' B', NA, '', 'foo_Bar', None, 'ab '],
+                          dtype=object)
+        uvalues = np.array([u('a_b '), u(' B'), NA, u(''), u('foo_\xe4'),
+                            None, u('ab ')], dtype=object)
+        cases = [('len', None, len),
+                 ('lower', None, lambda x: x.lower()),
+                 ('upper', None, lambda x: x.upper()),
+                 ('title', None, lambda x: x.title()),
+                 ('strip', None, lambda x: x.strip()),
+                 ('lstrip', '_ a', lambda x: x.lstrip('_ a')),
+                 ('rstrip', None, lambda x: x.rstrip()),
+                 ('startswith', 'a', lambda x: x.startswith('a')),
+                 ('startswith', ('a', 'f'),
+                  lambda x: x.startswith(('a', 'f'))),
+                 ('endswith', ' ', lambda x: x.endswith(' ')),
+                 ('contains', '_', lambda x: '_' in x),
+                 ('slice', slice(1, None, 2), lambda x: x[1::2])]
+
+        for arr in [values, uvalues]:
+            mask = isnull(arr).view(np.uint8)
+            for how, arg, f in cases:
+                result = lib.str_map_mask(arr, mask, how, arg)
+                expected = lib.map_infer_mask(arr, f, mask)
+                self.assertEqual(result.dtype, expected.dtype)
+                self.assert_numpy_array_equivalent(result, expected,
+                                                   strict_nan=True)
+
+        # not only strings
+        mixed = np.array(['a', 1, NA], dtype=object)
+        self.assertIsNone(lib.str_map_mask(mixed, isnull(mixed).view(np.uint8),
+                                           'len'))
+
+        # through the accessor, with the fallback for the other values
+        mixed = Series(['aB', NA, 'b', [1, 2], 3., u('c\xe4')])
+        tm.assert_series_equal(mixed.str.len(),
+                               Series([2, NA, 1, 2, NA, 2]))
+        tm.assert_series_equal(mixed.str.lower(),
+                               Series(['ab', NA, 'b', NA, NA, u('c\xe4')]))
+        tm.assert_series_equal(mixed.str.startswith('a', na=False),
+                               Series([True, False, False, False, False,
+                                       False]))
+
     def test_cat_on_filtered_index(self):
         df = DataFrame(index=MultiIndex.from_product([[2011, 2012], [1,2,3]],
                                                      names=['year', 'month']))
@@ -453,6 +453,12 @@ def _get_join_indexers(left_keys, right_keys, sort=False, how='inner'):
     if len(left_keys) != len(right_keys):
         raise AssertionError('left_key and right_keys must be the same length')
 
+    if len(left_keys) == 1:
+        indexers = _sort_merge_indexers(left_keys[0], right_keys[0],
+                                        sort=sort, how=how)
+        if indexers is not None:
+            return indexers
+
     left_labels = []
     right_labels = []
     group_sizes = []
@@ -557,6 +563,11 @@ def _get_multiindex_indexer(join_keys, index, sort=False):
 
 
 def _get_single_indexer(join_key, index, sort=False):
+    indexers = _sort_merge_indexers(join_key, index.values, sort=sort,
+                                    how='left')
+    if indexers is not None:
+        return indexers
+
     left_key, right_key, count = _factorize_keys(join_key, index, sort=sort)
 
     left_indexer, right_indexer = \
@@ -605,6 +616,45 @@ _join_functions = {
 }
 
 
+def _sort_merge_indexers(lk, rk, sort=False, how='inner'):
+    """
+    Join indexers of a single pair of keys computed by a linear merge of
+    their values, when both are monotonic int64/datetime64 or float64 arrays
+    (without NaN), which avoids factorizing them. Returns None otherwise, or
+    when the result of the hash join would not be in key order (right and
+    outer joins without sort).
+    """
+    if how in ('right', 'outer') and not sort:
+        return None
+    if not (isinstance(lk, np.ndarray) and isinstance(rk, np.ndarray)):
+        return None
+
+    if com._is_int_or_datetime_dtype(lk) and com._is_int_or_datetime_dtype(rk):
+        lk = com._ensure_int64(lk)
+        rk = com._ensure_int64(rk)
+        is_monotonic = algos.is_monotonic_int64
+    elif com.is_float_dtype(lk) and com.is_float_dtype(rk):
+        lk = com._ensure_float64(lk)
+        rk = com._ensure_float64(rk)
+        if np.isnan(lk).any() or np.isnan(rk).any():
+            return None
+        is_monotonic = algos.is_monotonic_float64
+    else:
+        return None
+
+    if not (is_monotonic(lk)[0] and is_monotonic(rk)[0]):
+        return None
+
+    if how == 'right':
+        right_indexer, left_indexer = algos.sort_merge_join(rk, lk,
+                                                            how='left')
+    else:
+        left_indexer, right_indexer = algos.sort_merge_join(lk, rk, how=how)
+
+    return (com._ensure_platform_int(left_indexer),
+            com._ensure_platform_int(right_indexer))
+
+
 def _factorize_keys(lk, rk, sort=True):
     if com._is_int_or_datetime_dtype(lk) and com._is_int_or_datetime_dtype(rk):
         klass = _hash.Int64Factorizer
@@ -144,6 +144,73 @@ class TestMerge(tm.TestCase):
         self.assert_numpy_array_equal(ls, exp_ls)
         self.assert_numpy_array_equal(rs, exp_rs)
 
+    def test_cython_sort_merge_join(self):
+        left = a_([0, 1, 1, 2, 4, 4], dtype=np.int64)
+        right = a_([1, 1, 2, 3, 4], dtype=np.int64)
+
+        ls, rs = algos.sort_merge_join(left, right, how='inner')
+        self.assert_numpy_array_equal(ls, a_([1, 1, 2, 2, 3, 4, 5]))
+        self.assert_numpy_array_equal(rs, a_([0, 1, 0, 1, 2, 4, 4]))
+
+        ls, rs = algos.sort_merge_join(left, right, how='left')
+        self.assert_numpy_array_equal(ls, a_([0, 1, 1, 2, 2, 3, 4, 5]))
+        self.assert_numpy_array_equal(rs, a_([-1, 0, 1, 0, 1, 2, 4, 4]))
+
+        ls, rs = algos.sort_merge_join(left.astype(np.float64),
+                                       right.astype(np.float64), how='outer')
+        self.assert_numpy_array_equal(ls, a_([0, 1, 1, 2, 2, 3, -1, 4, 5]))
+        self.assert_numpy_array_equal(rs, a_([-1, 0, 1, 0, 1, 2, 3, 4, 4]))
+
+    def test_merge_sorted_keys(self):
+        # sorted int, float and datetime keys take the sort-merge path,
+        # which gives the same result as the hash join
+        left = DataFrame({'key': [0, 1, 1, 2, 4, 4, 6],
+                          'v1': np.arange(7)})
+        right = DataFrame({'key': [1, 1, 2, 3, 4, 7],
+                           'v2': np.arange(6)})
+
+        dates = date_range('20130101', periods=8).values
+        for f in [lambda x: x, lambda x: x.astype(float),
+                  lambda x: dates.take(x.values)]:
+            sleft = left.copy()
+            sleft['key'] = f(left['key'])
+            sright = right.copy()
+            sright['key'] = f(right['key'])
+
+            oleft = sleft.copy()
+            oleft['key'] = oleft['key'].astype(object)
+            oright = sright.copy()
+            oright['key'] = oright['key'].astype(object)
+
+            for how, sort in [('inner', False), ('inner', True),
+                              ('left', False), ('left', True),
+                              ('right', True), ('outer', True)]:
+                result = merge(sleft, sright, on='key', how=how, sort=sort)
+                expected = merge(oleft, oright, on='key', how=how,
+                                 sort=sort)
+
+                # the int key column is upcast by the rows missing on
+                # the left before the right keys are filled in
+                dtype = sleft['key'].dtype
+                if how in ('right', 'outer') and dtype == np.int64:
+                    dtype = np.float64
+                expected['key'] = expected['key'].astype(dtype)
+                assert_frame_equal(result, expected)
+
+            # join on the index of the right frame
+            result = sleft.join(sright.set_index('key'), on='key')
+            expected = oleft.join(oright.set_index('key'), on='key')
+            expected['key'] = expected['key'].astype(sleft['key'].dtype)
+            assert_frame_equal(result, expected)
+
+        # NaN keys use the hash join
+        left = DataFrame({'key': [0., 1., nan], 'v1': [1, 2, 3]})
+        right = DataFrame({'key': [1., nan], 'v2': [4, 5]})
+        result = merge(left, right, on='key')
+        expected = DataFrame({'key': [1., nan], 'v1': [2, 3], 'v2': [4, 5]},
+                             columns=['key', 'v1', 'v2'])
+        assert_frame_equal(result, expected)
+
     def test_left_outer_join(self):
         joined_key2 = merge(self.df, self.df2, on='key2')
         _check_join(self.df, self.df2, joined_key2, ['key2'], how='left')